@@ -4,14 +4,18 @@ Custom User model for HamroKotha platform.
 
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models import Count, Q
 from django.core.validators import RegexValidator
-from apps.core.choices import UserType, District
+from apps.core.choices import UserType, District, PropertyStatus
+from apps.core.models import NormalizedPhoneMixin
+from apps.core.memo import user_fact
 
 
-class User(AbstractUser):
+class User(NormalizedPhoneMixin, AbstractUser):
     """
     Custom User model with additional fields for rental platform.
     """
+    PHONE_FIELD = 'phone_number'
     
     # Phone number validator for Nepal
     phone_regex = RegexValidator(
@@ -102,27 +106,37 @@ class User(AbstractUser):
         """Check if user is an admin."""
         return self.user_type == UserType.ADMIN or self.is_staff
     
+    def listing_counts(self):
+        """``(total, approved)`` listing counts, one query per request."""
+        if not self.is_landlord:
+            return 0, 0
+        return user_fact(self.pk, 'listing_counts', self._count_listings, cached=True)
+    
+    def _count_listings(self):
+        counts = self.properties.aggregate(
+            total=Count('pk'), approved=Count('pk', filter=Q(status=PropertyStatus.APPROVED))
+        )
+        return counts['total'], counts['approved']
+    
     @property
     def properties_count(self):
         """Get count of user's properties (for landlords)."""
-        if self.is_landlord:
-            return self.properties.count()
-        return 0
+        return self.listing_counts()[0]
     
     @property
     def active_properties_count(self):
         """Get count of approved properties."""
-        if self.is_landlord:
-            from apps.core.choices import PropertyStatus
-            return self.properties.filter(status=PropertyStatus.APPROVED).count()
-        return 0
+        return self.listing_counts()[1]
     
     @property
     def inquiries_count(self):
         """Get count of inquiries made or received."""
         if self.is_tenant:
-            return self.sent_inquiries.count()
+            return user_fact(self.pk, 'inquiries_count', self.sent_inquiries.count, cached=True)
         elif self.is_landlord:
             from apps.inquiries.models import Inquiry
-            return Inquiry.objects.filter(rental_property__owner=self).count()
+            return user_fact(
+                self.pk, 'inquiries_count',
+                Inquiry.objects.filter(rental_property__owner=self).count, cached=True,
+            )
         return 0
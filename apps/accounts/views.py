@@ -18,6 +18,7 @@ from .forms import (
     CustomLoginForm, CustomPasswordResetForm, UserProfileForm
 )
 from apps.core.choices import PropertyStatus
+from apps.core.models import SiteConfiguration
 
 
 class RegisterView(TemplateView):
@@ -35,6 +36,9 @@ class LandlordRegisterView(SuccessMessageMixin, CreateView):
     def dispatch(self, request, *args, **kwargs):
         if request.user.is_authenticated:
             return redirect('accounts:dashboard')
+        if not SiteConfiguration.get_config().registration_open:
+            messages.info(request, "Registration is currently closed.")
+            return redirect('core:home')
         return super().dispatch(request, *args, **kwargs)
 
 
@@ -48,6 +52,9 @@ class TenantRegisterView(SuccessMessageMixin, CreateView):
     def dispatch(self, request, *args, **kwargs):
         if request.user.is_authenticated:
             return redirect('accounts:dashboard')
+        if not SiteConfiguration.get_config().registration_open:
+            messages.info(request, "Registration is currently closed.")
+            return redirect('core:home')
         return super().dispatch(request, *args, **kwargs)
 
 
@@ -164,33 +171,34 @@ class DashboardView(LoginRequiredMixin, TemplateView):
         # Admin/Staff dashboard - show all properties pending review
         if user.is_staff or user.is_superuser:
             from apps.properties.models import Property
-            from apps.inquiries.models import Inquiry
-            from apps.accounts.models import User
+            from apps.admin_panel.snapshot import DashboardSnapshot
+            
+            snapshot = DashboardSnapshot.get()
             
             # All pending properties for review
             context['pending_properties'] = Property.objects.filter(
                 status=PropertyStatus.PENDING
             ).select_related('owner').order_by('-created_at')
-            context['pending_count'] = context['pending_properties'].count()
+            context['pending_count'] = snapshot['pending_properties']
             
             # All approved properties
             context['approved_properties'] = Property.objects.filter(
                 status=PropertyStatus.APPROVED
             ).select_related('owner').order_by('-created_at')[:5]
-            context['approved_count'] = Property.objects.filter(status=PropertyStatus.APPROVED).count()
+            context['approved_count'] = snapshot['approved_properties']
             
             # Recent properties
-            context['recent_properties'] = Property.objects.select_related('owner').order_by('-created_at')[:5]
-            context['total_properties'] = Property.objects.count()
+            context['recent_properties'] = snapshot['recent_properties']
+            context['total_properties'] = snapshot['total_properties']
             
             # User stats
-            context['total_users'] = User.objects.count()
-            context['total_landlords'] = User.objects.filter(user_type='LANDLORD').count()
-            context['total_tenants'] = User.objects.filter(user_type='TENANT').count()
+            context['total_users'] = snapshot['total_users']
+            context['total_landlords'] = snapshot['total_landlords']
+            context['total_tenants'] = snapshot['total_tenants']
             
             # Inquiry stats
-            context['total_inquiries'] = Inquiry.objects.count()
-            context['pending_inquiries'] = Inquiry.objects.filter(status='PENDING').count()
+            context['total_inquiries'] = snapshot['total_inquiries']
+            context['pending_inquiries'] = snapshot['pending_inquiries']
         
         elif user.is_landlord:
             from apps.properties.models import Property
@@ -217,7 +225,8 @@ class DashboardView(LoginRequiredMixin, TemplateView):
             context['total_views'] = sum(p.views_count for p in properties)
         
         elif user.is_tenant:
-            from apps.properties.models import Property, Favorite
+            from apps.properties.models import Favorite
+            from apps.properties.recommendations import recommend_for
             from apps.inquiries.models import Inquiry
             
             # Favorite properties
@@ -232,9 +241,7 @@ class DashboardView(LoginRequiredMixin, TemplateView):
             ).select_related('rental_property').order_by('-created_at')[:5]
             context['total_inquiries'] = Inquiry.objects.filter(sender=user).count()
             
-            # Recommended properties
-            context['recommended_properties'] = Property.objects.filter(
-                status=PropertyStatus.APPROVED
-            ).order_by('-created_at')[:6]
+            # Recommended properties (neighbour lists from rebuild_recommendations)
+            context['recommended_properties'] = recommend_for(user, limit=6)
         
         return context
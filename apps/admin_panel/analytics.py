@@ -0,0 +1,191 @@
+"""
+Aggregations behind the admin analytics page.
+
+Each figure is produced by a single grouped query instead of one COUNT per
+month, price bucket or district. ``get_analytics`` bundles them and caches
+the result for ``ANALYTICS_CACHE_TTL`` seconds.
+"""
+
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Avg, Case, CharField, Count, Q, Sum, Value, When
+from django.utils import timezone
+
+from apps.accounts.models import User
+from apps.properties.models import Property, MarketRollup
+from apps.inquiries.models import Inquiry
+from apps.core.choices import District, PropertyType
+
+
+ANALYTICS_CACHE_KEY = 'admin_panel:analytics'
+
+PRICE_RANGES = [
+    {'label': 'Under Rs. 10,000', 'min': 0, 'max': 10000},
+    {'label': 'Rs. 10,000 - 20,000', 'min': 10000, 'max': 20000},
+    {'label': 'Rs. 20,000 - 35,000', 'min': 20000, 'max': 35000},
+    {'label': 'Rs. 35,000 - 50,000', 'min': 35000, 'max': 50000},
+    {'label': 'Over Rs. 50,000', 'min': 50000, 'max': 999999999},
+]
+
+
+def month_windows(today, months=6):
+    """
+    Return the ``(start, end)`` date windows of the monthly charts, oldest
+    first, with ``end`` exclusive.
+
+    Windows reproduce the original per-month loop: each is stepped back in
+    30-day increments from ``today`` and runs from the first of that month
+    to the first of the month 32 days later, so near month ends a window
+    can span two calendar months and neighbouring windows can overlap. The
+    last window ends after ``today``.
+    """
+    windows = []
+    for i in range(months - 1, -1, -1):
+        month_date = today - timedelta(days=i * 30)
+        if i > 0:
+            end = (month_date + timedelta(days=32)).replace(day=1)
+        else:
+            end = today + timedelta(days=1)
+        windows.append((month_date.replace(day=1), end))
+    return windows
+
+
+def monthly_counts(queryset, date_field, windows):
+    """
+    Count rows of ``queryset`` in each of ``windows`` with one query of
+    conditional aggregates. Returns a list aligned with ``windows``.
+    """
+    counts = queryset.aggregate(**{
+        f'window_{i}': Count('pk', filter=Q(**{
+            f'{date_field}__date__gte': start,
+            f'{date_field}__date__lt': end,
+        }))
+        for i, (start, end) in enumerate(windows)
+    })
+    return [counts[f'window_{i}'] for i in range(len(windows))]
+
+
+def price_distribution(queryset):
+    """Bucket ``queryset`` by ``price_per_month`` in a single query."""
+    bucket = Case(
+        *[
+            When(
+                price_per_month__gte=pr['min'],
+                price_per_month__lt=pr['max'],
+                then=Value(pr['label']),
+            )
+            for pr in PRICE_RANGES
+        ],
+        default=Value(''),
+        output_field=CharField(),
+    )
+    rows = queryset.annotate(bucket=bucket).values('bucket').annotate(count=Count('pk')).order_by()
+    counts = {row['bucket']: row['count'] for row in rows}
+    total = sum(counts.values()) or 1
+
+    return [
+        {
+            'label': pr['label'],
+            'count': counts.get(pr['label'], 0),
+            'percentage': round(counts.get(pr['label'], 0) / total * 100, 1),
+        }
+        for pr in PRICE_RANGES
+    ]
+
+
+def district_stats():
+    """Approved listing count, average rent and inquiries per district."""
+    approved = Q(status='APPROVED')
+    properties = {
+        row['district']: row
+        for row in Property.objects.values('district').annotate(
+            count=Count('pk', filter=approved),
+            avg_price=Avg('price_per_month', filter=approved),
+        ).order_by()
+    }
+    inquiries = {
+        row['rental_property__district']: row['count']
+        for row in Inquiry.objects.values('rental_property__district').annotate(
+            count=Count('pk')
+        ).order_by()
+    }
+
+    stats = []
+    for code, name in District.choices:
+        row = properties.get(code, {})
+        stats.append({
+            'name': name,
+            'count': row.get('count', 0),
+            'avg_price': row.get('avg_price') or 0,
+            'inquiries': inquiries.get(code, 0),
+        })
+    return stats
+
+
+def compute_analytics():
+    """Build the analytics page context straight from the database."""
+    today = timezone.now().date()
+    data = {}
+
+    approved = Property.objects.filter(status='APPROVED')
+    totals = approved.aggregate(total=Sum('price_per_month'), avg=Avg('price_per_month'))
+    data['total_rent_value'] = totals['total'] or 0
+    data['avg_price'] = totals['avg'] or 0
+
+    # Conversion rate (inquiries with viewing requests / total inquiries)
+    inquiries = Inquiry.objects.aggregate(
+        total=Count('pk'),
+        viewing=Count('pk', filter=Q(preferred_visit_date__isnull=False)),
+    )
+    data['conversion_rate'] = (
+        inquiries['viewing'] / inquiries['total'] * 100 if inquiries['total'] > 0 else 0
+    )
+
+    # Average response time (mock for now)
+    data['avg_response_time'] = 4
+
+    # Monthly labels and data for charts
+    windows = month_windows(today)
+    data['monthly_labels'] = json.dumps([start.strftime('%b') for start, _ in windows])
+    data['monthly_properties'] = json.dumps(
+        monthly_counts(Property.objects.all(), 'created_at', windows)
+    )
+    data['monthly_users'] = json.dumps(
+        monthly_counts(User.objects.all(), 'date_joined', windows)
+    )
+
+    # Property type distribution
+    property_types = Property.objects.values('property_type').annotate(
+        count=Count('id')
+    ).order_by('-count')
+    property_type_dict = dict(PropertyType.choices)
+    data['property_type_labels'] = json.dumps(
+        [property_type_dict.get(pt['property_type'], pt['property_type']) for pt in property_types]
+    )
+    data['property_type_data'] = json.dumps([pt['count'] for pt in property_types])
+
+    data['price_distribution'] = price_distribution(approved)
+
+    # Top properties by views
+    data['top_properties'] = list(
+        approved.annotate(inquiry_count=Count('inquiries')).order_by('-views_count')[:10]
+    )
+
+    data['district_stats'] = district_stats()
+
+    # Rent percentiles from the market rollup cube
+    data['market_by_district'] = list(MarketRollup.objects.breakdown('district'))
+
+    return data
+
+
+def get_analytics():
+    """Return the cached analytics context, computing it on a miss."""
+    data = cache.get(ANALYTICS_CACHE_KEY)
+    if data is None:
+        data = compute_analytics()
+        cache.set(ANALYTICS_CACHE_KEY, data, getattr(settings, 'ANALYTICS_CACHE_TTL', 600))
+    return data
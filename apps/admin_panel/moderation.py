@@ -0,0 +1,121 @@
+"""
+Bulk moderation of property listings.
+
+A selection (or a whole filtered result set) is updated with one UPDATE per
+batch of ids, every affected listing gets an ``AdminActionLog`` row via
+``bulk_create``, and owner notifications are sent once the transaction
+commits, grouped so each owner receives a single email. ``update`` sends no
+``post_save``, so owners' remembered listing counts are dropped here.
+"""
+
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.core.choices import AdminActionType, PropertyStatus
+from apps.core.memo import forget_user
+from apps.core.models import AdminActionLog
+from apps.core.utils import send_email_notification
+from apps.properties.models import Property
+from apps.properties.market import mark_queryset_stale
+from apps.services.matching import match_properties, unmatch_properties
+from .snapshot import DashboardSnapshot
+
+
+BATCH_SIZE = 1000
+
+BULK_ACTIONS = {
+    'approve': AdminActionType.PROPERTY_APPROVED,
+    'reject': AdminActionType.PROPERTY_REJECTED,
+    'feature': AdminActionType.PROPERTY_FEATURED,
+    'unfeature': AdminActionType.PROPERTY_UNFEATURED,
+}
+
+# Actions whose outcome the owner is told about.
+NOTIFY_ACTIONS = {'approve', 'reject', 'feature'}
+
+
+def get_updates(action, reason=''):
+    """Field values written by ``action``."""
+    if action == 'approve':
+        return {'status': PropertyStatus.APPROVED, 'rejection_reason': '', 'approved_at': timezone.now()}
+    if action == 'reject':
+        return {'status': PropertyStatus.REJECTED, 'rejection_reason': reason}
+    if action == 'feature':
+        return {'is_featured': True}
+    if action == 'unfeature':
+        return {'is_featured': False}
+    raise ValueError(f"Unknown moderation action: {action}")
+
+
+def notify_owners(property_ids, action, reason=''):
+    """Email each affected owner once, listing all of their properties."""
+    by_owner = defaultdict(list)
+    rows = Property.objects.filter(pk__in=property_ids).values_list(
+        'owner__email', 'owner__first_name', 'title'
+    )
+    for email, first_name, title in rows.iterator(chunk_size=BATCH_SIZE):
+        if email:
+            by_owner[(email, first_name)].append(title)
+
+    site_name = getattr(settings, 'SITE_NAME', 'HamroKotha')
+    for (email, first_name), titles in by_owner.items():
+        send_email_notification(
+            subject=f"{site_name}: update on your listings",
+            template_name='admin_panel/email/moderation_update.html',
+            context={
+                'name': first_name,
+                'action': action,
+                'reason': reason,
+                'titles': titles,
+                'SITE_NAME': site_name,
+            },
+            recipient_list=[email],
+        )
+
+
+def bulk_moderate(queryset, action, admin, reason=''):
+    """
+    Apply ``action`` to every property in ``queryset``.
+    Returns the number of properties updated.
+    """
+    action_type = BULK_ACTIONS[action]
+    updates = get_updates(action, reason)
+
+    with transaction.atomic():
+        rows = list(queryset.order_by().values_list('pk', 'owner_id'))
+        property_ids = [pk for pk, _ in rows]
+        for start in range(0, len(property_ids), BATCH_SIZE):
+            batch = Property.objects.filter(pk__in=property_ids[start:start + BATCH_SIZE])
+            batch.update(updated_at=timezone.now(), **updates)
+            if 'status' in updates:
+                mark_queryset_stale(batch)
+
+        AdminActionLog.objects.bulk_create(
+            [
+                AdminActionLog(
+                    admin=admin,
+                    action_type=action_type,
+                    content_type='property',
+                    object_id=str(pk),
+                    description=reason,
+                )
+                for pk in property_ids
+            ],
+            batch_size=500,
+        )
+
+        transaction.on_commit(DashboardSnapshot.invalidate)
+        if 'status' in updates:
+            owner_ids = {owner_id for _, owner_id in rows}
+            transaction.on_commit(lambda: forget_user(*owner_ids))
+        if action == 'approve':
+            transaction.on_commit(lambda: match_properties(property_ids))
+        elif action == 'reject':
+            unmatch_properties(property_ids)
+        if action in NOTIFY_ACTIONS and property_ids:
+            transaction.on_commit(lambda: notify_owners(property_ids, action, reason))
+
+    return len(property_ids)
@@ -0,0 +1,38 @@
+"""
+Signal handlers that keep the admin dashboard snapshot fresh.
+"""
+
+from django.db.models.signals import post_save, post_delete
+
+from apps.accounts.models import User
+from apps.properties.models import Property
+from apps.inquiries.models import Inquiry
+from apps.services.models import FindRoomRequest, ShiftHomeRequest
+from .snapshot import DashboardSnapshot
+
+
+# Fields whose changes show up on the dashboard. Saves restricted to other
+# fields (view counters, last_login, ...) leave the snapshot alone.
+SNAPSHOT_FIELDS = {
+    User: {'user_type', 'is_active', 'date_joined', 'first_name', 'last_name', 'email'},
+    Property: {'status', 'is_featured', 'district', 'title', 'owner'},
+    Inquiry: {'status', 'rental_property', 'name'},
+    FindRoomRequest: {'status'},
+    ShiftHomeRequest: {'status'},
+}
+
+
+def invalidate_on_save(sender, instance, created=False, update_fields=None, **kwargs):
+    """Drop the snapshot unless the save only touched untracked fields."""
+    if update_fields and not created and not (set(update_fields) & SNAPSHOT_FIELDS[sender]):
+        return
+    DashboardSnapshot.invalidate()
+
+
+def invalidate_on_delete(sender, instance, **kwargs):
+    DashboardSnapshot.invalidate()
+
+
+for model in SNAPSHOT_FIELDS:
+    post_save.connect(invalidate_on_save, sender=model, dispatch_uid=f'snapshot_save_{model.__name__}')
+    post_delete.connect(invalidate_on_delete, sender=model, dispatch_uid=f'snapshot_delete_{model.__name__}')
@@ -0,0 +1,127 @@
+"""
+Precomputed dashboard statistics for the admin panel.
+
+Every counter shown on the admin dashboards is computed with one grouped
+query per model and kept in the cache for a short time. The snapshot is
+dropped by model signals (see ``apps.admin_panel.signals``) and can be
+rebuilt ahead of time with ``manage.py refresh_dashboard_snapshot``.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from apps.accounts.models import User
+from apps.properties.models import Property
+from apps.inquiries.models import Inquiry
+from apps.services.models import FindRoomRequest, ShiftHomeRequest
+
+
+class DashboardSnapshot:
+    """
+    Cached bundle of admin dashboard counters and recent-activity lists.
+    """
+    CACHE_KEY = 'admin_panel:dashboard_snapshot'
+
+    def __init__(self, data, computed_at=None):
+        self.data = data
+        self.computed_at = computed_at or timezone.now()
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def as_context(self):
+        """Return the snapshot as a template context dict."""
+        return dict(self.data, snapshot_computed_at=self.computed_at)
+
+    @classmethod
+    def get_timeout(cls):
+        return getattr(settings, 'DASHBOARD_SNAPSHOT_TTL', 300)
+
+    @classmethod
+    def compute(cls):
+        """Build a fresh snapshot straight from the database."""
+        today = timezone.now().date()
+        last_30_days = today - timedelta(days=30)
+        last_7_days = today - timedelta(days=7)
+        six_months_ago = today - timedelta(days=180)
+
+        users = User.objects.aggregate(
+            total_users=Count('id'),
+            total_landlords=Count('id', filter=Q(user_type='LANDLORD')),
+            total_tenants=Count('id', filter=Q(user_type='TENANT')),
+            active_users=Count('id', filter=Q(is_active=True)),
+            new_users_30d=Count('id', filter=Q(date_joined__date__gte=last_30_days)),
+            new_users_7d=Count('id', filter=Q(date_joined__date__gte=last_7_days)),
+        )
+        properties = Property.objects.aggregate(
+            total_properties=Count('id'),
+            pending_properties=Count('id', filter=Q(status='PENDING')),
+            approved_properties=Count('id', filter=Q(status='APPROVED')),
+            rented_properties=Count('id', filter=Q(status='RENTED')),
+            featured_properties=Count('id', filter=Q(is_featured=True)),
+        )
+        inquiries = Inquiry.objects.aggregate(
+            total_inquiries=Count('id'),
+            pending_inquiries=Count('id', filter=Q(status='PENDING')),
+            inquiries_7d=Count('id', filter=Q(created_at__date__gte=last_7_days)),
+        )
+        find_room = FindRoomRequest.objects.aggregate(
+            find_room_requests=Count('id'),
+            pending_find_room=Count('id', filter=Q(status='PENDING')),
+        )
+        shift_home = ShiftHomeRequest.objects.aggregate(
+            shift_home_requests=Count('id'),
+            pending_shift_home=Count('id', filter=Q(status='PENDING')),
+        )
+
+        data = {**users, **properties, **inquiries, **find_room, **shift_home}
+
+        # Recent Activity
+        data['recent_properties'] = list(
+            Property.objects.select_related('owner').order_by('-created_at')[:5]
+        )
+        data['recent_inquiries'] = list(
+            Inquiry.objects.select_related('rental_property', 'sender').order_by('-created_at')[:5]
+        )
+        data['recent_users'] = list(User.objects.order_by('-date_joined')[:5])
+
+        # Properties by District
+        data['properties_by_district'] = list(
+            Property.objects.values('district').annotate(count=Count('id')).order_by('-count')
+        )
+
+        # Monthly Property Trend (last 6 months)
+        data['monthly_properties'] = list(
+            Property.objects.filter(
+                created_at__date__gte=six_months_ago
+            ).annotate(
+                month=TruncMonth('created_at')
+            ).values('month').annotate(count=Count('id')).order_by('month')
+        )
+
+        return cls(data)
+
+    @classmethod
+    def get(cls):
+        """Return the cached snapshot, computing it on a miss."""
+        snapshot = cache.get(cls.CACHE_KEY)
+        if snapshot is None:
+            snapshot = cls.refresh()
+        return snapshot
+
+    @classmethod
+    def refresh(cls):
+        """Recompute the snapshot and store it in the cache."""
+        snapshot = cls.compute()
+        cache.set(cls.CACHE_KEY, snapshot, cls.get_timeout())
+        return snapshot
+
+    @classmethod
+    def invalidate(cls):
+        """Drop the cached snapshot so the next read recomputes it."""
+        cache.delete(cls.CACHE_KEY)
@@ -0,0 +1,107 @@
+import json
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest import mock
+
+from django.core.cache import cache
+from django.db.models import Avg
+from django.test import TestCase
+from django.utils import timezone
+from apps.accounts.models import User
+from apps.properties.models import Property
+from apps.inquiries.models import Inquiry
+from apps.core.choices import District
+from apps.admin_panel.analytics import compute_analytics, PRICE_RANGES
+
+
+def legacy_monthly(today):
+    """Per-month COUNT loop the analytics page used to run."""
+    months, property_counts, user_counts = [], [], []
+    for i in range(5, -1, -1):
+        month_date = today - timedelta(days=i*30)
+        month_start = month_date.replace(day=1)
+        if i > 0:
+            next_month = (month_date + timedelta(days=32)).replace(day=1)
+        else:
+            next_month = today + timedelta(days=1)
+        months.append(month_start.strftime('%b'))
+        property_counts.append(Property.objects.filter(
+            created_at__date__gte=month_start,
+            created_at__date__lt=next_month
+        ).count())
+        user_counts.append(User.objects.filter(
+            date_joined__date__gte=month_start,
+            date_joined__date__lt=next_month
+        ).count())
+    return months, property_counts, user_counts
+
+
+class AnalyticsAggregationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        now = timezone.now()
+        self.landlord = User.objects.create_user(username='landlord1', password='pass', user_type='LANDLORD')
+        self.tenant = User.objects.create_user(username='tenant1', password='pass', user_type='TENANT')
+        prices = [5000, 10000, 19999, 20000, 35000, 49999, 50000, 120000]
+        districts = [District.KATHMANDU, District.LALITPUR, District.BHAKTAPUR]
+        for i, price in enumerate(prices * 2):
+            prop = Property.objects.create(
+                owner=self.landlord,
+                title=f'Room {i}',
+                description='Desc',
+                area='Thamel',
+                address=f'Addr {i}',
+                district=districts[i % 3],
+                price_per_month=price,
+                status='APPROVED' if i % 4 else 'PENDING',
+            )
+            Property.objects.filter(pk=prop.pk).update(created_at=now - timedelta(days=i * 23))
+            Inquiry.objects.create(
+                rental_property=prop,
+                sender=self.tenant,
+                name='Tenant',
+                email='t@example.com',
+                message='Hi',
+                preferred_visit_date=now.date() if i % 3 else None,
+            )
+        for i in range(10):
+            user = User.objects.create_user(username=f'user{i}', password='pass')
+            User.objects.filter(pk=user.pk).update(date_joined=now - timedelta(days=i * 19))
+
+    def test_monthly_counts_match_legacy(self):
+        # Early March: the February window of the old loop runs into April.
+        for frozen in (timezone.now(), datetime(2026, 3, 2, 12, tzinfo=dt_timezone.utc)):
+            with self.subTest(now=frozen), mock.patch('django.utils.timezone.now', return_value=frozen):
+                data = compute_analytics()
+                months, property_counts, user_counts = legacy_monthly(frozen.date())
+                self.assertEqual(json.loads(data['monthly_labels']), months)
+                self.assertEqual(json.loads(data['monthly_properties']), property_counts)
+                self.assertEqual(json.loads(data['monthly_users']), user_counts)
+
+    def test_price_distribution_matches_legacy(self):
+        data = compute_analytics()
+        approved = Property.objects.filter(status='APPROVED')
+        total = approved.count()
+        for bucket, pr in zip(data['price_distribution'], PRICE_RANGES):
+            count = approved.filter(price_per_month__gte=pr['min'], price_per_month__lt=pr['max']).count()
+            self.assertEqual(bucket['count'], count)
+            self.assertEqual(bucket['percentage'], round(count / total * 100, 1))
+
+    def test_district_stats_use_district_values(self):
+        data = compute_analytics()
+        for stats, (code, name) in zip(data['district_stats'], District.choices):
+            props = Property.objects.filter(district=code, status='APPROVED')
+            self.assertEqual(stats['name'], name)
+            self.assertEqual(stats['count'], props.count())
+            self.assertEqual(stats['avg_price'], props.aggregate(avg=Avg('price_per_month'))['avg'] or 0)
+            self.assertEqual(stats['inquiries'], Inquiry.objects.filter(rental_property__district=code).count())
+        self.assertTrue(any(stats['count'] for stats in data['district_stats']))
+
+    def test_conversion_rate(self):
+        data = compute_analytics()
+        total = Inquiry.objects.count()
+        viewing = Inquiry.objects.exclude(preferred_visit_date__isnull=True).count()
+        self.assertEqual(data['conversion_rate'], viewing / total * 100)
+
+    def test_fixed_query_count(self):
+        with self.assertNumQueries(10):
+            compute_analytics()
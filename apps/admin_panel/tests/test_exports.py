@@ -0,0 +1,53 @@
+import csv
+import io
+import json
+
+from django.test import TestCase
+from django.urls import reverse
+from apps.accounts.models import User
+from apps.properties.models import Property, PropertyView
+
+
+class StreamingExportTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username='admin', password='pass', is_staff=True)
+        self.landlord = User.objects.create_user(username='landlord1', password='pass', email='l@example.com')
+        for i, status in enumerate(['PENDING', 'APPROVED', 'APPROVED']):
+            prop = Property.objects.create(
+                owner=self.landlord,
+                title=f'Room {i}',
+                description='Desc',
+                area='Thamel',
+                address=f'Addr {i}',
+                price_per_month=10000,
+                status=status,
+            )
+            PropertyView.objects.create(property=prop, ip_address='127.0.0.1')
+        self.client.force_login(self.admin)
+
+    def read(self, response):
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content).decode()
+
+    def test_property_csv_honours_filters(self):
+        response = self.client.get(reverse('admin_panel:properties'), {'status': 'approved', 'export': 'csv'}, secure=True)
+        rows = list(csv.DictReader(io.StringIO(self.read(response))))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual({row['status'] for row in rows}, {'APPROVED'})
+        self.assertEqual(rows[0]['owner_email'], 'l@example.com')
+
+    def test_user_jsonl(self):
+        response = self.client.get(reverse('admin_panel:users'), {'search': 'l@example', 'export': 'jsonl'}, secure=True)
+        lines = [json.loads(line) for line in self.read(response).splitlines()]
+        self.assertEqual([line['username'] for line in lines], ['landlord1'])
+
+    def test_property_view_log(self):
+        response = self.client.get(reverse('admin_panel:export_property_views'), secure=True)
+        self.assertEqual(len(self.read(response).splitlines()), 4)
+
+    def test_property_view_log_rejects_bad_filters(self):
+        url = reverse('admin_panel:export_property_views')
+        for params in ({'property_id': 'nope'}, {'from': '2026-13-01'}, {'to': 'yesterday'}):
+            self.assertEqual(self.client.get(url, params, secure=True).status_code, 400, params)
+        response = self.client.get(url, {'from': '2000-01-01', 'to': '2999-01-01'}, secure=True)
+        self.assertEqual(len(self.read(response).splitlines()), 4)
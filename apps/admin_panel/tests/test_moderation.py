@@ -0,0 +1,73 @@
+from django.core import mail
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from apps.accounts.models import User
+from apps.core.models import AdminActionLog
+from apps.properties.models import Property
+
+
+class BulkModerationTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username='admin', password='pass', is_staff=True)
+        self.landlord = User.objects.create_user(username='landlord1', password='pass', email='l@example.com')
+        self.props = [
+            Property.objects.create(
+                owner=self.landlord,
+                title=f'Room {i}',
+                description='Desc',
+                district='Lalitpur' if i % 2 else 'Kathmandu',
+                area='Thamel',
+                address=f'Addr {i}',
+                price_per_month=10000,
+            )
+            for i in range(4)
+        ]
+        self.client.force_login(self.admin)
+
+    def post(self, data):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(reverse('admin_panel:bulk_property_action'), data, secure=True)
+
+    def test_approve_selection(self):
+        ids = [str(p.pk) for p in self.props[:2]]
+        self.post({'action': 'approve', 'ids': ids})
+        approved = Property.objects.filter(status='APPROVED')
+        self.assertEqual(set(str(pk) for pk in approved.values_list('pk', flat=True)), set(ids))
+        self.assertFalse(approved.filter(approved_at__isnull=True).exists())
+        self.assertEqual(AdminActionLog.objects.filter(action_type='PROPERTY_APPROVED').count(), 2)
+        # One email per owner, not per property
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_owner_listing_counts_are_refreshed(self):
+        cache.clear()
+        owner = User.objects.create_user(username='landlord2', password='pass', user_type='LANDLORD')
+        Property.objects.filter(pk__in=[p.pk for p in self.props[:3]]).update(owner=owner)
+        self.assertEqual(User.objects.get(pk=owner.pk).active_properties_count, 0)
+
+        self.post({'action': 'approve', 'ids': [str(p.pk) for p in self.props[:3]]})
+        owner = User.objects.get(pk=owner.pk)
+        self.assertEqual((owner.properties_count, owner.active_properties_count), (3, 3))
+
+        self.post({'action': 'reject', 'ids': [str(self.props[0].pk)], 'reason': 'Duplicate'})
+        self.assertEqual(User.objects.get(pk=owner.pk).active_properties_count, 2)
+
+    def test_reject_filtered_result_set(self):
+        self.post({'action': 'reject', 'scope': 'filtered', 'district': 'lalitpur', 'reason': 'Blurry photos'})
+        rejected = Property.objects.filter(status='REJECTED')
+        self.assertEqual(rejected.count(), 2)
+        self.assertEqual(set(rejected.values_list('rejection_reason', flat=True)), {'Blurry photos'})
+        self.assertEqual(AdminActionLog.objects.count(), 2)
+
+    def test_malformed_ids_are_rejected(self):
+        response = self.post({'action': 'approve', 'ids': [str(self.props[0].pk), 'not-a-uuid']})
+        self.assertRedirects(response, reverse('admin_panel:properties'), fetch_redirect_response=False)
+        self.assertFalse(Property.objects.filter(status='APPROVED').exists())
+
+    def test_next_must_stay_on_site(self):
+        ids = [str(self.props[0].pk)]
+        response = self.post({'action': 'approve', 'ids': ids, 'next': '/admin-dashboard/properties/?status=PENDING'})
+        self.assertRedirects(response, '/admin-dashboard/properties/?status=PENDING', fetch_redirect_response=False)
+        for next_url in ('/\\evil.com', '//evil.com', 'https://evil.com/'):
+            response = self.post({'action': 'approve', 'ids': ids, 'next': next_url})
+            self.assertRedirects(response, reverse('admin_panel:properties'), fetch_redirect_response=False)
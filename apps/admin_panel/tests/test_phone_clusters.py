@@ -0,0 +1,56 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from apps.accounts.models import User
+from apps.core.utils import normalize_phone
+from apps.properties.models import Property
+from apps.services.models import FindRoomRequest
+
+
+class PhoneClusterTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username='admin', password='pass', is_staff=True)
+        self.first = User.objects.create_user(username='first', password='pass', phone_number='9812345678')
+        self.second = User.objects.create_user(username='second', password='pass', phone_number='+9779812345678')
+        User.objects.create_user(username='other', password='pass', phone_number='9800000000')
+        Property.objects.create(
+            owner=self.second, title='Room', description='Desc', area='Thamel',
+            address='Addr', price_per_month=10000,
+        )
+        self.client.force_login(self.admin)
+
+    def test_normalize_phone(self):
+        self.assertEqual(normalize_phone('98-1234-5678'), '+9779812345678')
+        self.assertEqual(normalize_phone('+977-9812345678'), '+9779812345678')
+        self.assertEqual(normalize_phone('01-4412345'), '+97714412345')
+        self.assertEqual(normalize_phone('12345'), '')
+        self.assertEqual(normalize_phone(''), '')
+
+    def test_save_keeps_column_in_sync(self):
+        self.assertEqual(self.first.phone_e164, '+9779812345678')
+        self.first.phone_number = '9800000000'
+        self.first.save(update_fields=['phone_number'])
+        self.first.refresh_from_db()
+        self.assertEqual(self.first.phone_e164, '+9779800000000')
+
+    def test_cluster_list_and_lookup(self):
+        FindRoomRequest.objects.create(
+            user=self.first, title='Need room', name='First', email='f@example.com', property_type='ROOM', district='KATHMANDU',
+            preferred_areas='Thamel', budget_range='5000-10000', move_in_date='2030-01-01',
+            phone='98 1234 5678',
+        )
+        response = self.client.get(reverse('admin_panel:phone_clusters'), secure=True)
+        clusters = list(response.context['clusters'])
+        self.assertEqual(clusters, [{'phone_e164': '+9779812345678', 'accounts': 2, 'listings': 1}])
+
+        response = self.client.get(reverse('admin_panel:phone_clusters'), {'phone': '981-234-5678'}, secure=True)
+        self.assertEqual({u.username for u in response.context['cluster_users']}, {'first', 'second'})
+        self.assertEqual(len(response.context['cluster_properties']), 1)
+        self.assertEqual(len(response.context['cluster_room_requests']), 1)
+
+    def test_backfill(self):
+        User.objects.update(phone_e164='')
+        call_command('backfill_phone_e164', stdout=StringIO())
+        self.assertEqual(User.objects.filter(phone_e164='+9779812345678').count(), 2)
@@ -0,0 +1,90 @@
+from datetime import date, timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from apps.accounts.models import User
+from apps.services.models import FindRoomRequest, ShiftHomeRequest
+from apps.services.tests.factories import make_room_request
+
+
+class ServiceRequestListTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(username='admin', password='pass', is_staff=True, user_type='ADMIN')
+        self.tenant = User.objects.create_user(username='tenant', password='pass', user_type='TENANT')
+        self.client.force_login(self.admin)
+        now = timezone.now()
+        for i in range(60):
+            make_room_request(
+                self.tenant, title=f'Request {i}',
+                district='LALITPUR' if i % 3 == 0 else 'KATHMANDU',
+                status='CLOSED' if i % 2 else 'ACTIVE',
+            )
+        # Several requests share a timestamp so the pk tie-breaker matters.
+        FindRoomRequest.objects.filter(title__in=['Request 10', 'Request 11', 'Request 12']).update(created_at=now)
+        FindRoomRequest.objects.filter(title='Request 0').update(created_at=now - timedelta(days=10))
+
+    def get(self, **params):
+        return self.client.get(reverse('admin_panel:services'), params, secure=True)
+
+    def walk(self, **params):
+        """Follow the Next links and return every title listed."""
+        titles, response = [], self.get(**params)
+        while True:
+            page = response.context['page']
+            titles += [r.title for r in page]
+            if not page.has_next:
+                return titles, response
+            response = self.get(**params, after=page.next_cursor)
+
+    def test_keyset_pages_cover_every_request_once(self):
+        titles, last = self.walk()
+        self.assertEqual(len(titles), 60)
+        self.assertEqual(len(set(titles)), 60)
+        expected = list(FindRoomRequest.objects.order_by('-created_at', '-pk').values_list('title', flat=True))
+        self.assertEqual(titles, expected)
+
+        # Previous from the last page returns the page before it.
+        page = last.context['page']
+        previous = self.get(before=page.previous_cursor).context['page']
+        self.assertEqual([r.title for r in previous], expected[25:50])
+        self.assertTrue(previous.has_previous)
+
+    def test_filters(self):
+        titles, _ = self.walk(status='ACTIVE', district='LALITPUR')
+        self.assertEqual(len(titles), 10)
+        yesterday = (timezone.localdate() - timedelta(days=1)).isoformat()
+        titles, _ = self.walk(date_from=yesterday)
+        self.assertNotIn('Request 0', titles)
+        self.assertEqual(len(titles), 59)
+        titles, _ = self.walk(search='Request 59')
+        self.assertEqual(titles, ['Request 59'])
+        # A garbled cursor falls back to the first page.
+        self.assertEqual(len(self.get(after='not-a-cursor').context['page']), 25)
+
+    def test_deep_page_needs_one_query(self):
+        cursor = self.get().context['page'].next_cursor
+        self.get(after=cursor)
+        with CaptureQueriesContext(connection) as queries:
+            self.get(after=cursor)
+        # One page query, with no COUNT and no OFFSET.
+        page_queries = [q['sql'] for q in queries if 'services_findroomrequest' in q['sql']]
+        self.assertEqual(len(page_queries), 1)
+        self.assertNotIn('COUNT', page_queries[0])
+        self.assertNotIn('OFFSET', page_queries[0])
+
+    def test_shift_home_tab(self):
+        ShiftHomeRequest.objects.create(
+            user=self.tenant, name='Tenant', email='t@example.com', phone='9800000000',
+            shift_type='WITHIN_CITY', property_size='ROOM',
+            from_district='BHAKTAPUR', from_area='Thimi', from_address='Addr',
+            to_district='KATHMANDU', to_area='Thamel', to_address='Addr',
+            preferred_date=date(2026, 12, 1),
+        )
+        response = self.get(tab='shift_home', district='BHAKTAPUR')
+        self.assertEqual(len(response.context['shift_home_requests']), 1)
+        self.assertEqual(len(self.get(tab='shift_home', district='KATHMANDU').context['shift_home_requests']), 0)
@@ -0,0 +1,47 @@
+from django.core.cache import cache
+from django.test import TestCase
+from apps.accounts.models import User
+from apps.properties.models import Property
+from apps.admin_panel.snapshot import DashboardSnapshot
+
+
+class DashboardSnapshotTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.landlord = User.objects.create_user(username='landlord1', password='pass', user_type='LANDLORD')
+        self.tenant = User.objects.create_user(username='tenant1', password='pass', user_type='TENANT')
+        self.prop = Property.objects.create(
+            owner=self.landlord,
+            title='Nice Room',
+            description='Desc',
+            area='Thamel',
+            address='Addr 1',
+            price_per_month=10000
+        )
+
+    def test_counts_match_models(self):
+        snapshot = DashboardSnapshot.get()
+        self.assertEqual(snapshot['total_users'], 2)
+        self.assertEqual(snapshot['total_landlords'], 1)
+        self.assertEqual(snapshot['total_tenants'], 1)
+        self.assertEqual(snapshot['total_properties'], 1)
+        self.assertEqual(snapshot['pending_properties'], 1)
+
+    def test_cached_snapshot_needs_no_queries(self):
+        DashboardSnapshot.get()
+        with self.assertNumQueries(0):
+            DashboardSnapshot.get()
+
+    def test_status_change_invalidates(self):
+        DashboardSnapshot.get()
+        self.prop.status = 'APPROVED'
+        self.prop.save()
+        snapshot = DashboardSnapshot.get()
+        self.assertEqual(snapshot['pending_properties'], 0)
+        self.assertEqual(snapshot['approved_properties'], 1)
+
+    def test_view_counter_save_keeps_snapshot(self):
+        DashboardSnapshot.get()
+        self.prop.increment_views()
+        with self.assertNumQueries(0):
+            DashboardSnapshot.get()
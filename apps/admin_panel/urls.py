@@ -9,6 +9,7 @@ urlpatterns = [
     
     # Property Management
     path('properties/', views.PropertyManagementView.as_view(), name='properties'),
+    path('properties/bulk/', views.PropertyBulkActionView.as_view(), name='bulk_property_action'),
     path('properties/<uuid:pk>/approve/', views.PropertyApproveView.as_view(), name='approve_property'),
     path('properties/<uuid:pk>/reject/', views.PropertyRejectView.as_view(), name='reject_property'),
     path('properties/<uuid:pk>/toggle-featured/', views.PropertyToggleFeaturedView.as_view(), name='toggle_featured'),
@@ -16,14 +17,23 @@ urlpatterns = [
     # User Management
     path('users/', views.UserManagementView.as_view(), name='users'),
     path('users/<int:pk>/toggle-active/', views.UserToggleActiveView.as_view(), name='toggle_user_active'),
+    path('users/phone-clusters/', views.PhoneClusterView.as_view(), name='phone_clusters'),
     
     # Inquiry Management
     path('inquiries/', views.InquiryManagementView.as_view(), name='inquiries'),
     
+    # User Reports
+    path('reports/', views.ReportInboxView.as_view(), name='reports'),
+    path('reports/<int:pk>/review/', views.ReportReviewView.as_view(), name='review_reports'),
+    
     # Service Requests
     path('services/', views.ServiceRequestsView.as_view(), name='services'),
+    path('services/schedule/', views.CrewScheduleView.as_view(), name='crew_schedule'),
     
     # Analytics
     path('analytics/', views.AnalyticsView.as_view(), name='analytics'),
     path('api/stats/', views.ApiStatsView.as_view(), name='api_stats'),
+    
+    # Exports
+    path('exports/property-views/', views.PropertyViewExportView.as_view(), name='export_property_views'),
 ]
@@ -5,14 +5,25 @@ from django.contrib import messages
 from django.db.models import Count, Sum, Avg, Q
 from django.db.models.functions import TruncDate, TruncMonth
 from django.utils import timezone
-from django.http import JsonResponse
-from datetime import timedelta
+from django.http import JsonResponse, HttpResponseBadRequest
+from django.urls import reverse
+from datetime import date, datetime, timedelta
+import uuid
 
 from apps.accounts.models import User
 from apps.properties.models import Property, PropertyView, Favorite
 from apps.inquiries.models import Inquiry, InquiryMessage
-from apps.services.models import FindRoomRequest, ShiftHomeRequest
+from apps.services.models import FindRoomRequest, ShiftHomeRequest, CrewAssignment
+from apps.services import scheduling
 from apps.core.choices import PropertyType, PropertyStatus, District, UserType
+from apps.core.utils import normalize_phone, redirect_to_next
+from apps.core.models import Report, ReportCounter
+from apps.core.reports import close_reports, get_threshold
+from .snapshot import DashboardSnapshot
+from .analytics import get_analytics
+from .exports import ExportMixin, export_response, EXPORT_FORMATS
+from .moderation import BULK_ACTIONS, bulk_moderate
+from .pagination import paginate
 
 
 class AdminRequiredMixin(LoginRequiredMixin, UserPassesTestMixin):
@@ -28,90 +39,69 @@ class DashboardView(AdminRequiredMixin, TemplateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        today = timezone.now().date()
-        last_30_days = today - timedelta(days=30)
-        last_7_days = today - timedelta(days=7)
-        
-        # User Stats
-        context['total_users'] = User.objects.count()
-        context['total_landlords'] = User.objects.filter(user_type='LANDLORD').count()
-        context['total_tenants'] = User.objects.filter(user_type='TENANT').count()
-        context['new_users_30d'] = User.objects.filter(date_joined__date__gte=last_30_days).count()
-        context['new_users_7d'] = User.objects.filter(date_joined__date__gte=last_7_days).count()
-        
-        # Property Stats
-        context['total_properties'] = Property.objects.count()
-        context['pending_properties'] = Property.objects.filter(status='PENDING').count()
-        context['approved_properties'] = Property.objects.filter(status='APPROVED').count()
-        context['rented_properties'] = Property.objects.filter(status='RENTED').count()
-        context['featured_properties'] = Property.objects.filter(is_featured=True).count()
-        
-        # Inquiry Stats
-        context['total_inquiries'] = Inquiry.objects.count()
-        context['pending_inquiries'] = Inquiry.objects.filter(status='PENDING').count()
-        context['inquiries_7d'] = Inquiry.objects.filter(created_at__date__gte=last_7_days).count()
-        
-        # Service Stats
-        context['find_room_requests'] = FindRoomRequest.objects.count()
-        context['pending_find_room'] = FindRoomRequest.objects.filter(status='PENDING').count()
-        context['shift_home_requests'] = ShiftHomeRequest.objects.count()
-        context['pending_shift_home'] = ShiftHomeRequest.objects.filter(status='PENDING').count()
-        
-        # Recent Activity
-        context['recent_properties'] = Property.objects.select_related('owner').order_by('-created_at')[:5]
-        context['recent_inquiries'] = Inquiry.objects.select_related('rental_property', 'sender').order_by('-created_at')[:5]
-        context['recent_users'] = User.objects.order_by('-date_joined')[:5]
-        
-        # Properties by District
-        context['properties_by_district'] = Property.objects.values('district').annotate(
-            count=Count('id')
-        ).order_by('-count')
-        
-        # Monthly Property Trend (last 6 months)
-        six_months_ago = today - timedelta(days=180)
-        context['monthly_properties'] = Property.objects.filter(
-            created_at__date__gte=six_months_ago
-        ).annotate(
-            month=TruncMonth('created_at')
-        ).values('month').annotate(count=Count('id')).order_by('month')
-        
+        context.update(DashboardSnapshot.get().as_context())
         return context
 
 
-class PropertyManagementView(AdminRequiredMixin, ListView):
+def filter_properties(queryset, params):
+    """Apply the property management filters in ``params`` to ``queryset``."""
+    # Filters (case-insensitive)
+    status = params.get('status')
+    if status:
+        queryset = queryset.filter(status=status.upper())
+    
+    district = params.get('district')
+    if district:
+        queryset = queryset.filter(district__iexact=district)
+    
+    search = params.get('search')
+    if search:
+        queryset = queryset.filter(
+            Q(title__icontains=search) | 
+            Q(owner__email__icontains=search) |
+            Q(area__icontains=search)
+        )
+    
+    return queryset
+
+
+class PropertyManagementView(AdminRequiredMixin, ExportMixin, ListView):
     """Admin property management list."""
     model = Property
     template_name = 'admin_panel/properties.html'
     context_object_name = 'properties'
     paginate_by = 20
+    export_filename = 'properties'
+    export_columns = [
+        ('id', 'id'), ('title', 'title'), ('owner_email', 'owner__email'),
+        ('district', 'district'), ('area', 'area'), ('property_type', 'property_type'),
+        ('price_per_month', 'price_per_month'), ('bedrooms', 'bedrooms'), ('status', 'status'),
+        ('is_featured', 'is_featured'), ('is_flagged', 'is_flagged'), ('views_count', 'views_count'),
+        ('fraud_score', 'fraud_score'), ('created_at', 'created_at'), ('approved_at', 'approved_at'),
+    ]
+    
+    sort_orders = {
+        'newest': ('-created_at',),
+        'risk': ('-fraud_score', '-created_at'),
+    }
+    
+    def get_sort(self):
+        """Pending listings are a moderation queue: riskiest first by default."""
+        sort = self.request.GET.get('sort')
+        if sort in self.sort_orders:
+            return sort
+        return 'risk' if self.request.GET.get('status', '').upper() == PropertyStatus.PENDING else 'newest'
     
     def get_queryset(self):
-        queryset = Property.objects.select_related('owner').order_by('-created_at')
-        
-        # Filters (case-insensitive)
-        status = self.request.GET.get('status')
-        if status:
-            queryset = queryset.filter(status__iexact=status)
-        
-        district = self.request.GET.get('district')
-        if district:
-            queryset = queryset.filter(district__iexact=district)
-        
-        search = self.request.GET.get('search')
-        if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) | 
-                Q(owner__email__icontains=search) |
-                Q(area__icontains=search)
-            )
-        
-        return queryset
+        queryset = Property.objects.select_related('owner').order_by(*self.sort_orders[self.get_sort()])
+        return filter_properties(queryset, self.request.GET)
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        context['sort'] = self.get_sort()
         context['status_choices'] = PropertyStatus.choices
         context['district_choices'] = District.choices
-        context['pending_count'] = Property.objects.filter(status='PENDING').count()
+        context['pending_count'] = DashboardSnapshot.get()['pending_properties']
         return context
 
 
@@ -122,6 +112,7 @@ class PropertyApproveView(AdminRequiredMixin, View):
         property_obj = get_object_or_404(Property, pk=pk)
         property_obj.status = 'APPROVED'
         property_obj.rejection_reason = ''
+        property_obj.approved_at = timezone.now()
         property_obj.save()
         messages.success(request, f'Property "{property_obj.title}" has been approved.')
         return redirect('admin_panel:properties')
@@ -152,12 +143,47 @@ class PropertyToggleFeaturedView(AdminRequiredMixin, View):
         return redirect('admin_panel:properties')
 
 
-class UserManagementView(AdminRequiredMixin, ListView):
+class PropertyBulkActionView(AdminRequiredMixin, View):
+    """Approve/reject/feature a selection or a whole filtered result set."""
+    
+    def post(self, request):
+        action = request.POST.get('action')
+        if action not in BULK_ACTIONS:
+            messages.error(request, "Please choose a bulk action.")
+            return redirect('admin_panel:properties')
+        
+        if request.POST.get('scope') == 'filtered':
+            queryset = filter_properties(Property.objects.all(), request.POST)
+        else:
+            ids = request.POST.getlist('ids')
+            if not ids:
+                messages.error(request, "No properties selected.")
+                return redirect('admin_panel:properties')
+            try:
+                ids = [uuid.UUID(pk) for pk in ids]
+            except ValueError:
+                messages.error(request, "Invalid property selection.")
+                return redirect('admin_panel:properties')
+            queryset = Property.objects.filter(pk__in=ids)
+        
+        count = bulk_moderate(queryset, action, request.user, reason=request.POST.get('reason', ''))
+        messages.success(request, f'{count} properties updated ({action}).')
+        return redirect_to_next(request, 'admin_panel:properties')
+
+
+class UserManagementView(AdminRequiredMixin, ExportMixin, ListView):
     """Admin user management list."""
     model = User
     template_name = 'admin_panel/users.html'
     context_object_name = 'users'
     paginate_by = 20
+    export_filename = 'users'
+    export_columns = [
+        ('id', 'id'), ('username', 'username'), ('email', 'email'),
+        ('first_name', 'first_name'), ('last_name', 'last_name'), ('user_type', 'user_type'),
+        ('phone_number', 'phone_number'), ('district', 'district'), ('is_active', 'is_active'),
+        ('is_verified', 'is_verified'), ('date_joined', 'date_joined'),
+    ]
     
     def get_queryset(self):
         queryset = User.objects.order_by('-date_joined')
@@ -175,25 +201,107 @@ class UserManagementView(AdminRequiredMixin, ListView):
         
         search = self.request.GET.get('search')
         if search:
-            queryset = queryset.filter(
+            lookup = (
                 Q(email__icontains=search) |
                 Q(first_name__icontains=search) |
                 Q(last_name__icontains=search) |
                 Q(phone_number__icontains=search)
             )
+            phone = normalize_phone(search)
+            if phone:
+                lookup |= Q(phone_e164=phone)
+            queryset = queryset.filter(lookup)
         
         return queryset
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['user_type_choices'] = UserType.choices
-        context['total_users'] = User.objects.count()
-        context['total_landlords'] = User.objects.filter(user_type='LANDLORD').count()
-        context['total_tenants'] = User.objects.filter(user_type='TENANT').count()
-        context['active_users'] = User.objects.filter(is_active=True).count()
+        snapshot = DashboardSnapshot.get()
+        context['total_users'] = snapshot['total_users']
+        context['total_landlords'] = snapshot['total_landlords']
+        context['total_tenants'] = snapshot['total_tenants']
+        context['active_users'] = snapshot['active_users']
+        return context
+
+
+class PhoneClusterView(AdminRequiredMixin, ListView):
+    """
+    Phone numbers shared by several accounts. With ``?phone=`` shows every
+    account, listing, inquiry and service request using that number.
+    """
+    template_name = 'admin_panel/phone_clusters.html'
+    context_object_name = 'clusters'
+    paginate_by = 20
+    
+    def get_queryset(self):
+        return User.objects.exclude(phone_e164='').values('phone_e164').annotate(
+            accounts=Count('id', distinct=True),
+            listings=Count('properties', distinct=True),
+        ).filter(accounts__gt=1).order_by('-accounts', '-listings', 'phone_e164')
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        phone = normalize_phone(self.request.GET.get('phone', ''))
+        context['phone'] = phone
+        if phone:
+            context['cluster_users'] = User.objects.filter(phone_e164=phone).annotate(
+                listing_count=Count('properties')
+            ).order_by('date_joined')
+            context['cluster_properties'] = Property.objects.filter(
+                owner__phone_e164=phone
+            ).select_related('owner').order_by('-created_at')
+            context['cluster_inquiries'] = Inquiry.objects.filter(
+                phone_e164=phone
+            ).select_related('sender', 'rental_property').order_by('-created_at')[:50]
+            context['cluster_room_requests'] = FindRoomRequest.objects.filter(
+                phone_e164=phone
+            ).select_related('user').order_by('-created_at')[:50]
+            context['cluster_shift_requests'] = ShiftHomeRequest.objects.filter(
+                phone_e164=phone
+            ).select_related('user').order_by('-created_at')[:50]
         return context
 
 
+class ReportInboxView(AdminRequiredMixin, ListView):
+    """Reported objects, most-reported first. Reads only ``ReportCounter``."""
+    template_name = 'admin_panel/reports.html'
+    context_object_name = 'counters'
+    paginate_by = 20
+    
+    def get_queryset(self):
+        queryset = ReportCounter.objects.order_by('-pending_count', '-last_reported_at')
+        if self.request.GET.get('show') != 'all':
+            queryset = queryset.filter(pending_count__gt=0)
+        content_type = self.request.GET.get('content_type')
+        if content_type:
+            queryset = queryset.filter(content_type=content_type)
+        if self.request.GET.get('quarantined'):
+            queryset = queryset.filter(is_quarantined=True)
+        return queryset
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['content_type_choices'] = Report.CONTENT_TYPE_CHOICES
+        context['quarantine_threshold'] = get_threshold()
+        return context
+
+
+class ReportReviewView(AdminRequiredMixin, View):
+    """Uphold or dismiss all pending reports on one object."""
+    
+    def post(self, request, pk):
+        counter = get_object_or_404(ReportCounter, pk=pk)
+        action = request.POST.get('action')
+        if action not in ('uphold', 'dismiss'):
+            messages.error(request, "Unknown review action.")
+        else:
+            close_reports(counter, request.user, uphold=action == 'uphold', notes=request.POST.get('notes', ''))
+            verb = 'upheld' if action == 'uphold' else 'dismissed'
+            messages.success(request, f'Reports on "{counter.label or counter.object_id}" {verb}.')
+        return redirect_to_next(request, 'admin_panel:reports')
+
+
 class UserToggleActiveView(AdminRequiredMixin, View):
     """Toggle user active status."""
     
@@ -209,12 +317,18 @@ class UserToggleActiveView(AdminRequiredMixin, View):
         return redirect('admin_panel:users')
 
 
-class InquiryManagementView(AdminRequiredMixin, ListView):
+class InquiryManagementView(AdminRequiredMixin, ExportMixin, ListView):
     """Admin inquiry management list."""
     model = Inquiry
     template_name = 'admin_panel/inquiries.html'
     context_object_name = 'inquiries'
     paginate_by = 20
+    export_filename = 'inquiries'
+    export_columns = [
+        ('id', 'id'), ('property_id', 'rental_property_id'), ('property_title', 'rental_property__title'),
+        ('name', 'name'), ('email', 'email'), ('phone', 'phone'), ('status', 'status'),
+        ('is_read', 'is_read'), ('preferred_visit_date', 'preferred_visit_date'), ('created_at', 'created_at'),
+    ]
     
     def get_queryset(self):
         queryset = Inquiry.objects.select_related('rental_property', 'sender', 'rental_property__owner').order_by('-created_at')
@@ -243,141 +357,176 @@ class InquiryManagementView(AdminRequiredMixin, ListView):
         return context
 
 
-class ServiceRequestsView(AdminRequiredMixin, TemplateView):
+def filter_service_requests(queryset, params, district_field, search_fields):
+    """Apply the service request filters in ``params`` to ``queryset``."""
+    status = params.get('status')
+    if status:
+        queryset = queryset.filter(status=status.upper())
+    
+    district = params.get('district')
+    if district:
+        queryset = queryset.filter(**{district_field: district.upper()})
+    
+    # Whole days as datetime ranges, so the created_at indexes still apply
+    for param, lookup in (('date_from', 'gte'), ('date_to', 'lt')):
+        try:
+            day = date.fromisoformat(params.get(param, ''))
+        except ValueError:
+            continue
+        if lookup == 'lt':
+            day += timedelta(days=1)
+        start = timezone.make_aware(datetime.combine(day, datetime.min.time()))
+        queryset = queryset.filter(**{f'created_at__{lookup}': start})
+    
+    search = params.get('search')
+    if search:
+        query = Q()
+        for field in search_fields:
+            query |= Q(**{f'{field}__icontains': search})
+        queryset = queryset.filter(query)
+    
+    return queryset
+
+
+class ServiceRequestsView(AdminRequiredMixin, ExportMixin, TemplateView):
     """Admin service requests management."""
     template_name = 'admin_panel/services.html'
+    paginate_by = 25
+    # (model, district field, search fields) per tab
+    request_lists = {
+        'find_room': (FindRoomRequest, 'district', ('title', 'name', 'email', 'phone', 'preferred_areas')),
+        'shift_home': (ShiftHomeRequest, 'from_district', ('name', 'email', 'phone', 'from_area', 'to_area')),
+    }
+    export_columns = {
+        'find_room': [
+            ('id', 'id'), ('title', 'title'), ('user_email', 'user__email'), ('name', 'name'),
+            ('phone', 'phone'), ('district', 'district'), ('property_type', 'property_type'),
+            ('budget_range', 'budget_range'), ('bedrooms', 'bedrooms'), ('status', 'status'),
+            ('views_count', 'views_count'), ('created_at', 'created_at'),
+        ],
+        'shift_home': [
+            ('id', 'id'), ('name', 'name'), ('email', 'email'), ('phone', 'phone'),
+            ('shift_type', 'shift_type'), ('property_size', 'property_size'),
+            ('from_district', 'from_district'), ('from_area', 'from_area'),
+            ('to_district', 'to_district'), ('to_area', 'to_area'),
+            ('preferred_date', 'preferred_date'), ('status', 'status'),
+            ('estimated_cost', 'estimated_cost'), ('created_at', 'created_at'),
+        ],
+    }
+    
+    def get_tab(self):
+        return 'shift_home' if self.request.GET.get('tab') == 'shift_home' else 'find_room'
+    
+    def get_queryset(self):
+        model, district_field, search_fields = self.request_lists[self.get_tab()]
+        return filter_service_requests(model.objects.all(), self.request.GET, district_field, search_fields)
+    
+    def get_export_type(self):
+        return self.get_tab()
+    
+    def get_export_queryset(self):
+        return self.get_queryset().order_by('-created_at')
+    
+    def get_export_columns(self):
+        return self.export_columns[self.get_export_type()]
+    
+    def get_export_filename(self):
+        return f'{self.get_export_type()}-requests'
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        tab = self.get_tab()
+        model = self.request_lists[tab][0]
+        
+        page = paginate(self.get_queryset().select_related('user'), self.request.GET, self.paginate_by)
+        context['page'] = page
+        context[f'{tab}_requests'] = page.object_list
+        context['status_choices'] = model.STATUS_CHOICES
+        context['district_choices'] = model.DISTRICT_CHOICES
+        
+        # Tab badges come from the cached dashboard totals
+        snapshot = DashboardSnapshot.get()
+        context['find_room_count'] = snapshot['find_room_requests']
+        context['pending_find_room'] = snapshot['pending_find_room']
+        context['shift_home_count'] = snapshot['shift_home_requests']
+        context['pending_shift_home'] = snapshot['pending_shift_home']
         
-        # Find Room Requests
-        context['find_room_requests'] = FindRoomRequest.objects.select_related('user').order_by('-created_at')[:50]
-        context['find_room_count'] = FindRoomRequest.objects.count()
-        context['pending_find_room'] = FindRoomRequest.objects.filter(status='PENDING').count()
-        
-        # Shift Home Requests
-        context['shift_home_requests'] = ShiftHomeRequest.objects.select_related('user').order_by('-created_at')[:50]
-        context['shift_home_count'] = ShiftHomeRequest.objects.count()
-        context['pending_shift_home'] = ShiftHomeRequest.objects.filter(status='PENDING').count()
-        
         return context
 
 
+class CrewScheduleView(AdminRequiredMixin, TemplateView):
+    """Mover crews' runs for a day; POST re-plans that day."""
+    template_name = 'admin_panel/crew_schedule.html'
+    
+    def get_date(self, data):
+        try:
+            return date.fromisoformat(data.get('date', ''))
+        except ValueError:
+            return timezone.localdate() + timedelta(days=1)
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        day = self.get_date(self.request.GET)
+        assignments = CrewAssignment.objects.filter(scheduled_date=day).select_related('shift_request')
+        crews = {}
+        for assignment in assignments:
+            crews.setdefault(assignment.crew, []).append(assignment)
+        context['schedule_date'] = day
+        context['crews'] = sorted(crews.items())
+        context['unassigned'] = ShiftHomeRequest.objects.filter(
+            status='CONFIRMED', preferred_date=day, crew_assignment__isnull=True
+        )
+        return context
+    
+    def post(self, request):
+        day = self.get_date(request.POST)
+        schedule, unplaced = scheduling.plan(day)
+        saved = scheduling.save(schedule, unplaced)
+        messages.success(request, f'Scheduled {saved} jobs for {day}.')
+        if unplaced:
+            messages.warning(request, f'{len(unplaced)} jobs need manual scheduling.')
+        return redirect(f"{reverse('admin_panel:crew_schedule')}?date={day.isoformat()}")
+
+
 class AnalyticsView(AdminRequiredMixin, TemplateView):
     """Detailed analytics view."""
     template_name = 'admin_panel/analytics.html'
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        today = timezone.now().date()
-        import json
-        
-        # Property views over time
-        last_30_days = today - timedelta(days=30)
-        six_months_ago = today - timedelta(days=180)
-        
-        # Total rent value
-        context['total_rent_value'] = Property.objects.filter(
-            status='APPROVED'
-        ).aggregate(total=Sum('price_per_month'))['total'] or 0
-        
-        # Average price
-        context['avg_price'] = Property.objects.filter(
-            status='APPROVED'
-        ).aggregate(avg=Avg('price_per_month'))['avg'] or 0
-        
-        # Conversion rate (inquiries with viewing requests / total inquiries)
-        total_inquiries = Inquiry.objects.count()
-        viewing_inquiries = Inquiry.objects.exclude(preferred_visit_date__isnull=True).count()
-        context['conversion_rate'] = (viewing_inquiries / total_inquiries * 100) if total_inquiries > 0 else 0
-        
-        # Average response time (mock for now)
-        context['avg_response_time'] = 4
+        context.update(get_analytics())
+        return context
+
+
+class PropertyViewExportView(AdminRequiredMixin, View):
+    """Stream the property view log (optionally filtered) as CSV/JSONL."""
+    columns = [
+        ('id', 'id'), ('property_id', 'property_id'), ('user_id', 'user_id'),
+        ('ip_address', 'ip_address'), ('user_agent', 'user_agent'), ('viewed_at', 'viewed_at'),
+    ]
+    
+    def get(self, request):
+        queryset = PropertyView.objects.order_by('viewed_at')
         
-        # Monthly labels and data for charts
-        months = []
-        property_counts = []
-        user_counts = []
-        for i in range(5, -1, -1):
-            month_date = today - timedelta(days=i*30)
-            month_start = month_date.replace(day=1)
-            if i > 0:
-                next_month = (month_date + timedelta(days=32)).replace(day=1)
-            else:
-                next_month = today + timedelta(days=1)
+        try:
+            property_id = request.GET.get('property_id')
+            if property_id:
+                queryset = queryset.filter(property_id=uuid.UUID(property_id))
             
-            months.append(month_start.strftime('%b'))
-            property_counts.append(Property.objects.filter(
-                created_at__date__gte=month_start,
-                created_at__date__lt=next_month
-            ).count())
-            user_counts.append(User.objects.filter(
-                date_joined__date__gte=month_start,
-                date_joined__date__lt=next_month
-            ).count())
-        
-        context['monthly_labels'] = json.dumps(months)
-        context['monthly_properties'] = json.dumps(property_counts)
-        context['monthly_users'] = json.dumps(user_counts)
-        
-        # Property type distribution
-        property_types = Property.objects.values('property_type').annotate(
-            count=Count('id')
-        ).order_by('-count')
-        property_type_dict = dict(PropertyType.choices)
-        type_labels = [property_type_dict.get(pt['property_type'], pt['property_type']) for pt in property_types]
-        type_data = [pt['count'] for pt in property_types]
-        context['property_type_labels'] = json.dumps(type_labels)
-        context['property_type_data'] = json.dumps(type_data)
-        
-        # Price distribution
-        total_properties = Property.objects.filter(status='APPROVED').count() or 1
-        price_ranges = [
-            {'label': 'Under Rs. 10,000', 'min': 0, 'max': 10000},
-            {'label': 'Rs. 10,000 - 20,000', 'min': 10000, 'max': 20000},
-            {'label': 'Rs. 20,000 - 35,000', 'min': 20000, 'max': 35000},
-            {'label': 'Rs. 35,000 - 50,000', 'min': 35000, 'max': 50000},
-            {'label': 'Over Rs. 50,000', 'min': 50000, 'max': 999999999},
-        ]
-        price_distribution = []
-        for pr in price_ranges:
-            count = Property.objects.filter(
-                status='APPROVED',
-                price_per_month__gte=pr['min'],
-                price_per_month__lt=pr['max']
-            ).count()
-            price_distribution.append({
-                'label': pr['label'],
-                'count': count,
-                'percentage': round(count / total_properties * 100, 1)
-            })
-        context['price_distribution'] = price_distribution
-        
-        # Top properties by views
-        context['top_properties'] = Property.objects.filter(
-            status='APPROVED'
-        ).annotate(
-            inquiry_count=Count('inquiries')
-        ).order_by('-views_count')[:10]
-        
-        # District stats
-        districts = [
-            ('KATHMANDU', 'Kathmandu'),
-            ('BHAKTAPUR', 'Bhaktapur'),
-            ('LALITPUR', 'Lalitpur'),
-        ]
-        district_stats = []
-        for code, name in districts:
-            props = Property.objects.filter(district=code, status='APPROVED')
-            district_stats.append({
-                'name': name,
-                'count': props.count(),
-                'avg_price': props.aggregate(avg=Avg('price_per_month'))['avg'] or 0,
-                'inquiries': Inquiry.objects.filter(rental_property__district=code).count(),
-            })
-        context['district_stats'] = district_stats
-        
-        return context
+            date_from = request.GET.get('from')
+            if date_from:
+                queryset = queryset.filter(viewed_at__date__gte=date.fromisoformat(date_from))
+            
+            date_to = request.GET.get('to')
+            if date_to:
+                queryset = queryset.filter(viewed_at__date__lte=date.fromisoformat(date_to))
+        except ValueError:
+            return HttpResponseBadRequest("Invalid property_id or date (expected a UUID and YYYY-MM-DD).")
+        
+        fmt = request.GET.get('export', 'csv')
+        if fmt not in EXPORT_FORMATS:
+            fmt = 'csv'
+        return export_response(queryset, self.columns, 'property-views', fmt)
 
 
 class ApiStatsView(AdminRequiredMixin, View):
@@ -6,6 +6,7 @@ import uuid
 from django.db import models
 from django.conf import settings
 from apps.properties.models import Property
+from apps.core.memo import user_fact
 
 
 class ChatRoom(models.Model):
@@ -133,3 +134,15 @@ class Message(models.Model):
             self.is_read = True
             self.read_at = timezone.now()
             self.save(update_fields=['is_read', 'read_at'])
+
+
+def unread_message_count(user):
+    """Unread chat messages waiting for ``user``."""
+    return user_fact(
+        user.pk, 'unread_chat_messages',
+        Message.objects.filter(
+            models.Q(chat_room__participant1=user) | models.Q(chat_room__participant2=user),
+            is_read=False,
+        ).exclude(sender=user).count,
+        cached=True,
+    )
@@ -0,0 +1,15 @@
+"""
+Signal handlers for the chat app.
+"""
+
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.core.memo import forget_user
+from .models import Message
+
+
+@receiver(post_save, sender=Message, dispatch_uid='user_facts_message_post_save')
+def forget_unread_messages(sender, instance, **kwargs):
+    room = instance.chat_room
+    forget_user(room.participant1_id, room.participant2_id)
@@ -10,7 +10,8 @@ from django.db.models import Q, Max, Count
 from django.utils import timezone
 from django.contrib import messages
 
-from .models import ChatRoom, Message
+from .models import ChatRoom, Message, unread_message_count
+from apps.core.memo import forget_user
 from apps.properties.models import Property
 from apps.accounts.models import User
 
@@ -76,6 +77,7 @@ class ChatRoomView(LoginRequiredMixin, DetailView):
             is_read=True, 
             read_at=timezone.now()
         )
+        forget_user(user.pk)
         
         return context
 
@@ -176,6 +178,7 @@ class GetMessagesView(LoginRequiredMixin, View):
             is_read=True,
             read_at=timezone.now()
         )
+        forget_user(request.user.pk)
         
         messages_data = []
         for msg in messages_qs:
@@ -199,13 +202,7 @@ class GetUnreadCountView(LoginRequiredMixin, View):
     """Get total unread message count (AJAX for navbar badge)."""
     
     def get(self, request):
-        user = request.user
-        
-        # Count unread messages across all chat rooms
-        unread_count = Message.objects.filter(
-            Q(chat_room__participant1=user) | Q(chat_room__participant2=user),
-            is_read=False
-        ).exclude(sender=user).count()
+        unread_count = unread_message_count(request.user)
         
         return JsonResponse({
             'success': True,
@@ -3,7 +3,7 @@ Core app admin configuration.
 """
 
 from django.contrib import admin
-from .models import Report, SiteConfiguration
+from .models import Report, ReportCounter, SiteConfiguration, AdminActionLog
 
 
 @admin.register(Report)
@@ -31,6 +31,28 @@ class ReportAdmin(admin.ModelAdmin):
     )
 
 
+@admin.register(ReportCounter)
+class ReportCounterAdmin(admin.ModelAdmin):
+    list_display = ['content_type', 'label', 'pending_count', 'report_count', 'is_quarantined', 'last_reported_at']
+    list_filter = ['content_type', 'is_quarantined']
+    search_fields = ['object_id', 'label']
+    readonly_fields = [
+        'content_type', 'object_id', 'label', 'report_count', 'pending_count',
+        'last_reason', 'last_reported_at', 'is_quarantined', 'quarantined_at',
+    ]
+    
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(AdminActionLog)
+class AdminActionLogAdmin(admin.ModelAdmin):
+    list_display = ['action_type', 'content_type', 'object_id', 'admin', 'created_at']
+    list_filter = ['action_type', 'content_type', 'created_at']
+    search_fields = ['object_id', 'description', 'admin__email']
+    readonly_fields = ['admin', 'action_type', 'content_type', 'object_id', 'description', 'created_at']
+
+
 @admin.register(SiteConfiguration)
 class SiteConfigurationAdmin(admin.ModelAdmin):
     list_display = ['site_name', 'contact_email', 'registration_open']
@@ -35,6 +35,7 @@ class PropertyStatus(models.TextChoices):
     APPROVED = 'APPROVED', 'Approved'
     REJECTED = 'REJECTED', 'Rejected'
     RENTED = 'RENTED', 'Rented Out'
+    QUARANTINED = 'QUARANTINED', 'Quarantined (Reported)'
 
 
 class InquiryStatus(models.TextChoices):
@@ -77,9 +78,12 @@ class AdminActionType(models.TextChoices):
     USER_VERIFIED = 'USER_VERIFIED', 'User Verified'
     PROPERTY_APPROVED = 'PROPERTY_APPROVED', 'Property Approved'
     PROPERTY_REJECTED = 'PROPERTY_REJECTED', 'Property Rejected'
+    PROPERTY_FEATURED = 'PROPERTY_FEATURED', 'Property Featured'
+    PROPERTY_UNFEATURED = 'PROPERTY_UNFEATURED', 'Property Unfeatured'
     PROPERTY_DELETED = 'PROPERTY_DELETED', 'Property Deleted'
     INQUIRY_FLAGGED = 'INQUIRY_FLAGGED', 'Inquiry Flagged'
     REPORT_RESOLVED = 'REPORT_RESOLVED', 'Report Resolved'
+    REPORT_DISMISSED = 'REPORT_DISMISSED', 'Report Dismissed'
     SERVICE_COMPLETED = 'SERVICE_COMPLETED', 'Service Request Completed'
 
 
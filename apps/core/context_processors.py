@@ -3,6 +3,10 @@ Context processors for global template variables.
 """
 
 from django.conf import settings
+from django.utils.functional import SimpleLazyObject
+
+from apps.core.models import SiteConfiguration
+from apps.properties.models import favorite_ids
 
 
 def site_settings(request):
@@ -13,4 +17,16 @@ def site_settings(request):
         'SITE_NAME': getattr(settings, 'SITE_NAME', 'HamroKotha'),
         'SITE_URL': getattr(settings, 'SITE_URL', 'http://localhost:8000'),
         'DEBUG': settings.DEBUG,
+        'site_config': SimpleLazyObject(SiteConfiguration.get_config),
+    }
+
+
+def user_facts(request):
+    """
+    Per-user facts for templates, looked up only if a template uses them
+    and then once per request (see ``apps.core.memo``).
+    """
+    user = getattr(request, 'user', None)
+    return {
+        'user_favorites': SimpleLazyObject(lambda: favorite_ids(user) if user else set()),
     }
@@ -0,0 +1,41 @@
+"""
+Fill the normalized phone_e164 column on every model that keeps one
+(users, inquiries, room requests, shift-home requests):
+
+    python manage.py backfill_phone_e164 [--batch-size 1000]
+"""
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from apps.core.models import NormalizedPhoneMixin
+from apps.core.utils import normalize_phone
+
+
+class Command(BaseCommand):
+    help = 'Recompute phone_e164 from the raw phone field for all existing records.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        for model in apps.get_models():
+            if not issubclass(model, NormalizedPhoneMixin):
+                continue
+            rows = model.objects.order_by().values_list('pk', model.PHONE_FIELD, 'phone_e164')
+            changed = []
+            updated = 0
+            for pk, phone, current in rows.iterator(chunk_size=batch_size):
+                normalized = normalize_phone(phone)
+                if normalized != current:
+                    changed.append(model(pk=pk, phone_e164=normalized))
+                if len(changed) >= batch_size:
+                    model.objects.bulk_update(changed, ['phone_e164'])
+                    updated += len(changed)
+                    changed = []
+            if changed:
+                model.objects.bulk_update(changed, ['phone_e164'])
+                updated += len(changed)
+            self.stdout.write(f"  {model._meta.label}: {updated} updated")
+        self.stdout.write(self.style.SUCCESS('Phone numbers normalized.'))
@@ -0,0 +1,102 @@
+"""
+Request-scoped memoization of per-user facts.
+
+Several parts of one page load ask the same questions about the signed-in
+user: which listings they have favorited, how many listings or inquiries
+they have, how many unread messages are waiting. ``RequestMemoMiddleware``
+gives every request a ``RequestMemo`` (``request.memo``) that is also the
+current memo for the code running on its behalf, and ``user_fact`` answers
+each question at most once per request - from views, template context,
+template tags and model helpers alike.
+
+Facts can also be kept for ``USER_FACTS_CACHE_TTL`` seconds in one cached
+dict per user so that polled endpoints such as the unread badges mostly
+skip the database. Signals that change a fact call ``forget_user``, which
+drops both the memoized and the cached values once the transaction
+commits.
+"""
+
+from contextvars import ContextVar
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+
+FACTS_KEY = 'core:user_facts:{user}'
+
+_current = ContextVar('request_memo', default=None)
+
+
+def get_timeout():
+    return getattr(settings, 'USER_FACTS_CACHE_TTL', 60)
+
+
+class RequestMemo:
+    """Values computed during one request, keyed by ``(user_id, name)``."""
+
+    def __init__(self):
+        self.values = {}
+
+    def forget(self, user_id):
+        for key in [key for key in self.values if key[0] == user_id]:
+            del self.values[key]
+
+
+def current_memo():
+    """The memo of the request being handled, or ``None`` outside a request."""
+    return _current.get()
+
+
+class RequestMemoMiddleware:
+    """Attach a fresh ``RequestMemo`` to each request."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.memo = RequestMemo()
+        token = _current.set(request.memo)
+        try:
+            return self.get_response(request)
+        finally:
+            _current.reset(token)
+
+
+def user_fact(user_id, name, compute, cached=False):
+    """
+    Value of fact ``name`` about user ``user_id``, computing it with
+    ``compute()`` at most once per request. With ``cached`` the value is
+    also shared between requests for ``USER_FACTS_CACHE_TTL`` seconds.
+    """
+    memo = current_memo()
+    key = (user_id, name)
+    if memo is not None and key in memo.values:
+        return memo.values[key]
+
+    if cached:
+        cache_key = FACTS_KEY.format(user=user_id)
+        facts = cache.get(cache_key) or {}
+        if name in facts:
+            value = facts[name]
+        else:
+            value = facts[name] = compute()
+            cache.set(cache_key, facts, get_timeout())
+    else:
+        value = compute()
+
+    if memo is not None:
+        memo.values[key] = value
+    return value
+
+
+def forget_user(*user_ids):
+    """Drop what is remembered about ``user_ids`` after a change to their facts."""
+    memo = current_memo()
+    for user_id in user_ids:
+        if user_id is None:
+            continue
+        if memo is not None:
+            memo.forget(user_id)
+        transaction.on_commit(partial(cache.delete, FACTS_KEY.format(user=user_id)))
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:13
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AdminActionLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('action_type', models.CharField(choices=[('USER_CREATED', 'User Created'), ('USER_BANNED', 'User Banned'), ('USER_UNBANNED', 'User Unbanned'), ('USER_VERIFIED', 'User Verified'), ('PROPERTY_APPROVED', 'Property Approved'), ('PROPERTY_REJECTED', 'Property Rejected'), ('PROPERTY_FEATURED', 'Property Featured'), ('PROPERTY_UNFEATURED', 'Property Unfeatured'), ('PROPERTY_DELETED', 'Property Deleted'), ('INQUIRY_FLAGGED', 'Inquiry Flagged'), ('REPORT_RESOLVED', 'Report Resolved'), ('SERVICE_COMPLETED', 'Service Request Completed')], max_length=30)),
+                ('content_type', models.CharField(max_length=20)),
+                ('object_id', models.CharField(max_length=64)),
+                ('description', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('admin', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='admin_actions', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Admin Action Log',
+                'verbose_name_plural': 'Admin Action Logs',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['content_type', 'object_id'], name='core_admina_content_10f3c8_idx')],
+            },
+        ),
+    ]
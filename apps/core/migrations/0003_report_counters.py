@@ -0,0 +1,92 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:31
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max, Min, Q
+
+
+def dedupe_reports(apps, schema_editor):
+    """Keep only the earliest report per (user, object) before adding the constraint."""
+    Report = apps.get_model('core', 'Report')
+    repeats = Report.objects.values('reported_by', 'content_type', 'object_id').annotate(
+        first=Min('id'), n=Count('id')
+    ).filter(n__gt=1)
+    for row in repeats:
+        Report.objects.filter(
+            reported_by=row['reported_by'], content_type=row['content_type'], object_id=row['object_id']
+        ).exclude(id=row['first']).delete()
+
+
+def build_counters(apps, schema_editor):
+    Report = apps.get_model('core', 'Report')
+    ReportCounter = apps.get_model('core', 'ReportCounter')
+    rows = Report.objects.values('content_type', 'object_id').annotate(
+        total=Count('id'),
+        pending=Count('id', filter=Q(status='PENDING')),
+        last=Max('created_at'),
+    )
+    ReportCounter.objects.bulk_create([
+        ReportCounter(
+            content_type=row['content_type'], object_id=row['object_id'],
+            report_count=row['total'], pending_count=row['pending'], last_reported_at=row['last'],
+        )
+        for row in rows
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_admin_action_log'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_type', models.CharField(choices=[('property', 'Property'), ('user', 'User'), ('inquiry', 'Inquiry')], max_length=20)),
+                ('object_id', models.CharField(max_length=64)),
+                ('label', models.CharField(blank=True, help_text='Title of the reported object when first reported', max_length=200)),
+                ('report_count', models.PositiveIntegerField(default=0)),
+                ('pending_count', models.PositiveIntegerField(default=0)),
+                ('last_reason', models.CharField(blank=True, choices=[('SPAM', 'Spam'), ('FRAUD', 'Fraud'), ('INAPPROPRIATE', 'Inappropriate Content'), ('DUPLICATE', 'Duplicate Listing'), ('OTHER', 'Other')], max_length=20)),
+                ('last_reported_at', models.DateTimeField(blank=True, null=True)),
+                ('is_quarantined', models.BooleanField(default=False)),
+                ('quarantined_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Report Counter',
+                'verbose_name_plural': 'Report Counters',
+            },
+        ),
+        migrations.AlterField(
+            model_name='adminactionlog',
+            name='action_type',
+            field=models.CharField(choices=[('USER_CREATED', 'User Created'), ('USER_BANNED', 'User Banned'), ('USER_UNBANNED', 'User Unbanned'), ('USER_VERIFIED', 'User Verified'), ('PROPERTY_APPROVED', 'Property Approved'), ('PROPERTY_REJECTED', 'Property Rejected'), ('PROPERTY_FEATURED', 'Property Featured'), ('PROPERTY_UNFEATURED', 'Property Unfeatured'), ('PROPERTY_DELETED', 'Property Deleted'), ('INQUIRY_FLAGGED', 'Inquiry Flagged'), ('REPORT_RESOLVED', 'Report Resolved'), ('REPORT_DISMISSED', 'Report Dismissed'), ('SERVICE_COMPLETED', 'Service Request Completed')], max_length=30),
+        ),
+        migrations.AlterField(
+            model_name='report',
+            name='object_id',
+            field=models.CharField(max_length=64),
+        ),
+        migrations.RunPython(dedupe_reports, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='report',
+            index=models.Index(fields=['content_type', 'object_id', 'status'], name='core_report_content_be3fbc_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='report',
+            constraint=models.UniqueConstraint(fields=('reported_by', 'content_type', 'object_id'), name='unique_report_per_user'),
+        ),
+        migrations.AddIndex(
+            model_name='reportcounter',
+            index=models.Index(fields=['-pending_count', '-last_reported_at'], name='core_report_pending_023575_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='reportcounter',
+            constraint=models.UniqueConstraint(fields=('content_type', 'object_id'), name='unique_report_counter'),
+        ),
+        migrations.RunPython(build_counters, migrations.RunPython.noop),
+    ]
@@ -1,10 +1,40 @@
 """
-Core models - Report model for fraud detection.
+Core models - Report model for fraud detection, admin action log.
 """
 
+import time
+
 from django.db import models
 from django.conf import settings
-from apps.core.choices import ReportReason, ReportStatus
+from apps.core import versions
+from apps.core.choices import ReportReason, ReportStatus, AdminActionType
+from apps.core.utils import normalize_phone
+
+
+class NormalizedPhoneMixin(models.Model):
+    """
+    Keeps an indexed E.164 copy of a free-text phone field so records
+    sharing a number can be found with one indexed lookup.
+    """
+    PHONE_FIELD = 'phone'
+
+    phone_e164 = models.CharField(
+        max_length=16,
+        blank=True,
+        db_index=True,
+        editable=False,
+        help_text="Normalized E.164 phone number"
+    )
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        self.phone_e164 = normalize_phone(getattr(self, self.PHONE_FIELD))
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and self.PHONE_FIELD in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'phone_e164'}
+        super().save(*args, **kwargs)
 
 
 class Report(models.Model):
@@ -24,7 +54,8 @@ class Report(models.Model):
         related_name='reports_made'
     )
     content_type = models.CharField(max_length=20, choices=CONTENT_TYPE_CHOICES)
-    object_id = models.PositiveIntegerField()
+    # CharField so UUID (property, inquiry) and integer (user) keys both fit.
+    object_id = models.CharField(max_length=64)
     reason = models.CharField(max_length=20, choices=ReportReason.choices)
     description = models.TextField(blank=True)
     status = models.CharField(
@@ -47,11 +78,80 @@ class Report(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Report'
         verbose_name_plural = 'Reports'
+        constraints = [
+            # One report per user per object; repeats update the original.
+            models.UniqueConstraint(
+                fields=['reported_by', 'content_type', 'object_id'],
+                name='unique_report_per_user',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['content_type', 'object_id', 'status']),
+        ]
     
     def __str__(self):
         return f"Report #{self.id} - {self.content_type} ({self.status})"
 
 
+class ReportCounter(models.Model):
+    """
+    Report totals per reported object, maintained by
+    ``apps.core.reports.submit_report`` in the submission transaction.
+    The admin reports inbox reads only this table.
+    """
+    content_type = models.CharField(max_length=20, choices=Report.CONTENT_TYPE_CHOICES)
+    object_id = models.CharField(max_length=64)
+    label = models.CharField(max_length=200, blank=True, help_text="Title of the reported object when first reported")
+    report_count = models.PositiveIntegerField(default=0)
+    pending_count = models.PositiveIntegerField(default=0)
+    last_reason = models.CharField(max_length=20, choices=ReportReason.choices, blank=True)
+    last_reported_at = models.DateTimeField(null=True, blank=True)
+    is_quarantined = models.BooleanField(default=False)
+    quarantined_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        verbose_name = 'Report Counter'
+        verbose_name_plural = 'Report Counters'
+        constraints = [
+            models.UniqueConstraint(fields=['content_type', 'object_id'], name='unique_report_counter'),
+        ]
+        indexes = [
+            models.Index(fields=['-pending_count', '-last_reported_at']),
+        ]
+    
+    def __str__(self):
+        return f"{self.content_type} {self.object_id}: {self.pending_count} pending"
+
+
+class AdminActionLog(models.Model):
+    """
+    Audit trail of moderation actions taken from the admin panel.
+    One row per affected object.
+    """
+    admin = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='admin_actions'
+    )
+    action_type = models.CharField(max_length=30, choices=AdminActionType.choices)
+    content_type = models.CharField(max_length=20)
+    object_id = models.CharField(max_length=64)
+    description = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Admin Action Log'
+        verbose_name_plural = 'Admin Action Logs'
+        indexes = [
+            models.Index(fields=['content_type', 'object_id']),
+        ]
+    
+    def __str__(self):
+        return f"{self.get_action_type_display()} - {self.content_type} {self.object_id}"
+
+
 class SiteConfiguration(models.Model):
     """
     Singleton model for site-wide configuration.
@@ -70,6 +170,10 @@ class SiteConfiguration(models.Model):
     registration_open = models.BooleanField(default=True)
     property_approval_required = models.BooleanField(default=True)
     
+    # Shared version number; each process keeps its own (version, expiry, instance).
+    VERSION_KEY = 'core:site_configuration:version'
+    _cached = None
+    
     class Meta:
         verbose_name = 'Site Configuration'
         verbose_name_plural = 'Site Configuration'
@@ -81,9 +185,30 @@ class SiteConfiguration(models.Model):
     
     @classmethod
     def get_config(cls):
-        """Get or create the configuration instance."""
+        """
+        The configuration instance, loaded once per process and reloaded
+        after a save anywhere bumps the shared version (see
+        ``apps.core.signals``). The bump only reaches workers sharing the
+        cache, so each process also reloads at least every
+        ``SITE_CONFIG_LOCAL_TTL`` seconds. Treat it as read-only.
+        """
+        version = cls.get_version()
+        cached = cls._cached
+        if cached is not None and cached[0] == version and time.monotonic() < cached[1]:
+            return cached[2]
         config, _ = cls.objects.get_or_create(pk=1)
+        expires = time.monotonic() + getattr(settings, 'SITE_CONFIG_LOCAL_TTL', 30)
+        cls._cached = (version, expires, config)
         return config
     
+    @classmethod
+    def get_version(cls):
+        return versions.get_version(cls.VERSION_KEY)
+    
+    @classmethod
+    def bump_version(cls):
+        """Make every worker reload the configuration on its next use."""
+        versions.bump_version(cls.VERSION_KEY)
+    
     def __str__(self):
         return self.site_name
@@ -0,0 +1,133 @@
+"""
+User report submission and review.
+
+``submit_report`` records a report, deduplicates repeats by the same user,
+bumps the object's ``ReportCounter`` and quarantines a listing once its
+pending reports reach ``REPORT_QUARANTINE_THRESHOLD`` - all in the
+submission transaction, so the admin inbox only ever reads counters.
+"""
+
+from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .choices import AdminActionType, PropertyStatus, ReportStatus
+from .models import AdminActionLog, Report, ReportCounter
+
+
+# content_type -> (model, attribute used as the counter label)
+REPORT_TARGETS = {
+    'property': ('properties.Property', 'title'),
+    'user': ('accounts.User', 'username'),
+    'inquiry': ('inquiries.Inquiry', 'name'),
+}
+
+
+def get_target(content_type, object_id):
+    """The reported object, or None if it does not exist."""
+    if content_type not in REPORT_TARGETS:
+        return None
+    model = apps.get_model(REPORT_TARGETS[content_type][0])
+    try:
+        return model.objects.filter(pk=object_id).first()
+    except (ValueError, ValidationError):
+        return None
+
+
+def get_threshold():
+    return getattr(settings, 'REPORT_QUARANTINE_THRESHOLD', 5)
+
+
+def quarantine(counter, target):
+    """Hide a reported listing from the public until an admin reviews it."""
+    if counter.content_type != 'property' or target.status != PropertyStatus.APPROVED:
+        return False
+    target.status = PropertyStatus.QUARANTINED
+    target.save(update_fields=['status', 'updated_at'])
+    counter.is_quarantined = True
+    counter.quarantined_at = timezone.now()
+    counter.save(update_fields=['is_quarantined', 'quarantined_at'])
+    return True
+
+
+def submit_report(user, content_type, object_id, reason, description=''):
+    """
+    Record ``user``'s report on an object. Returns ``(report, created)``;
+    a repeat report by the same user updates the original and is not
+    counted again. Raises ``ValueError`` for an unknown object.
+    """
+    target = get_target(content_type, object_id)
+    if target is None:
+        raise ValueError(f"Nothing to report: {content_type} {object_id}")
+    object_id = str(target.pk)
+
+    with transaction.atomic():
+        report, created = Report.objects.get_or_create(
+            reported_by=user,
+            content_type=content_type,
+            object_id=object_id,
+            defaults={'reason': reason, 'description': description},
+        )
+        if not created:
+            report.reason = reason
+            report.description = description or report.description
+            report.save(update_fields=['reason', 'description'])
+            return report, False
+
+        label = str(getattr(target, REPORT_TARGETS[content_type][1], ''))[:200]
+        counter, _ = ReportCounter.objects.select_for_update().get_or_create(
+            content_type=content_type, object_id=object_id, defaults={'label': label},
+        )
+        ReportCounter.objects.filter(pk=counter.pk).update(
+            report_count=F('report_count') + 1,
+            pending_count=F('pending_count') + 1,
+            last_reason=reason,
+            last_reported_at=timezone.now(),
+        )
+        counter.refresh_from_db()
+        if counter.pending_count >= get_threshold() and not counter.is_quarantined:
+            quarantine(counter, target)
+
+    return report, True
+
+
+def close_reports(counter, admin, uphold, notes=''):
+    """
+    Close every pending report on ``counter``'s object. Upholding rejects
+    a reported listing; dismissing releases it from quarantine.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        Report.objects.filter(
+            content_type=counter.content_type, object_id=counter.object_id, status=ReportStatus.PENDING,
+        ).update(
+            status=ReportStatus.RESOLVED if uphold else ReportStatus.DISMISSED,
+            reviewed_by=admin,
+            resolved_at=now,
+            admin_notes=notes,
+        )
+
+        target = get_target(counter.content_type, counter.object_id)
+        if counter.content_type == 'property' and target is not None:
+            if uphold and target.status in (PropertyStatus.APPROVED, PropertyStatus.QUARANTINED):
+                target.status = PropertyStatus.REJECTED
+                target.rejection_reason = notes or 'Removed after user reports.'
+                target.save(update_fields=['status', 'rejection_reason', 'updated_at'])
+            elif not uphold and target.status == PropertyStatus.QUARANTINED:
+                target.status = PropertyStatus.APPROVED
+                target.save(update_fields=['status', 'updated_at'])
+
+        counter.pending_count = 0
+        counter.is_quarantined = False
+        counter.save(update_fields=['pending_count', 'is_quarantined'])
+
+        AdminActionLog.objects.create(
+            admin=admin,
+            action_type=AdminActionType.REPORT_RESOLVED if uphold else AdminActionType.REPORT_DISMISSED,
+            content_type=counter.content_type,
+            object_id=counter.object_id,
+            description=notes,
+        )
@@ -0,0 +1,16 @@
+"""
+Signal handlers for the core app.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import SiteConfiguration
+
+
+@receiver(post_save, sender=SiteConfiguration, dispatch_uid='site_configuration_post_save')
+@receiver(post_delete, sender=SiteConfiguration, dispatch_uid='site_configuration_post_delete')
+def reload_site_configuration(sender, **kwargs):
+    """Every worker reloads the configuration once the change is committed."""
+    transaction.on_commit(SiteConfiguration.bump_version)
@@ -0,0 +1,78 @@
+from django.core.cache import cache
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from apps.accounts.models import User
+from apps.core.memo import RequestMemoMiddleware
+from apps.inquiries.models import Inquiry, InquiryMessage
+from apps.properties.models import Property
+
+
+class RequestMemoTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.landlord = User.objects.create_user(username='landlord', password='pass', user_type='LANDLORD')
+        self.tenant = User.objects.create_user(username='tenant', password='pass', user_type='TENANT')
+        self.prop = Property.objects.create(
+            owner=self.landlord, title='Flat', description='Desc', area='Thamel',
+            address='Addr', price_per_month=15000, status='APPROVED',
+        )
+        Property.objects.create(
+            owner=self.landlord, title='Room', description='Desc', area='Thamel',
+            address='Addr', price_per_month=8000, status='PENDING',
+        )
+
+    def in_request(self, view):
+        """Run ``view`` inside the memo middleware, as a page would."""
+        middleware = RequestMemoMiddleware(lambda request: view(request) or HttpResponse())
+        return middleware(RequestFactory().get('/'))
+
+    def test_listing_counts_cost_one_query_per_request(self):
+        def view(request):
+            for _ in range(3):
+                self.assertEqual(self.landlord.properties_count, 2)
+                self.assertEqual(self.landlord.active_properties_count, 1)
+
+        with self.assertNumQueries(1):
+            self.in_request(view)
+        # The next request reuses the cached counts.
+        with self.assertNumQueries(0):
+            self.in_request(view)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.prop.status = 'RENTED'
+            self.prop.save()
+        self.in_request(lambda request: self.assertEqual(self.landlord.active_properties_count, 0))
+
+    def test_unread_badge_is_cached_until_a_message_arrives(self):
+        inquiry = Inquiry.objects.create(
+            rental_property=self.prop, sender=self.tenant, name='Tenant',
+            email='t@example.com', message='Is it available?',
+        )
+        self.client.force_login(self.tenant)
+        url = reverse('inquiries:unread_count')
+        self.assertEqual(self.client.get(url, secure=True).json()['unread_messages'], 0)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url, secure=True)
+        self.assertFalse([q for q in queries if 'inquiries_inquirymessage' in q['sql']])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            InquiryMessage.objects.create(inquiry=inquiry, sender=self.landlord, message='Yes')
+        self.assertEqual(self.client.get(url, secure=True).json()['unread_messages'], 1)
+
+    def test_favorites_are_marked_on_every_listing_page(self):
+        self.client.force_login(self.tenant)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('properties:toggle_favorite', args=[self.prop.pk]), secure=True)
+        for name in ('core:home', 'properties:list'):
+            response = self.client.get(reverse(name), secure=True)
+            self.assertIn(self.prop.pk, response.context['user_favorites'], name)
+        response = self.client.get(reverse('properties:detail', args=[self.prop.pk]), secure=True)
+        self.assertTrue(response.context['is_favorited'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('properties:toggle_favorite', args=[self.prop.pk]), secure=True)
+        response = self.client.get(reverse('properties:list'), secure=True)
+        self.assertNotIn(self.prop.pk, response.context['user_favorites'])
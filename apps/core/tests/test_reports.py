@@ -0,0 +1,82 @@
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from apps.accounts.models import User
+from apps.core.models import Report, ReportCounter, AdminActionLog
+from apps.core.reports import close_reports, submit_report
+from apps.properties.models import Property
+
+
+@override_settings(REPORT_QUARANTINE_THRESHOLD=3)
+class ReportPipelineTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username='admin', password='pass', is_staff=True)
+        self.landlord = User.objects.create_user(username='landlord', password='pass')
+        self.reporters = [User.objects.create_user(username=f'tenant{i}', password='pass') for i in range(3)]
+        self.prop = Property.objects.create(
+            owner=self.landlord, title='Too good to be true', description='Desc', area='Thamel',
+            address='Addr', price_per_month=3000, status='APPROVED',
+        )
+
+    def report(self, user, reason='FRAUD'):
+        return submit_report(user, 'property', self.prop.pk, reason)
+
+    def counter(self):
+        return ReportCounter.objects.get(content_type='property', object_id=str(self.prop.pk))
+
+    def test_repeat_report_is_not_counted(self):
+        self.assertTrue(self.report(self.reporters[0])[1])
+        self.assertFalse(self.report(self.reporters[0], 'SPAM')[1])
+        self.assertEqual(Report.objects.count(), 1)
+        self.assertEqual(Report.objects.get().reason, 'SPAM')
+        self.assertEqual((self.counter().report_count, self.counter().pending_count), (1, 1))
+
+    def test_threshold_quarantines_listing(self):
+        for user in self.reporters[:2]:
+            self.report(user)
+        self.prop.refresh_from_db()
+        self.assertEqual(self.prop.status, 'APPROVED')
+
+        self.report(self.reporters[2])
+        self.prop.refresh_from_db()
+        self.assertEqual(self.prop.status, 'QUARANTINED')
+        self.assertTrue(self.counter().is_quarantined)
+        response = self.client.get(reverse('properties:detail', args=[self.prop.pk]), secure=True)
+        self.assertEqual(response.status_code, 404)
+
+    def test_dismiss_releases_and_uphold_rejects(self):
+        for user in self.reporters:
+            self.report(user)
+        close_reports(self.counter(), self.admin, uphold=False)
+        self.prop.refresh_from_db()
+        self.assertEqual(self.prop.status, 'APPROVED')
+        self.assertEqual(self.counter().pending_count, 0)
+        self.assertFalse(Report.objects.filter(status='PENDING').exists())
+
+        close_reports(self.counter(), self.admin, uphold=True, notes='Scam')
+        self.prop.refresh_from_db()
+        self.assertEqual(self.prop.status, 'REJECTED')
+        self.assertEqual(AdminActionLog.objects.count(), 2)
+
+    def test_report_view_and_inbox(self):
+        self.client.force_login(self.reporters[0])
+        url = reverse('core:report', args=['property', self.prop.pk])
+        response = self.client.post(url, {'reason': 'FRAUD', 'next': '/'}, secure=True)
+        self.assertRedirects(response, '/', fetch_redirect_response=False)
+        response = self.client.post(url, {'reason': 'SPAM', 'next': '/\\evil.com'}, secure=True)
+        self.assertRedirects(response, reverse('core:home'), fetch_redirect_response=False)
+        self.client.post(reverse('core:report', args=['property', 'not-a-uuid']), {'reason': 'FRAUD'}, secure=True)
+        self.assertEqual(Report.objects.count(), 1)
+
+        self.client.force_login(self.admin)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('admin_panel:reports'), secure=True)
+        self.assertFalse([q for q in queries if '"core_report"' in q['sql']])
+        self.assertEqual([c.label for c in response.context['counters']], ['Too good to be true'])
+
+        response = self.client.post(
+            reverse('admin_panel:review_reports', args=[self.counter().pk]),
+            {'action': 'dismiss', 'next': 'https://evil.com/'}, secure=True,
+        )
+        self.assertRedirects(response, reverse('admin_panel:reports'), fetch_redirect_response=False)
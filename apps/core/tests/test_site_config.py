@@ -0,0 +1,52 @@
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from apps.core.models import SiteConfiguration
+
+
+class SiteConfigurationCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        SiteConfiguration._cached = None
+
+    def test_loaded_once_per_process(self):
+        SiteConfiguration.objects.create()
+        with self.assertNumQueries(1):
+            config = SiteConfiguration.get_config()
+        with self.assertNumQueries(0):
+            for _ in range(5):
+                self.assertIs(SiteConfiguration.get_config(), config)
+                self.assertTrue(SiteConfiguration.get_config().registration_open)
+
+    def test_save_reloads_every_worker(self):
+        SiteConfiguration.get_config()
+        # Another worker edits the row through its own instance.
+        with self.captureOnCommitCallbacks(execute=True):
+            edited = SiteConfiguration.objects.get(pk=1)
+            edited.site_name = 'Kotha'
+            edited.save()
+        with self.assertNumQueries(1):
+            self.assertEqual(SiteConfiguration.get_config().site_name, 'Kotha')
+        with self.assertNumQueries(0):
+            SiteConfiguration.get_config()
+
+    def test_local_copy_expires_without_a_shared_cache(self):
+        SiteConfiguration.objects.create()
+        SiteConfiguration.get_config()
+        # A worker whose cache never saw the bump still reloads eventually.
+        SiteConfiguration.objects.update(site_name='Kotha')
+        with self.assertNumQueries(0):
+            self.assertEqual(SiteConfiguration.get_config().site_name, 'HamroKotha')
+        later = time.monotonic() + 31
+        with mock.patch('apps.core.models.time.monotonic', return_value=later), self.assertNumQueries(1):
+            self.assertEqual(SiteConfiguration.get_config().site_name, 'Kotha')
+
+    def test_registration_can_be_closed(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            SiteConfiguration.objects.create(registration_open=False)
+        for name in ('accounts:register_tenant', 'accounts:register_landlord'):
+            response = self.client.get(reverse(name), secure=True)
+            self.assertRedirects(response, reverse('core:home'), fetch_redirect_response=False)
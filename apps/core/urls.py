@@ -13,4 +13,5 @@ urlpatterns = [
     path('contact/', views.ContactView.as_view(), name='contact'),
     path('privacy/', views.PrivacyPolicyView.as_view(), name='privacy'),
     path('terms/', views.TermsView.as_view(), name='terms'),
+    path('report/<str:content_type>/<str:object_id>/', views.ReportView.as_view(), name='report'),
 ]
@@ -5,8 +5,10 @@ Utility functions for HamroKotha platform.
 import re
 from django.core.mail import send_mail
 from django.conf import settings
+from django.shortcuts import redirect
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
+from django.utils.http import url_has_allowed_host_and_scheme
 
 
 def format_npr(amount):
@@ -81,6 +83,20 @@ def format_nepal_phone(phone):
     return phone
 
 
+def normalize_phone(phone):
+    """
+    Canonical E.164 form of a Nepal phone number (+9779812345678,
+    +97714xxxxxx), or '' if it cannot be recognised. Built on
+    format_nepal_phone so both agree on what a number is.
+    """
+    if not phone:
+        return ''
+    formatted = format_nepal_phone(phone).replace('-', '')
+    if re.match(r'^\+977(9\d{9}|1\d{6,7})$', formatted):
+        return formatted
+    return ''
+
+
 def send_email_notification(subject, template_name, context, recipient_list):
     """
     Send email notification using template.
@@ -122,3 +138,16 @@ def generate_property_slug(title, property_id):
     slug = re.sub(r'[^\w\s-]', '', title.lower())
     slug = re.sub(r'[\s_]+', '-', slug)
     return f"{slug}-{property_id}"
+
+
+def redirect_to_next(request, default):
+    """
+    Redirect to the POSTed ``next`` URL when it points back at this site,
+    otherwise to ``default`` (anything ``redirect`` accepts).
+    """
+    next_url = request.POST.get('next', '')
+    if url_has_allowed_host_and_scheme(
+        next_url, allowed_hosts={request.get_host()}, require_https=request.is_secure()
+    ):
+        return redirect(next_url)
+    return redirect(default)
@@ -0,0 +1,39 @@
+"""
+Shared version counters for cache invalidation.
+
+Data cached in many places at once (feed pages, the site configuration,
+buffered view counts) is tied to a version number kept in the default
+cache: readers embed it in their keys or compare it with the version they
+loaded, and a change bumps it instead of finding and deleting every entry.
+Counters start from the clock, so one that is evicted never restarts at a
+number whose entries may still be cached.
+
+A bump only reaches other worker processes through a cache they share
+(see ``CACHES`` in the settings); with the per-process local-memory
+default each worker has its own counters.
+"""
+
+import time
+
+from django.core.cache import cache
+
+
+def get_version(key):
+    """Current value of counter ``key``, starting it if needed."""
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(key):
+    """
+    Advance counter ``key`` and return its new value, or ``None`` if it had
+    been evicted and was started afresh.
+    """
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), None)
+        return None
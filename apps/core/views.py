@@ -2,9 +2,15 @@
 Core app views - Homepage and static pages.
 """
 
-from django.views.generic import TemplateView
+from django.views.generic import TemplateView, View
+from django.contrib import messages
+from django.contrib.auth.mixins import LoginRequiredMixin
 from django.db.models import Count
 
+from .choices import ReportReason
+from .reports import submit_report
+from .utils import redirect_to_next
+
 
 class HomeView(TemplateView):
     """Homepage with featured properties and search."""
@@ -22,6 +28,11 @@ class HomeView(TemplateView):
             status=PropertyStatus.APPROVED
         ).select_related('owner').prefetch_related('images').order_by('-created_at')[:6]
         
+        # Trending properties (score kept current by update_trending_scores)
+        context['trending_properties'] = Property.objects.filter(
+            status=PropertyStatus.APPROVED, trending_score__gt=0
+        ).select_related('owner').prefetch_related('images').order_by('-trending_score')[:6]
+        
         # Property statistics
         context['total_properties'] = Property.objects.filter(
             status=PropertyStatus.APPROVED
@@ -55,3 +66,26 @@ class PrivacyPolicyView(TemplateView):
 class TermsView(TemplateView):
     """Terms of service page."""
     template_name = 'pages/terms.html'
+
+
+class ReportView(LoginRequiredMixin, View):
+    """Report a listing, user or inquiry."""
+    
+    def post(self, request, content_type, object_id):
+        reason = request.POST.get('reason')
+        if reason not in ReportReason.values:
+            messages.error(request, "Please choose a reason for your report.")
+        else:
+            try:
+                _, created = submit_report(
+                    request.user, content_type, object_id, reason,
+                    request.POST.get('description', '').strip()[:2000],
+                )
+            except ValueError:
+                messages.error(request, "The item you tried to report no longer exists.")
+            else:
+                if created:
+                    messages.success(request, "Thank you. Our team will review your report.")
+                else:
+                    messages.info(request, "You have already reported this. We've updated your report.")
+        return redirect_to_next(request, 'core:home')
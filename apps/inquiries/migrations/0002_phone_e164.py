@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inquiries', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='inquiry',
+            name='phone_e164',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='Normalized E.164 phone number', max_length=16),
+        ),
+    ]
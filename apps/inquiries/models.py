@@ -1,10 +1,12 @@
 import uuid
 from django.db import models
 from django.conf import settings
+from apps.core.models import NormalizedPhoneMixin
 from apps.properties.models import Property
+from apps.core.memo import user_fact
 
 
-class Inquiry(models.Model):
+class Inquiry(NormalizedPhoneMixin, models.Model):
     """Inquiry from tenant to landlord about a property."""
     
     STATUS_CHOICES = [
@@ -83,3 +85,22 @@ class InquiryMessage(models.Model):
         if not self.is_read:
             self.is_read = True
             self.save(update_fields=['is_read'])
+
+
+def _count_unread(user):
+    if user.user_type == 'LANDLORD':
+        unread_inquiries = Inquiry.objects.filter(rental_property__owner=user, is_read=False).count()
+        unread_messages = InquiryMessage.objects.filter(
+            inquiry__rental_property__owner=user, is_read=False
+        ).exclude(sender=user).count()
+    else:
+        unread_inquiries = 0
+        unread_messages = InquiryMessage.objects.filter(
+            inquiry__sender=user, is_read=False
+        ).exclude(sender=user).count()
+    return unread_inquiries, unread_messages
+
+
+def unread_counts(user):
+    """``(unread inquiries, unread messages)`` waiting for ``user``."""
+    return user_fact(user.pk, 'unread_inquiries', lambda: _count_unread(user), cached=True)
@@ -0,0 +1,25 @@
+"""
+Signal handlers for the inquiries app.
+"""
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.core.memo import forget_user
+from .models import Inquiry, InquiryMessage
+
+
+def _forget_parties(inquiry):
+    forget_user(inquiry.sender_id, inquiry.rental_property.owner_id)
+
+
+@receiver(post_save, sender=Inquiry, dispatch_uid='user_facts_inquiry_post_save')
+@receiver(post_delete, sender=Inquiry, dispatch_uid='user_facts_inquiry_post_delete')
+def forget_inquiry_counts(sender, instance, **kwargs):
+    """Inquiry and unread counts of the tenant and the landlord."""
+    _forget_parties(instance)
+
+
+@receiver(post_save, sender=InquiryMessage, dispatch_uid='user_facts_inquiry_message_post_save')
+def forget_unread_inquiry_messages(sender, instance, **kwargs):
+    _forget_parties(instance.inquiry)
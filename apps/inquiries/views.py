@@ -6,8 +6,9 @@ from django.http import JsonResponse, HttpResponseForbidden
 from django.db.models import Q, Count
 from django.urls import reverse
 
+from apps.core.memo import forget_user
 from apps.properties.models import Property
-from .models import Inquiry, InquiryMessage
+from .models import Inquiry, InquiryMessage, unread_counts
 from .forms import InquiryForm, InquiryMessageForm
 
 
@@ -150,9 +151,11 @@ class InquiryDetailView(LoginRequiredMixin, DetailView):
             self.object.mark_as_read()
             # Mark all messages from tenant as read
             self.object.messages.filter(sender=self.object.sender).update(is_read=True)
+            forget_user(user.pk)
         elif is_tenant:
             # Mark all messages from landlord as read for tenant
             self.object.messages.filter(sender=self.object.rental_property.owner).update(is_read=True)
+            forget_user(user.pk)
         # Admin just views, no marking as read
         
         return context
@@ -238,23 +241,7 @@ class UnreadCountView(LoginRequiredMixin, View):
     """Get unread inquiry count for navbar."""
     
     def get(self, request):
-        user = request.user
-        
-        if user.user_type == 'LANDLORD':
-            unread_count = Inquiry.objects.filter(
-                rental_property__owner=user,
-                is_read=False
-            ).count()
-            unread_messages = InquiryMessage.objects.filter(
-                inquiry__rental_property__owner=user,
-                is_read=False
-            ).exclude(sender=user).count()
-        else:
-            unread_messages = InquiryMessage.objects.filter(
-                inquiry__sender=user,
-                is_read=False
-            ).exclude(sender=user).count()
-            unread_count = 0
+        unread_count, unread_messages = unread_counts(request.user)
         
         return JsonResponse({
             'unread_inquiries': unread_count,
@@ -5,7 +5,9 @@ Admin configuration for Property models.
 from django.contrib import admin
 from django.utils.html import format_html
 from django.utils import timezone
-from .models import Property, PropertyImage, Favorite, PropertyView
+from .models import Property, PropertyImage, Favorite, PropertyView, MarketRollup
+from .market import mark_queryset_stale
+from apps.services.matching import match_properties, unmatch_properties
 
 
 class PropertyImageInline(admin.TabularInline):
@@ -23,11 +25,14 @@ class PropertyAdmin(admin.ModelAdmin):
     list_display = [
         'title', 'owner_name', 'district', 'area', 
         'property_type', 'price_display', 'status_badge', 
-        'views_count', 'is_flagged', 'created_at'
+        'views_count', 'is_flagged', 'fraud_score', 'created_at'
     ]
     list_filter = ['status', 'district', 'property_type', 'is_featured', 'is_flagged', 'created_at']
     search_fields = ['title', 'description', 'area', 'address', 'owner__username', 'owner__email']
-    readonly_fields = ['id', 'slug', 'views_count', 'inquiries_count', 'created_at', 'updated_at', 'approved_at']
+    readonly_fields = [
+        'id', 'slug', 'views_count', 'inquiries_count', 'created_at', 'updated_at', 'approved_at',
+        'fraud_score', 'fraud_signals', 'fraud_scored_at',
+    ]
     ordering = ['-created_at']
     date_hierarchy = 'created_at'
     inlines = [PropertyImageInline]
@@ -51,6 +56,10 @@ class PropertyAdmin(admin.ModelAdmin):
         ('Status & Moderation', {
             'fields': ('status', 'rejection_reason', 'is_featured', 'approved_at')
         }),
+        ('Fraud Risk', {
+            'fields': ('fraud_score', 'fraud_signals', 'fraud_scored_at'),
+            'classes': ('collapse',)
+        }),
         ('Statistics', {
             'fields': ('views_count', 'inquiries_count')
         }),
@@ -90,11 +99,15 @@ class PropertyAdmin(admin.ModelAdmin):
     
     def approve_properties(self, request, queryset):
         count = queryset.update(status='APPROVED', approved_at=timezone.now())
+        mark_queryset_stale(queryset)
+        match_properties(list(queryset.values_list('pk', flat=True)))
         self.message_user(request, f'{count} properties approved.')
     approve_properties.short_description = 'Approve selected properties'
     
     def reject_properties(self, request, queryset):
+        mark_queryset_stale(queryset)
         count = queryset.update(status='REJECTED')
+        unmatch_properties(list(queryset.values_list('pk', flat=True)))
         self.message_user(request, f'{count} properties rejected.')
     reject_properties.short_description = 'Reject selected properties'
     
@@ -138,3 +151,19 @@ class PropertyViewAdmin(admin.ModelAdmin):
     search_fields = ['property__title', 'user__username', 'ip_address']
     ordering = ['-viewed_at']
     readonly_fields = ['property', 'user', 'ip_address', 'user_agent', 'viewed_at']
+
+
+@admin.register(MarketRollup)
+class MarketRollupAdmin(admin.ModelAdmin):
+    """Read-only admin for the rent-market rollup cube."""
+    
+    list_display = ['district', 'area', 'property_type', 'bedrooms', 'month', 'listing_count', 'price_median', 'is_stale']
+    list_filter = ['district', 'property_type', 'is_stale']
+    search_fields = ['area']
+    ordering = ['district', 'area', 'property_type', 'bedrooms', 'month']
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
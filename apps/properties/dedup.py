@@ -0,0 +1,130 @@
+"""
+Near-duplicate listing text detection.
+
+Every listing's title + description gets a MinHash signature and its LSH
+bands (``ListingSignature`` / ``ListingBand``). Finding near-duplicates of
+a listing is then an indexed lookup on its 16 band buckets followed by an
+exact signature comparison of the few candidates, instead of a scan of the
+whole catalogue.
+"""
+
+from collections import defaultdict
+
+from django.db import transaction
+from django.utils import timezone
+
+from . import minhash
+from .models import Property, ListingSignature, ListingBand
+
+
+# Property fields the signature is built from.
+TEXT_FIELDS = {'title', 'description'}
+
+# Estimated Jaccard similarity at or above which two listings are near-duplicates.
+NEAR_DUPLICATE_SIMILARITY = 0.8
+
+
+def store_signatures(entries):
+    """
+    Save signatures and bands for ``[(property_id, text_hash, signature)]``.
+    A ``None`` signature (empty text) removes the listing from the index.
+    """
+    if not entries:
+        return
+    property_ids = [pk for pk, _, _ in entries]
+    with transaction.atomic():
+        ListingBand.objects.filter(property_id__in=property_ids).delete()
+        ListingSignature.objects.bulk_create(
+            [
+                ListingSignature(property_id=pk, text_hash=digest, signature=minhash.to_bytes(sig))
+                for pk, digest, sig in entries if sig is not None
+            ],
+            update_conflicts=True,
+            unique_fields=['property'],
+            update_fields=['signature', 'text_hash', 'updated_at'],
+        )
+        ListingSignature.objects.filter(
+            property_id__in=[pk for pk, _, sig in entries if sig is None]
+        ).delete()
+        ListingBand.objects.bulk_create(
+            [
+                ListingBand(property_id=pk, band=band, bucket=bucket)
+                for pk, _, sig in entries if sig is not None
+                for band, bucket in enumerate(minhash.bands(sig))
+            ],
+            batch_size=1000,
+        )
+
+
+def near_duplicates(property_ids):
+    """
+    Map each listing in ``property_ids`` to ``[(other_id, other_owner_id, similarity)]``
+    for indexed listings whose text is a near-duplicate of it.
+    """
+    own_bands = defaultdict(set)
+    for pk, band, bucket in ListingBand.objects.filter(
+        property_id__in=property_ids
+    ).values_list('property_id', 'band', 'bucket'):
+        own_bands[pk].add((band, bucket))
+    if not own_bands:
+        return {}
+
+    by_band = defaultdict(set)
+    owners = {}
+    for pk, owner_id, band, bucket in ListingBand.objects.filter(
+        bucket__in={bucket for bands in own_bands.values() for _, bucket in bands}
+    ).values_list('property_id', 'property__owner_id', 'band', 'bucket'):
+        by_band[(band, bucket)].add(pk)
+        owners[pk] = owner_id
+
+    candidates = {
+        pk: {other for key in bands for other in by_band[key]} - {pk}
+        for pk, bands in own_bands.items()
+    }
+    wanted = set(candidates) | {other for others in candidates.values() for other in others}
+    signatures = {
+        pk: minhash.from_bytes(data)
+        for pk, data in ListingSignature.objects.filter(property_id__in=wanted).values_list('property_id', 'signature')
+    }
+
+    result = {}
+    for pk, others in candidates.items():
+        matches = []
+        for other in others:
+            score = minhash.similarity(signatures[pk], signatures[other])
+            if score >= NEAR_DUPLICATE_SIMILARITY:
+                matches.append((other, owners[other], score))
+        if matches:
+            result[pk] = sorted(matches, key=lambda match: -match[2])
+    return result
+
+
+def index_property(instance):
+    """
+    (Re)index a saved listing's text if it changed, and flag it when it
+    near-duplicates another landlord's listing.
+    """
+    digest, sig = minhash.signature_for(instance.title, instance.description)
+    current = ListingSignature.objects.filter(property_id=instance.pk).values_list('text_hash', flat=True).first()
+    if current == digest:
+        return
+    store_signatures([(instance.pk, digest, sig)])
+
+    copies = [
+        (other, score) for other, owner_id, score in near_duplicates([instance.pk]).get(instance.pk, [])
+        if owner_id != instance.owner_id
+    ]
+    if copies:
+        other, score = copies[0]
+        instance.is_flagged = True
+        instance.flag_count = (instance.flag_count or 0) + 1
+        msg = f"Listing text is {score:.0%} similar to property {other}"
+        instance.fraud_reason = ((instance.fraud_reason or '') + '\n' + msg).strip()
+        instance.flagged_at = timezone.now()
+        # update() rather than save() so this does not re-enter the signals.
+        Property.objects.filter(pk=instance.pk).update(
+            is_flagged=True,
+            flag_count=instance.flag_count,
+            fraud_reason=instance.fraud_reason,
+            flagged_at=instance.flagged_at,
+        )
@@ -237,6 +237,7 @@ class PropertyFilterForm(forms.Form):
             ('price_per_month', 'Price: Low to High'),
             ('-price_per_month', 'Price: High to Low'),
             ('-views_count', 'Most Viewed'),
+            ('trending', 'Trending'),
         ],
         required=False,
         initial='-created_at',
@@ -0,0 +1,277 @@
+"""
+Fraud scoring for property listings.
+
+Each listing gets a 0-100 ``fraud_score`` built from independent signals
+(duplicate images, rent far below the local median, phone numbers shared
+between accounts, near-duplicate listing text, brand-new accounts). Scores are
+computed in batches - a handful of queries per batch, never per listing -
+by ``manage.py rescore_fraud`` and stored on ``Property`` so the moderation
+queue can simply ORDER BY them. ``manage.py rescan_images`` backfills image
+hashes and re-runs duplicate-image flagging over the whole catalogue.
+"""
+
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from apps.accounts.models import User
+from .models import Property, PropertyImage, MarketRollup
+from .market import MIN_COMPARABLES, check_price, normalize_area, price_bounds
+from .dedup import near_duplicates
+
+
+BATCH_SIZE = 500
+
+# Points contributed by each signal; the total is capped at 100.
+FRAUD_WEIGHTS = {
+    'duplicate_images': 40,
+    'price_far_below_median': 30,
+    'price_below_median': 15,
+    'shared_phone': 20,
+    'near_duplicate_text': 25,
+    'new_account': 10,
+}
+
+# Rents under this fraction of the local median are mildly suspicious;
+# rents under the robust lower bound (see market.price_bounds) strongly so.
+BELOW_MEDIAN = 0.7
+
+NEW_ACCOUNT_DAYS = 7
+
+
+def duplicate_image_signal(rows):
+    """Listings sharing an image hash with another owner's listing."""
+    own = defaultdict(set)
+    hashes = set()
+    for pk, owner_id, image_hash in PropertyImage.objects.filter(
+        property_id__in=[row['pk'] for row in rows], image_hash__isnull=False
+    ).values_list('property_id', 'property__owner_id', 'image_hash'):
+        own[pk].add((owner_id, image_hash))
+        hashes.add(image_hash)
+
+    owners_by_hash = defaultdict(set)
+    for image_hash, owner_id in PropertyImage.objects.filter(
+        image_hash__in=hashes
+    ).values_list('image_hash', 'property__owner_id').distinct():
+        owners_by_hash[image_hash].add(owner_id)
+
+    hits = {}
+    for pk, images in own.items():
+        shared = sum(1 for owner_id, image_hash in images if owners_by_hash[image_hash] - {owner_id})
+        if shared:
+            hits[pk] = f"{shared} image(s) also used by another landlord"
+    return hits
+
+
+def market_cells(rows):
+    """Cube cells per (district, area, property_type), plus district-level fallbacks."""
+    districts = {row['district'] for row in rows}
+    types = {row['property_type'] for row in rows}
+    cells = MarketRollup.objects.filter(
+        district__in=districts,
+        property_type__in=types,
+        bedrooms=MarketRollup.ALL_BEDROOMS,
+        month=MarketRollup.ALL,
+        listing_count__gte=MIN_COMPARABLES,
+        price_mad__isnull=False,
+        # Free or placeholder rents give a zero median, which bounds nothing.
+        price_median__gt=0,
+    ).filter(
+        area__in={normalize_area(row['area']) for row in rows} | {MarketRollup.ALL}
+    )
+    return {(cell.district, cell.area, cell.property_type): cell for cell in cells}
+
+
+def price_signal(rows):
+    """Listings priced below the robust (median/MAD) bound of comparable listings."""
+    cells = market_cells(rows)
+    hits = {}
+    for row in rows:
+        cell = (
+            cells.get((row['district'], normalize_area(row['area']), row['property_type']))
+            or cells.get((row['district'], MarketRollup.ALL, row['property_type']))
+        )
+        if not cell:
+            continue
+        price = float(row['price_per_month'])
+        ratio = price / float(cell.price_median)
+        if price < price_bounds(cell)[0]:
+            hits[row['pk']] = ('price_far_below_median', f"Rent is {ratio:.0%} of the local median")
+        elif ratio < BELOW_MEDIAN:
+            hits[row['pk']] = ('price_below_median', f"Rent is {ratio:.0%} of the local median")
+    return hits
+
+
+def shared_phone_signal(rows):
+    """Owners whose phone number is registered on more than one account."""
+    phones = {row['owner__phone_e164'] for row in rows if row['owner__phone_e164']}
+    shared = set(
+        User.objects.filter(phone_e164__in=phones).values('phone_e164').annotate(
+            accounts=Count('id')
+        ).filter(accounts__gt=1).values_list('phone_e164', flat=True)
+    )
+    return {
+        row['pk']: "Owner's phone number is used by other accounts"
+        for row in rows if row['owner__phone_e164'] in shared
+    }
+
+
+def near_duplicate_text_signal(rows):
+    """Listings whose title/description nearly matches another owner's listing."""
+    owners = {row['pk']: row['owner_id'] for row in rows}
+    hits = {}
+    for pk, matches in near_duplicates(list(owners)).items():
+        copies = [(other, score) for other, owner_id, score in matches if owner_id != owners[pk]]
+        if copies:
+            hits[pk] = f"Text {copies[0][1]:.0%} similar to {len(copies)} other landlord listing(s)"
+    return hits
+
+
+def new_account_signal(rows, now):
+    """Listings posted from accounts younger than ``NEW_ACCOUNT_DAYS``."""
+    cutoff = now - timedelta(days=NEW_ACCOUNT_DAYS)
+    return {
+        row['pk']: f"Account created {(now - row['owner__date_joined']).days} day(s) ago"
+        for row in rows if row['owner__date_joined'] >= cutoff
+    }
+
+
+def score_rows(rows, now=None):
+    """Return ``{pk: (score, signals)}`` for a batch of listing rows."""
+    now = now or timezone.now()
+    signals = defaultdict(dict)
+
+    for name, hits in [
+        ('duplicate_images', duplicate_image_signal(rows)),
+        ('shared_phone', shared_phone_signal(rows)),
+        ('near_duplicate_text', near_duplicate_text_signal(rows)),
+        ('new_account', new_account_signal(rows, now)),
+    ]:
+        for pk, detail in hits.items():
+            signals[pk][name] = detail
+    for pk, (name, detail) in price_signal(rows).items():
+        signals[pk][name] = detail
+
+    return {
+        row['pk']: (
+            min(100, sum(FRAUD_WEIGHTS[name] for name in signals[row['pk']])),
+            dict(signals[row['pk']]),
+        )
+        for row in rows
+    }
+
+
+ROW_FIELDS = (
+    'pk', 'owner_id', 'owner__date_joined', 'owner__phone_e164',
+    'district', 'area', 'property_type', 'price_per_month',
+)
+
+
+def score_properties(queryset, batch_size=BATCH_SIZE):
+    """Score every listing in ``queryset`` in batches. Returns the count scored."""
+    ids = list(queryset.order_by().values_list('pk', flat=True))
+    scored = 0
+    for start in range(0, len(ids), batch_size):
+        rows = list(Property.objects.filter(pk__in=ids[start:start + batch_size]).values(*ROW_FIELDS))
+        now = timezone.now()
+        results = score_rows(rows, now)
+        updates = [
+            Property(pk=pk, fraud_score=score, fraud_signals=signals, fraud_scored_at=now)
+            for pk, (score, signals) in results.items()
+        ]
+        Property.objects.bulk_update(updates, ['fraud_score', 'fraud_signals', 'fraud_scored_at'])
+        scored += len(updates)
+    return scored
+
+
+def needs_scoring():
+    """Listings never scored, or edited since their last score."""
+    return Property.objects.filter(
+        Q(fraud_scored_at__isnull=True) | Q(updated_at__gt=F('fraud_scored_at'))
+    )
+
+
+def resolve_duplicate_images(dry_run=False, pending=None):
+    """
+    Flag every listing sharing an image with another owner's listing, the
+    way ``PropertyImage.save`` does for new uploads. Duplicates are found
+    with one GROUP BY over ``image_hash``; listings already flagged for a
+    given partner are left alone. Returns the number of listings flagged.
+
+    ``pending`` maps image pks to hashes that have not been saved (those a
+    dry run computed); they take the place of the stored ones, and the
+    images are grouped in memory instead.
+    """
+    by_hash = defaultdict(set)
+    if pending:
+        for image_pk, image_hash, pk, owner_id, username in PropertyImage.objects.values_list(
+            'pk', 'image_hash', 'property_id', 'property__owner_id', 'property__owner__username'
+        ).iterator(chunk_size=2000):
+            image_hash = pending.get(image_pk, image_hash)
+            if image_hash:
+                by_hash[image_hash].add((pk, owner_id, username))
+    else:
+        hashes = PropertyImage.objects.filter(image_hash__isnull=False).exclude(image_hash='').values(
+            'image_hash'
+        ).annotate(owners=Count('property__owner', distinct=True)).filter(owners__gt=1).values_list('image_hash', flat=True)
+
+        for image_hash, pk, owner_id, username in PropertyImage.objects.filter(
+            image_hash__in=hashes
+        ).values_list('image_hash', 'property_id', 'property__owner_id', 'property__owner__username').iterator(chunk_size=2000):
+            by_hash[image_hash].add((pk, owner_id, username))
+
+    messages = defaultdict(list)
+    for listings in by_hash.values():
+        for pk, owner_id, _ in listings:
+            for other, other_owner, username in sorted(listings, key=lambda item: str(item[0])):
+                if other_owner != owner_id:
+                    msg = f"Duplicate image detected with property {other} (owner: {username})"
+                    if msg not in messages[pk]:
+                        messages[pk].append(msg)
+
+    now = timezone.now()
+    flagged = []
+    for prop in Property.objects.filter(pk__in=list(messages)).only('pk', 'flag_count', 'fraud_reason'):
+        new = [msg for msg in messages[prop.pk] if msg not in (prop.fraud_reason or '')]
+        if not new:
+            continue
+        prop.is_flagged = True
+        prop.flag_count = (prop.flag_count or 0) + len(new)
+        prop.fraud_reason = '\n'.join([prop.fraud_reason or ''] + new)
+        prop.flagged_at = now
+        prop.fraud_scored_at = None
+        flagged.append(prop)
+
+    if not dry_run:
+        Property.objects.bulk_update(
+            flagged, ['is_flagged', 'flag_count', 'fraud_reason', 'flagged_at', 'fraud_scored_at'], batch_size=500
+        )
+    return len(flagged)
+
+
+def flag_price_anomaly(prop):
+    """
+    Check a just-submitted listing's rent against comparable listings and
+    flag it when it is anomalously low. Returns the anomaly (or None) so the
+    caller can tell the landlord about an unusually high rent.
+    """
+    anomaly = check_price(prop.district, prop.area, prop.property_type, prop.bedrooms, prop.price_per_month)
+    if anomaly and anomaly['direction'] == 'low':
+        msg = (
+            f"Rent Rs. {prop.price_per_month:,.0f} is below the expected range for "
+            f"{anomaly['comparables']} comparable listings (median Rs. {anomaly['median']:,.0f})"
+        )
+        if msg not in (prop.fraud_reason or ''):
+            prop.is_flagged = True
+            prop.flag_count = (prop.flag_count or 0) + 1
+            prop.fraud_reason = ((prop.fraud_reason or '') + '\n' + msg).strip()
+            prop.flagged_at = timezone.now()
+            Property.objects.filter(pk=prop.pk).update(
+                is_flagged=True,
+                flag_count=prop.flag_count,
+                fraud_reason=prop.fraud_reason,
+                flagged_at=prop.flagged_at,
+            )
+    return anomaly
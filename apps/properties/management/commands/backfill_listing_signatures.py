@@ -0,0 +1,55 @@
+"""
+Build MinHash signatures and LSH bands for existing listings.
+
+Signatures are computed in a process pool; the parent process streams
+listings from the database and writes results back in batches:
+
+    python manage.py backfill_listing_signatures [--all] [--workers 4] [--batch-size 1000]
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from apps.properties import minhash
+from apps.properties.dedup import store_signatures
+from apps.properties.models import Property
+
+
+class Command(BaseCommand):
+    help = 'Compute near-duplicate text signatures for listings that lack one (or, with --all, every listing).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help='Recompute signatures for every listing.')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        queryset = Property.objects.order_by()
+        if not options['all']:
+            queryset = queryset.filter(text_signature__isnull=True)
+        rows = queryset.values_list('pk', 'title', 'description').iterator(chunk_size=options['batch_size'])
+
+        done = 0
+        with ProcessPoolExecutor(max_workers=options['workers']) as pool:
+            batch = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= options['batch_size']:
+                    done += self.process(pool, batch)
+                    batch = []
+            if batch:
+                done += self.process(pool, batch)
+
+        self.stdout.write(self.style.SUCCESS(f"Signatures built for {done} listings."))
+
+    def process(self, pool, batch):
+        # Workers get only the model-free minhash module, so any start method works.
+        results = pool.map(
+            minhash.signature_for, [title for _, title, _ in batch], [description for _, _, description in batch],
+            chunksize=64,
+        )
+        store_signatures([(pk, digest, sig) for (pk, _, _), (digest, sig) in zip(batch, results)])
+        self.stdout.write(f"  {len(batch)} listings indexed")
+        return len(batch)
@@ -0,0 +1,102 @@
+"""
+Move property images into content-addressed storage, deduplicating them.
+
+Every image still stored under its upload path is copied to its
+content-addressed name (only once per distinct file), the row is pointed
+at it, and the old file is deleted. MediaBlob reference counts are then
+rebuilt from a single GROUP BY:
+
+    python manage.py dedupe_media [--dry-run] [--batch-size 500]
+"""
+
+from django.core.files import File
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from apps.properties.models import MediaBlob, PropertyImage
+from apps.properties.storage import BLOB_PREFIX, blob_name, hash_image_file, is_blob_name
+
+
+class Command(BaseCommand):
+    help = 'Deduplicate property images into content-addressed storage and rebuild reference counts.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Report savings without changing anything.')
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        storage = PropertyImage._meta.get_field('image').storage
+        rows = PropertyImage.objects.order_by('pk').values_list('pk', 'image', 'image_hash')
+
+        seen, old_names, batch = set(), set(), []
+        moved = missing = saved_bytes = 0
+        for pk, name, digest in rows.iterator(chunk_size=options['batch_size']):
+            if not name or is_blob_name(name):
+                continue
+            digest = digest or hash_image_file(name)
+            if not digest or not storage.exists(name):
+                missing += 1
+                continue
+            new_name = blob_name(digest, name)
+            if new_name in seen or storage.exists(new_name):
+                saved_bytes += storage.size(name)
+            elif not dry_run:
+                with storage.open(name, 'rb') as handle:
+                    new_name = storage.save(name, File(handle, name))
+            seen.add(new_name)
+            old_names.add(name)
+            batch.append(PropertyImage(pk=pk, image=new_name, image_hash=digest))
+            moved += 1
+            if len(batch) >= options['batch_size']:
+                self.flush(batch, dry_run)
+                self.stdout.write(f"  {moved} images moved")
+                batch = []
+        self.flush(batch, dry_run)
+
+        prefix = '[dry run] ' if dry_run else ''
+        if not dry_run:
+            still_used = set(PropertyImage.objects.filter(image__in=old_names).values_list('image', flat=True))
+            for name in old_names - still_used:
+                storage.delete(name)
+            self.rebuild_counts(storage)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{prefix}{moved} images moved into {len(seen)} blobs, {missing} files missing, "
+            f"{saved_bytes / (1024 * 1024):.1f} MB of duplicates freed."
+        ))
+
+    def flush(self, batch, dry_run):
+        if batch and not dry_run:
+            PropertyImage.objects.bulk_update(batch, ['image', 'image_hash'])
+
+    def rebuild_counts(self, storage):
+        """Recompute every MediaBlob.ref_count and remove unreferenced blobs."""
+        counts = dict(
+            PropertyImage.objects.filter(image__startswith=BLOB_PREFIX + '/').values('image').annotate(
+                refs=Count('id')
+            ).values_list('image', 'refs')
+        )
+        existing = set(MediaBlob.objects.values_list('name', flat=True))
+        with transaction.atomic():
+            MediaBlob.objects.update(ref_count=0)
+            MediaBlob.objects.bulk_create(
+                [
+                    MediaBlob(
+                        name=name,
+                        sha256=name.rsplit('/', 1)[-1].split('.')[0],
+                        size=storage.size(name) if name not in existing and storage.exists(name) else 0,
+                        ref_count=refs,
+                    )
+                    for name, refs in counts.items()
+                ],
+                batch_size=500,
+                update_conflicts=True,
+                unique_fields=['name'],
+                update_fields=['ref_count'],
+            )
+            orphans = list(MediaBlob.objects.filter(ref_count=0).values_list('name', flat=True))
+            MediaBlob.objects.filter(ref_count=0).delete()
+        for name in orphans:
+            storage.delete(name)
@@ -0,0 +1,28 @@
+"""
+Recompute the rent-market rollup cube.
+
+Run periodically (e.g. every 15 minutes from cron) to refresh cells that
+property changes marked stale; pass --full to rebuild everything:
+
+    python manage.py rebuild_market_rollup [--full]
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.properties.market import rebuild_all, rebuild_stale
+
+
+class Command(BaseCommand):
+    help = 'Recompute stale (or, with --full, all) rent-market rollup cells.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true', help='Rebuild the whole cube from scratch.')
+
+    def handle(self, *args, **options):
+        if options['full']:
+            updated, deleted = rebuild_all()
+        else:
+            updated, deleted = rebuild_stale()
+        self.stdout.write(self.style.SUCCESS(
+            f"Market rollup rebuilt: {updated} cells updated, {deleted} empty cells removed."
+        ))
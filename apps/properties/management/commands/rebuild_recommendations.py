@@ -0,0 +1,32 @@
+"""
+Rebuild the item-to-item neighbour lists behind tenant recommendations.
+
+Run nightly from cron; favorites, views and inquiries from the last
+--days days are streamed from the database and folded into a sparse
+co-occurrence matrix in chunks of --chunk-size pairs:
+
+    python manage.py rebuild_recommendations [--days 180] [--top-k 20] [--chunk-size 1000000]
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from apps.properties.recommendations import CHUNK_SIZE, TOP_K, WINDOW, rebuild
+
+
+class Command(BaseCommand):
+    help = 'Recompute co-occurrence neighbours for every listing from recent tenant activity.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=WINDOW.days, help='How much activity history to use.')
+        parser.add_argument('--top-k', type=int, default=TOP_K, help='Neighbours stored per listing.')
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='Pairs buffered before merging.')
+
+    def handle(self, *args, **options):
+        written = rebuild(
+            top_k=options['top_k'],
+            window=timedelta(days=options['days']),
+            chunk_size=options['chunk_size'],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Stored {written} co-occurrence links."))
@@ -0,0 +1,24 @@
+"""
+Recompute the "similar properties" shown on listing detail pages.
+
+Run periodically (e.g. nightly from cron); neighbours of every approved
+listing are rebuilt from scratch in batches:
+
+    python manage.py rebuild_similar_properties [--top-k 8] [--batch-size 500]
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.properties.similarity import BATCH_SIZE, TOP_K, rebuild
+
+
+class Command(BaseCommand):
+    help = 'Precompute the nearest neighbours of every approved listing.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top-k', type=int, default=TOP_K, help='Neighbours stored per listing.')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        written = rebuild(top_k=options['top_k'], batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Stored {written} similar-property links."))
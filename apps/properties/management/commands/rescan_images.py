@@ -0,0 +1,104 @@
+"""
+Rescan every property image for duplicate-image fraud.
+
+Missing hashes (or, with --rehash, all of them) are computed by streaming
+files in a process pool; duplicates are then resolved with a single
+GROUP BY on image_hash (a dry run, which saves no hashes, groups the ones
+it computed in memory instead). Progress is checkpointed after each batch so an
+interrupted run continues where it stopped:
+
+    python manage.py rescan_images [--rehash] [--workers 4] [--batch-size 500]
+                                   [--checkpoint PATH] [--restart] [--dry-run]
+"""
+
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from apps.properties.fraud import resolve_duplicate_images
+from apps.properties.models import Property, PropertyImage
+from apps.properties.storage import hash_image_file
+
+
+DEFAULT_CHECKPOINT = os.path.join(tempfile.gettempdir(), 'hamrokotha-rescan-images.json')
+
+
+class Command(BaseCommand):
+    help = 'Hash unhashed property images in parallel and flag duplicate images across owners.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rehash', action='store_true', help='Recompute every hash, not just missing ones.')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--checkpoint', default=DEFAULT_CHECKPOINT, help='File recording the last image processed.')
+        parser.add_argument('--restart', action='store_true', help='Ignore an existing checkpoint.')
+        parser.add_argument('--dry-run', action='store_true', help='Report what would change without writing.')
+
+    def handle(self, *args, **options):
+        self.dry_run = options['dry_run']
+        self.pending = {}
+        checkpoint = options['checkpoint']
+        last_pk = 0 if options['restart'] else self.load_checkpoint(checkpoint)
+        if last_pk:
+            self.stdout.write(f"Resuming after image {last_pk}")
+
+        queryset = PropertyImage.objects.filter(pk__gt=last_pk).order_by('pk')
+        if not options['rehash']:
+            queryset = queryset.filter(Q(image_hash__isnull=True) | Q(image_hash=''))
+        total = queryset.count()
+        rows = queryset.values_list('pk', 'property_id', 'image').iterator(chunk_size=options['batch_size'])
+
+        done = changed = missing = 0
+        with ProcessPoolExecutor(max_workers=options['workers']) as pool:
+            batch = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= options['batch_size']:
+                    c, m = self.process(pool, batch, checkpoint)
+                    done, changed, missing = done + len(batch), changed + c, missing + m
+                    self.stdout.write(f"  {done}/{total} images hashed")
+                    batch = []
+            if batch:
+                c, m = self.process(pool, batch, checkpoint)
+                done, changed, missing = done + len(batch), changed + c, missing + m
+                self.stdout.write(f"  {done}/{total} images hashed")
+
+        flagged = resolve_duplicate_images(dry_run=self.dry_run, pending=self.pending)
+        if not self.dry_run and os.path.exists(checkpoint):
+            os.remove(checkpoint)
+
+        prefix = '[dry run] ' if self.dry_run else ''
+        self.stdout.write(self.style.SUCCESS(
+            f"{prefix}{done} images scanned, {changed} hashes updated, {missing} files missing, "
+            f"{flagged} listings flagged for duplicate images."
+        ))
+
+    def process(self, pool, batch, checkpoint):
+        hashes = list(pool.map(hash_image_file, [name for _, _, name in batch], chunksize=16))
+        updates = [
+            PropertyImage(pk=pk, image_hash=digest)
+            for (pk, _, _), digest in zip(batch, hashes) if digest
+        ]
+        if not self.dry_run:
+            PropertyImage.objects.bulk_update(updates, ['image_hash'], batch_size=500)
+            # Listings whose images changed need a fresh fraud score.
+            Property.objects.filter(pk__in={prop for (_, prop, _) in batch}).update(fraud_scored_at=None)
+            self.save_checkpoint(checkpoint, batch[-1][0])
+        else:
+            self.pending.update((image.pk, image.image_hash) for image in updates)
+        return len(updates), hashes.count(None)
+
+    def load_checkpoint(self, path):
+        try:
+            with open(path) as handle:
+                return json.load(handle)['last_pk']
+        except (OSError, ValueError, KeyError):
+            return 0
+
+    def save_checkpoint(self, path, last_pk):
+        with open(path, 'w') as handle:
+            json.dump({'last_pk': last_pk}, handle)
@@ -0,0 +1,27 @@
+"""
+Recompute listing fraud scores.
+
+Run periodically (e.g. every 10 minutes from cron) to score new and edited
+listings; run with --all nightly so scores also pick up signals that come
+from other listings (a later copy of an image or description):
+
+    python manage.py rescore_fraud [--all] [--batch-size 500]
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.properties.fraud import BATCH_SIZE, needs_scoring, score_properties
+from apps.properties.models import Property
+
+
+class Command(BaseCommand):
+    help = 'Recompute fraud scores for new/edited (or, with --all, every) listing.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help='Rescore every listing.')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        queryset = Property.objects.all() if options['all'] else needs_scoring()
+        scored = score_properties(queryset, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Fraud scores updated for {scored} listings."))
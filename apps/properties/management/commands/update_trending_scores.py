@@ -0,0 +1,25 @@
+"""
+Refresh the time-decayed trending score of every listing.
+
+Run periodically (e.g. every 10 minutes from cron); each run only folds in
+the views, favorites and inquiries recorded since the previous one. Pass
+--full to rebuild scores from the recent event window:
+
+    python manage.py update_trending_scores [--full] [--batch-size N]
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.properties.trending import BATCH_SIZE, update_trending_scores
+
+
+class Command(BaseCommand):
+    help = 'Decay trending scores and add activity recorded since the last run.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true', help='Rebuild scores from the recent event window.')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        updated = update_trending_scores(full=options['full'], batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Trending scores updated for {updated} listings."))
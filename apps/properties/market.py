@@ -0,0 +1,314 @@
+"""
+Rent-market rollup cube.
+
+``MarketRollup`` holds listing counts and rent percentiles for every
+combination of location level (all / district / district + area),
+property type, bedrooms and month. Property saves only mark the affected
+cells stale (see ``apps.properties.signals``); ``rebuild_stale`` recomputes
+them in batches with NumPy and is run by ``manage.py rebuild_market_rollup``.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from decimal import Decimal
+from itertools import product
+
+import numpy as np
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.core.choices import PropertyStatus
+from .models import Property, MarketRollup
+
+
+# Listings that reflect the rental market.
+MARKET_STATUSES = [PropertyStatus.APPROVED, PropertyStatus.RENTED]
+
+# Property fields that move a listing between cells or change its stats.
+CUBE_FIELDS = {'district', 'area', 'property_type', 'bedrooms', 'price_per_month', 'area_sq_ft', 'status'}
+
+# Dimension sets kept at detail level; everything else is rolled up.
+# Area only makes sense within a district, so it is never kept alone.
+GROUPINGS = [
+    location + kind + beds + month
+    for location, kind, beds, month in product(
+        [(), ('district',), ('district', 'area')],
+        [(), ('property_type',)],
+        [(), ('bedrooms',)],
+        [(), ('month',)],
+    )
+]
+
+ROW_FIELDS = ('district', 'area', 'property_type', 'bedrooms', 'created_at', 'price_per_month', 'area_sq_ft')
+
+CHUNK_SIZE = 100
+
+# Robust price bounds: median +/- ANOMALY_THRESHOLD * MAD_SCALE * MAD, where
+# MAD_SCALE makes the MAD comparable to a standard deviation. When every
+# comparable has the same rent (MAD 0) a band of MIN_SPREAD * median is used.
+ANOMALY_THRESHOLD = 3.5
+MAD_SCALE = 1.4826
+MIN_SPREAD = 0.1
+# Cells with fewer listings than this give no reliable bounds.
+MIN_COMPARABLES = 5
+
+
+def normalize_area(area):
+    return (area or '').strip().title()
+
+
+def listing_month(created_at):
+    return timezone.localtime(created_at).strftime('%Y-%m')
+
+
+def listing_dims(district, area, property_type, bedrooms, created_at):
+    """Full-detail cube coordinates of a listing."""
+    return {
+        'district': district,
+        'area': normalize_area(area),
+        'property_type': property_type,
+        'bedrooms': bedrooms,
+        'month': listing_month(created_at),
+    }
+
+
+def cell_key(dims, grouping):
+    """Coordinates of the cell ``dims`` falls into under ``grouping``."""
+    return tuple(
+        dims[name] if name in grouping
+        else (MarketRollup.ALL_BEDROOMS if name == 'bedrooms' else MarketRollup.ALL)
+        for name in MarketRollup.DIMENSIONS
+    )
+
+
+def grouping_of(key):
+    """Inverse of ``cell_key``: which dimensions a cell keeps."""
+    return tuple(
+        name for name, value in zip(MarketRollup.DIMENSIONS, key)
+        if value not in (MarketRollup.ALL, MarketRollup.ALL_BEDROOMS)
+    )
+
+
+def mark_stale(dims_list):
+    """Flag every cell touched by the given listing coordinates."""
+    keys = {cell_key(dims, grouping) for dims in dims_list for grouping in GROUPINGS}
+    MarketRollup.objects.bulk_create(
+        [MarketRollup(**dict(zip(MarketRollup.DIMENSIONS, key)), is_stale=True) for key in keys],
+        update_conflicts=True,
+        unique_fields=list(MarketRollup.DIMENSIONS),
+        update_fields=['is_stale'],
+    )
+
+
+def mark_queryset_stale(queryset):
+    """
+    ``mark_stale`` for listings changed with ``QuerySet.update()``, which
+    bypasses model signals. Call it before and/or after the update.
+    """
+    rows = queryset.values_list('district', 'area', 'property_type', 'bedrooms', 'created_at')
+    dims = [listing_dims(*row) for row in rows.iterator(chunk_size=2000)]
+    if dims:
+        mark_stale(dims)
+
+
+def _month_range(month):
+    year, mon = (int(part) for part in month.split('-'))
+    start = datetime(year, mon, 1)
+    end = datetime(year + mon // 12, mon % 12 + 1, 1)
+    return timezone.make_aware(start), timezone.make_aware(end)
+
+
+def _cell_filter(key):
+    lookup = Q()
+    for name, value in zip(MarketRollup.DIMENSIONS, key):
+        if value in (MarketRollup.ALL, MarketRollup.ALL_BEDROOMS):
+            continue
+        if name == 'month':
+            start, end = _month_range(value)
+            lookup &= Q(created_at__gte=start, created_at__lt=end)
+        elif name == 'area':
+            lookup &= Q(area__iexact=value)
+        else:
+            lookup &= Q(**{name: value})
+    return lookup
+
+
+def _market_rows(lookup=None):
+    queryset = Property.objects.filter(status__in=MARKET_STATUSES)
+    if lookup is not None:
+        queryset = queryset.filter(lookup)
+    return queryset.values_list(*ROW_FIELDS).iterator(chunk_size=2000)
+
+
+def compute_stats(prices, sqft):
+    """Rent statistics for one cell from raw price and area samples."""
+    prices = np.asarray(prices, dtype=np.float64)
+    p25, median, p75 = np.percentile(prices, [25, 50, 75])
+    stats = {
+        'listing_count': int(prices.size),
+        'price_p25': p25,
+        'price_median': median,
+        'price_p75': p75,
+        'price_mean': prices.mean(),
+        'price_mad': np.median(np.abs(prices - median)),
+        'sqft_count': 0,
+        'price_per_sqft_median': None,
+    }
+
+    sqft = np.asarray(sqft, dtype=np.float64)
+    has_area = sqft > 0
+    if has_area.any():
+        stats['sqft_count'] = int(has_area.sum())
+        stats['price_per_sqft_median'] = np.median(prices[has_area] / sqft[has_area])
+
+    return {
+        name: Decimal(f'{value:.2f}') if isinstance(value, float) else value
+        for name, value in stats.items()
+    }
+
+
+def _accumulate(rows, groupings, wanted=None):
+    samples = defaultdict(lambda: ([], []))
+    for district, area, property_type, bedrooms, created_at, price, area_sq_ft in rows:
+        dims = listing_dims(district, area, property_type, bedrooms, created_at)
+        for grouping in groupings:
+            key = cell_key(dims, grouping)
+            if wanted is None or key in wanted:
+                prices, sqft = samples[key]
+                prices.append(float(price))
+                sqft.append(area_sq_ft or 0)
+    return samples
+
+
+def _store(samples, stale_keys=()):
+    cells = [
+        MarketRollup(**dict(zip(MarketRollup.DIMENSIONS, key)), is_stale=False, **compute_stats(*values))
+        for key, values in samples.items()
+    ]
+    stat_fields = [
+        'listing_count', 'price_p25', 'price_median', 'price_p75', 'price_mean', 'price_mad',
+        'sqft_count', 'price_per_sqft_median', 'is_stale', 'updated_at',
+    ]
+    MarketRollup.objects.bulk_create(
+        cells,
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=list(MarketRollup.DIMENSIONS),
+        update_fields=stat_fields,
+    )
+
+    # Stale cells that no longer contain any listing.
+    empty = [key for key in stale_keys if key not in samples]
+    for start in range(0, len(empty), CHUNK_SIZE):
+        lookup = Q()
+        for key in empty[start:start + CHUNK_SIZE]:
+            lookup |= Q(**dict(zip(MarketRollup.DIMENSIONS, key)))
+        MarketRollup.objects.filter(lookup).delete()
+    return len(cells), len(empty)
+
+
+def rebuild_stale():
+    """
+    Recompute stale cells. Listings are fetched once per grouping with a
+    filter covering that grouping's stale cells, in chunks.
+    Returns ``(updated, deleted)`` cell counts.
+    """
+    by_grouping = defaultdict(list)
+    for key in MarketRollup.objects.filter(is_stale=True).values_list(*MarketRollup.DIMENSIONS):
+        by_grouping[grouping_of(key)].append(key)
+
+    updated = deleted = 0
+    for grouping, keys in by_grouping.items():
+        for start in range(0, len(keys), CHUNK_SIZE):
+            chunk = keys[start:start + CHUNK_SIZE]
+            lookup = Q()
+            for key in chunk:
+                lookup |= _cell_filter(key)
+            samples = _accumulate(_market_rows(lookup), [grouping], wanted=set(chunk))
+            stored, removed = _store(samples, chunk)
+            updated += stored
+            deleted += removed
+    return updated, deleted
+
+
+def rebuild_all():
+    """Drop and recompute the whole cube from a single pass over listings."""
+    samples = _accumulate(_market_rows(), GROUPINGS)
+    MarketRollup.objects.all().delete()
+    updated, _ = _store(samples)
+    return updated, 0
+
+
+def suggest_price(district, area=None, property_type=None, bedrooms=None, min_listings=3):
+    """
+    Find the most specific cube cell with at least ``min_listings`` listings
+    for a prospective listing, falling back to coarser slices.
+    """
+    area = normalize_area(area) or None
+    candidates = [
+        dict(district=district, area=area, property_type=property_type, bedrooms=bedrooms),
+        dict(district=district, area=area, property_type=property_type),
+        dict(district=district, property_type=property_type, bedrooms=bedrooms),
+        dict(district=district, property_type=property_type),
+        dict(district=district),
+    ]
+    for candidate in candidates:
+        if any(candidate.get(name) is None for name in ('area', 'property_type', 'bedrooms') if name in candidate):
+            continue
+        cell = MarketRollup.objects.cell(**candidate)
+        if cell and cell.listing_count >= min_listings:
+            return cell
+    return None
+
+
+def price_bounds(cell):
+    """
+    ``(low, high)`` rents outside which a listing in ``cell`` is anomalous.
+    Only meaningful for a positive median; callers skip other cells.
+    """
+    median = float(cell.price_median)
+    spread = max(ANOMALY_THRESHOLD * MAD_SCALE * float(cell.price_mad or 0), MIN_SPREAD * median)
+    return median - spread, median + spread
+
+
+def check_price(district, area, property_type, bedrooms, price):
+    """
+    Compare a rent against comparable listings. Reads at most four cube
+    cells in one indexed query, so it is constant-time however large the
+    catalogue. Returns ``None`` when the price is within bounds (or there are
+    too few comparables), else a dict describing the anomaly.
+    """
+    area = normalize_area(area) or None
+    candidates = [
+        dict(district=district, area=area, property_type=property_type, bedrooms=bedrooms),
+        dict(district=district, area=area, property_type=property_type),
+        dict(district=district, property_type=property_type, bedrooms=bedrooms),
+        dict(district=district, property_type=property_type),
+    ]
+    lookups = [MarketRollup.cell_lookup(**candidate) for candidate in candidates if candidate.get('area', '') is not None]
+    query = Q()
+    for lookup in lookups:
+        query |= Q(**lookup)
+    cells = {
+        tuple(getattr(cell, name) for name in MarketRollup.DIMENSIONS): cell
+        for cell in MarketRollup.objects.filter(
+            query, listing_count__gte=MIN_COMPARABLES, price_mad__isnull=False, price_median__gt=0,
+        )
+    }
+
+    for lookup in lookups:
+        cell = cells.get(tuple(lookup[name] for name in MarketRollup.DIMENSIONS))
+        if cell is None:
+            continue
+        low, high = price_bounds(cell)
+        price = float(price)
+        if low <= price <= high:
+            return None
+        return {
+            'direction': 'low' if price < low else 'high',
+            'median': float(cell.price_median),
+            'low': low,
+            'high': high,
+            'comparables': cell.listing_count,
+        }
+    return None
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0002_add_fraud_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MarketRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('district', models.CharField(max_length=20)),
+                ('area', models.CharField(max_length=100)),
+                ('property_type', models.CharField(max_length=20)),
+                ('bedrooms', models.SmallIntegerField()),
+                ('month', models.CharField(help_text="YYYY-MM of listing creation, or '*'", max_length=7)),
+                ('listing_count', models.PositiveIntegerField(default=0)),
+                ('price_p25', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('price_median', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('price_p75', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('price_mean', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('sqft_count', models.PositiveIntegerField(default=0)),
+                ('price_per_sqft_median', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('is_stale', models.BooleanField(db_index=True, default=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Market Rollup',
+                'verbose_name_plural': 'Market Rollups',
+                'indexes': [models.Index(fields=['property_type', 'bedrooms', 'month'], name='properties__propert_ec1683_idx')],
+                'constraints': [models.UniqueConstraint(fields=('district', 'area', 'property_type', 'bedrooms', 'month'), name='unique_market_rollup_cell')],
+            },
+        ),
+    ]
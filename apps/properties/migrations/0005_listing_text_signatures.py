@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0004_property_fraud_score'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ListingSignature',
+            fields=[
+                ('property', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='text_signature', serialize=False, to='properties.property')),
+                ('signature', models.BinaryField()),
+                ('text_hash', models.CharField(help_text='SHA-1 of the normalized text the signature was built from', max_length=40)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ListingBand',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('band', models.PositiveSmallIntegerField()),
+                ('bucket', models.BigIntegerField()),
+                ('property', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='text_bands', to='properties.property')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['bucket', 'band'], name='properties__bucket_9c8975_idx')],
+                'constraints': [models.UniqueConstraint(fields=('property', 'band'), name='unique_listing_band')],
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:25
+
+from django.db import migrations, models
+
+
+def mark_cells_stale(apps, schema_editor):
+    # Existing cells have no MAD yet; the next rebuild_market_rollup fills it in.
+    apps.get_model('properties', 'MarketRollup').objects.update(is_stale=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0005_listing_text_signatures'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='marketrollup',
+            name='price_mad',
+            field=models.DecimalField(blank=True, decimal_places=2, help_text='Median absolute deviation of rent', max_digits=10, null=True),
+        ),
+        migrations.RunPython(mark_cells_stale, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0006_market_rollup_price_mad'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='property',
+            name='status',
+            field=models.CharField(choices=[('PENDING', 'Pending Approval'), ('APPROVED', 'Approved'), ('REJECTED', 'Rejected'), ('RENTED', 'Rented Out'), ('QUARANTINED', 'Quarantined (Reported)')], default='PENDING', max_length=20),
+        ),
+    ]
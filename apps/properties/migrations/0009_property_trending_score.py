@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0008_content_addressed_media'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='property',
+            name='trending_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='property',
+            name='trending_updated_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['status', '-trending_score'], name='properties__status_cc1bb8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='propertyview',
+            index=models.Index(fields=['viewed_at'], name='properties__viewed__5e41de_idx'),
+        ),
+    ]
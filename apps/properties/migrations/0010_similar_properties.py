@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0009_property_trending_score'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SimilarProperty',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField(help_text='1 is the closest neighbour')),
+                ('score', models.FloatField(help_text='Similarity in (0, 1]')),
+                ('property', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similar_links', to='properties.property')),
+                ('similar', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similar_to', to='properties.property')),
+            ],
+            options={
+                'verbose_name': 'Similar Property',
+                'verbose_name_plural': 'Similar Properties',
+                'ordering': ['property', 'rank'],
+                'constraints': [models.UniqueConstraint(fields=('property', 'rank'), name='unique_similar_property_rank')],
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0010_similar_properties'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PropertyCoOccurrence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField(help_text='1 is the strongest association')),
+                ('score', models.FloatField(help_text="Cosine similarity of the two listings' audiences")),
+                ('property', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='co_occurrences', to='properties.property')),
+                ('related', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='properties.property')),
+            ],
+            options={
+                'verbose_name': 'Property Co-occurrence',
+                'verbose_name_plural': 'Property Co-occurrences',
+                'ordering': ['property', 'rank'],
+                'constraints': [models.UniqueConstraint(fields=('property', 'rank'), name='unique_property_co_occurrence_rank')],
+            },
+        ),
+    ]
@@ -0,0 +1,86 @@
+"""
+MinHash signatures and LSH banding for listing text.
+
+Pure functions with no database access, so they can run in worker
+processes (see ``manage.py backfill_listing_signatures``). With
+``NUM_PERM = BANDS * ROWS = 16 * 8`` two listings become LSH candidates
+with probability ~0.5 at Jaccard similarity 0.7 and ~0.97 at 0.85.
+"""
+
+import hashlib
+import re
+import zlib
+
+import numpy as np
+
+
+NUM_PERM = 128
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_WORDS = 3
+
+# Universal hashing (a * x + b) mod p with p = 2**61 - 1. As in datasketch,
+# a * x is allowed to wrap around in uint64; the result still mixes well.
+_PRIME = np.uint64((1 << 61) - 1)
+_rng = np.random.RandomState(20240601)
+_A = _rng.randint(1, (1 << 61) - 1, size=NUM_PERM, dtype=np.uint64)
+_B = _rng.randint(0, (1 << 61) - 1, size=NUM_PERM, dtype=np.uint64)
+
+_WORD_RE = re.compile(r'\w+')
+
+
+def normalize_text(title, description):
+    return ' '.join(_WORD_RE.findall(f"{title or ''} {description or ''}".lower()))
+
+
+def text_hash(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def shingles(text):
+    """Stable 32-bit hashes of overlapping ``SHINGLE_WORDS``-word windows."""
+    words = text.split()
+    if len(words) <= SHINGLE_WORDS:
+        windows = [' '.join(words)] if words else []
+    else:
+        windows = [' '.join(words[i:i + SHINGLE_WORDS]) for i in range(len(words) - SHINGLE_WORDS + 1)]
+    return np.fromiter({zlib.crc32(window.encode('utf-8')) for window in windows}, dtype=np.uint64)
+
+
+def signature(text):
+    """MinHash signature (``NUM_PERM`` uint32) of normalized ``text``, or None if empty."""
+    values = shingles(text)
+    if not values.size:
+        return None
+    hashed = (_A[:, None] * values[None, :] + _B[:, None]) % _PRIME
+    return (hashed.min(axis=1) & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+
+
+def bands(sig):
+    """LSH bucket of each band, as signed 64-bit ints for a BigIntegerField."""
+    return [
+        int.from_bytes(
+            hashlib.blake2b(sig[band * ROWS:(band + 1) * ROWS].tobytes(), digest_size=8).digest(),
+            'big', signed=True,
+        )
+        for band in range(BANDS)
+    ]
+
+
+def similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of the two shingle sets."""
+    return float(np.mean(sig_a == sig_b))
+
+
+def to_bytes(sig):
+    return sig.astype('<u4').tobytes()
+
+
+def from_bytes(data):
+    return np.frombuffer(bytes(data), dtype='<u4')
+
+
+def signature_for(title, description):
+    """``(text_hash, signature)`` for a listing; worker-process entry point."""
+    text = normalize_text(title, description)
+    return text_hash(text), signature(text)
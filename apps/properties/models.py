@@ -8,6 +8,8 @@ from django.urls import reverse
 from django.utils.text import slugify
 from django.utils import timezone
 from apps.core.choices import District, PropertyType, PropertyStatus, AMENITIES
+from apps.core.memo import user_fact
+from .storage import property_image_storage
 import uuid
 import hashlib
 
@@ -96,10 +98,17 @@ class Property(models.Model):
     fraud_reason = models.TextField(blank=True, null=True)
     flag_count = models.PositiveIntegerField(default=0)
     flagged_at = models.DateTimeField(blank=True, null=True)
+    # 0-100 risk score maintained by apps.properties.fraud
+    fraud_score = models.PositiveSmallIntegerField(default=0)
+    fraud_signals = models.JSONField(default=dict, blank=True)
+    fraud_scored_at = models.DateTimeField(blank=True, null=True)
     
     # Statistics
     views_count = models.PositiveIntegerField(default=0)
     inquiries_count = models.PositiveIntegerField(default=0)
+    # Time-decayed popularity maintained by apps.properties.trending
+    trending_score = models.FloatField(default=0)
+    trending_updated_at = models.DateTimeField(blank=True, null=True)
     
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
@@ -115,6 +124,8 @@ class Property(models.Model):
             models.Index(fields=['property_type', 'status']),
             models.Index(fields=['price_per_month']),
             models.Index(fields=['status', 'created_at']),
+            models.Index(fields=['status', 'fraud_score']),
+            models.Index(fields=['status', '-trending_score']),
         ]
     
     def __str__(self):
@@ -167,7 +178,7 @@ class PropertyImage(models.Model):
         on_delete=models.CASCADE,
         related_name='images'
     )
-    image = models.ImageField(upload_to='properties/%Y/%m/')
+    image = models.ImageField(upload_to='properties/%Y/%m/', storage=property_image_storage)
     image_hash = models.CharField(max_length=64, blank=True, null=True, db_index=True)
     caption = models.CharField(max_length=200, blank=True)
     is_primary = models.BooleanField(default=False)
@@ -255,6 +266,17 @@ class Favorite(models.Model):
         return f"{self.user.username} - {self.property.title}"
 
 
+def favorite_ids(user):
+    """Set of property ids ``user`` has favorited, looked up once per request."""
+    if not user.is_authenticated:
+        return set()
+    return user_fact(
+        user.pk, 'favorite_ids',
+        lambda: set(Favorite.objects.filter(user=user).values_list('property_id', flat=True)),
+        cached=True,
+    )
+
+
 class PropertyView(models.Model):
     """Track property views for analytics."""
     
@@ -275,6 +297,203 @@ class PropertyView(models.Model):
     
     class Meta:
         ordering = ['-viewed_at']
+        indexes = [
+            models.Index(fields=['viewed_at']),
+        ]
     
     def __str__(self):
         return f"View on {self.property.title} at {self.viewed_at}"
+
+
+class MarketRollupQuerySet(models.QuerySet):
+    """Slicing helpers for the rent-market rollup cube."""
+
+    def cell(self, district=None, area=None, property_type=None, bedrooms=None, month=None):
+        """
+        Return the single rollup row for a slice. Dimensions left as
+        ``None`` are rolled up (the ``ALL`` level of that dimension).
+        """
+        return self.filter(**MarketRollup.cell_lookup(
+            district, area, property_type, bedrooms, month
+        )).first()
+
+    def breakdown(self, dimension, **fixed):
+        """
+        Rows broken down by ``dimension`` with the ``fixed`` dimensions
+        pinned and every other dimension rolled up.
+        """
+        lookup = MarketRollup.cell_lookup(**fixed)
+        lookup.pop(dimension)
+        all_value = MarketRollup.ALL_BEDROOMS if dimension == 'bedrooms' else MarketRollup.ALL
+        return self.filter(**lookup).exclude(**{dimension: all_value}).order_by(dimension)
+
+
+class MarketRollup(models.Model):
+    """
+    Precomputed rent statistics over district x area x property_type x
+    bedrooms x month. Rolled-up dimensions are stored as ``ALL`` ('*', or
+    ``ALL_BEDROOMS`` for bedrooms) so every supported slice is one row.
+    """
+    ALL = '*'
+    ALL_BEDROOMS = -1
+    DIMENSIONS = ('district', 'area', 'property_type', 'bedrooms', 'month')
+
+    district = models.CharField(max_length=20)
+    area = models.CharField(max_length=100)
+    property_type = models.CharField(max_length=20)
+    bedrooms = models.SmallIntegerField()
+    month = models.CharField(max_length=7, help_text="YYYY-MM of listing creation, or '*'")
+
+    listing_count = models.PositiveIntegerField(default=0)
+    price_p25 = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    price_median = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    price_p75 = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    price_mean = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    price_mad = models.DecimalField(
+        max_digits=10, decimal_places=2, null=True, blank=True,
+        help_text="Median absolute deviation of rent"
+    )
+    sqft_count = models.PositiveIntegerField(default=0)
+    price_per_sqft_median = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+
+    is_stale = models.BooleanField(default=True, db_index=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = MarketRollupQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = 'Market Rollup'
+        verbose_name_plural = 'Market Rollups'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['district', 'area', 'property_type', 'bedrooms', 'month'],
+                name='unique_market_rollup_cell',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['property_type', 'bedrooms', 'month']),
+        ]
+
+    def __str__(self):
+        return f"{self.district}/{self.area}/{self.property_type}/{self.bedrooms}/{self.month}"
+
+    @classmethod
+    def cell_lookup(cls, district=None, area=None, property_type=None, bedrooms=None, month=None):
+        """Filter kwargs addressing one cell; ``None`` means rolled up."""
+        return {
+            'district': district or cls.ALL,
+            'area': area or cls.ALL,
+            'property_type': property_type or cls.ALL,
+            'bedrooms': cls.ALL_BEDROOMS if bedrooms is None else bedrooms,
+            'month': month or cls.ALL,
+        }
+
+
+class ListingSignature(models.Model):
+    """MinHash signature of a listing's title and description."""
+    property = models.OneToOneField(
+        Property,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='text_signature'
+    )
+    signature = models.BinaryField()
+    text_hash = models.CharField(max_length=40, help_text="SHA-1 of the normalized text the signature was built from")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Signature for {self.property_id}"
+
+
+class ListingBand(models.Model):
+    """
+    One LSH band of a listing's MinHash signature. Listings sharing a
+    ``(band, bucket)`` pair are near-duplicate candidates.
+    """
+    property = models.ForeignKey(
+        Property,
+        on_delete=models.CASCADE,
+        related_name='text_bands'
+    )
+    band = models.PositiveSmallIntegerField()
+    bucket = models.BigIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['property', 'band'], name='unique_listing_band'),
+        ]
+        indexes = [
+            models.Index(fields=['bucket', 'band']),
+        ]
+
+    def __str__(self):
+        return f"Band {self.band} of {self.property_id}"
+
+
+class MediaBlob(models.Model):
+    """A content-addressed image file and how many images reference it."""
+    name = models.CharField(max_length=255, unique=True)
+    sha256 = models.CharField(max_length=64, db_index=True)
+    size = models.PositiveBigIntegerField(default=0)
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.name} ({self.ref_count} refs)"
+
+
+class SimilarProperty(models.Model):
+    """One precomputed nearest neighbour of an approved listing."""
+    property = models.ForeignKey(
+        Property,
+        on_delete=models.CASCADE,
+        related_name='similar_links'
+    )
+    similar = models.ForeignKey(
+        Property,
+        on_delete=models.CASCADE,
+        related_name='similar_to'
+    )
+    rank = models.PositiveSmallIntegerField(help_text="1 is the closest neighbour")
+    score = models.FloatField(help_text="Similarity in (0, 1]")
+
+    class Meta:
+        verbose_name = 'Similar Property'
+        verbose_name_plural = 'Similar Properties'
+        ordering = ['property', 'rank']
+        constraints = [
+            models.UniqueConstraint(fields=['property', 'rank'], name='unique_similar_property_rank'),
+        ]
+
+    def __str__(self):
+        return f"#{self.rank} for {self.property_id}: {self.similar_id}"
+
+
+class PropertyCoOccurrence(models.Model):
+    """
+    A listing that the same tenants tend to engage with alongside
+    ``property``; rebuilt nightly from favorites, views and inquiries.
+    """
+    property = models.ForeignKey(
+        Property,
+        on_delete=models.CASCADE,
+        related_name='co_occurrences'
+    )
+    related = models.ForeignKey(
+        Property,
+        on_delete=models.CASCADE,
+        related_name='+'
+    )
+    rank = models.PositiveSmallIntegerField(help_text="1 is the strongest association")
+    score = models.FloatField(help_text="Cosine similarity of the two listings' audiences")
+
+    class Meta:
+        verbose_name = 'Property Co-occurrence'
+        verbose_name_plural = 'Property Co-occurrences'
+        ordering = ['property', 'rank']
+        constraints = [
+            models.UniqueConstraint(fields=['property', 'rank'], name='unique_property_co_occurrence_rank'),
+        ]
+
+    def __str__(self):
+        return f"#{self.rank} for {self.property_id}: {self.related_id}"
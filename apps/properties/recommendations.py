@@ -0,0 +1,216 @@
+"""
+Item-to-item recommendations for tenants.
+
+Two listings are related when the same tenants favorite, view or inquire
+about both. ``rebuild`` streams per-user interaction totals out of the
+database ordered by user, turns each user's basket into weighted listing
+pairs and accumulates them as a sparse co-occurrence matrix in coordinate
+form (pair keys plus weights, merged with NumPy every ``CHUNK_SIZE`` pairs),
+so memory grows with the number of distinct related pairs rather than the
+number of events. Pair weights are cosine-normalised by each listing's total
+engagement and the ``TOP_K`` strongest neighbours of every listing are stored
+in ``PropertyCoOccurrence`` by ``manage.py rebuild_recommendations``.
+
+``recommend_for`` combines the stored neighbour lists of a tenant's recent
+interactions at request time.
+"""
+
+import heapq
+import math
+from collections import defaultdict
+from datetime import timedelta
+
+import numpy as np
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from apps.core.choices import PropertyStatus
+from apps.inquiries.models import Inquiry
+from .models import Property, PropertyView, Favorite, PropertyCoOccurrence
+
+
+TOP_K = 20
+BATCH_SIZE = 1000
+CHUNK_SIZE = 1_000_000
+
+# Only interactions from this far back are considered.
+WINDOW = timedelta(days=180)
+
+# Heavy users are truncated to their strongest interactions so a single
+# basket never contributes more than MAX_BASKET**2 pairs.
+MAX_BASKET = 50
+
+# Repeated events of one kind count up to this many times.
+MAX_REPEATS = 3
+
+# (model, user field, property field, timestamp field, weight)
+INTERACTIONS = [
+    (PropertyView, 'user_id', 'property_id', 'viewed_at', 1.0),
+    (Favorite, 'user_id', 'property_id', 'created_at', 3.0),
+    (Inquiry, 'sender_id', 'rental_property_id', 'created_at', 5.0),
+]
+
+# Seeds per interaction kind used when recommending at request time.
+SEED_LIMIT = 20
+
+
+def user_baskets(since):
+    """Yield ``{property_id: weight}`` for each user with interactions after ``since``."""
+    streams = []
+    for model, user_field, property_field, time_field, weight in INTERACTIONS:
+        rows = (
+            model.objects
+            .filter(**{f'{user_field}__isnull': False, f'{time_field}__gte': since})
+            .values_list(user_field, property_field)
+            .annotate(events=Count('pk'))
+            .order_by(user_field)
+            .iterator(chunk_size=BATCH_SIZE)
+        )
+        streams.append(((user, prop, weight * min(events, MAX_REPEATS)) for user, prop, events in rows))
+
+    current, basket = None, defaultdict(float)
+    for user, prop, weight in heapq.merge(*streams, key=lambda row: row[0]):
+        if user != current:
+            if basket:
+                yield basket
+            current, basket = user, defaultdict(float)
+        basket[prop] += weight
+    if basket:
+        yield basket
+
+
+def _reduce(keys, weights):
+    """Sum the weights of duplicate pair keys."""
+    keys = np.concatenate(keys)
+    unique, inverse = np.unique(keys, return_inverse=True)
+    return unique, np.bincount(inverse, weights=np.concatenate(weights))
+
+
+def co_occurrence(baskets, chunk_size=CHUNK_SIZE):
+    """
+    Accumulate the item-item matrix of ``baskets``.
+
+    Returns ``(pks, rows, cols, weights, totals)``: listing ids by matrix
+    index, the coordinates and summed weights of every non-zero off-diagonal
+    cell, and each listing's total engagement.
+    """
+    index, pks, totals = {}, [], []
+    acc_keys, acc_weights = np.empty(0, dtype=np.int64), np.empty(0)
+    keys, weights, pending = [], [], 0
+
+    for basket in baskets:
+        items = heapq.nlargest(MAX_BASKET, basket.items(), key=lambda item: item[1])
+        ids = np.empty(len(items), dtype=np.int64)
+        basket_weights = np.empty(len(items))
+        for position, (prop, weight) in enumerate(items):
+            if prop not in index:
+                index[prop] = len(pks)
+                pks.append(prop)
+                totals.append(0.0)
+            ids[position] = index[prop]
+            basket_weights[position] = weight
+            totals[index[prop]] += weight
+        if len(items) < 2:
+            continue
+
+        # Every ordered pair of distinct listings in the basket; large
+        # baskets say less about any one pair, so damp them.
+        a, b = np.meshgrid(np.arange(len(items)), np.arange(len(items)), indexing='ij')
+        off_diagonal = a != b
+        a, b = a[off_diagonal], b[off_diagonal]
+        keys.append((ids[a] << 32) | ids[b])
+        weights.append(np.minimum(basket_weights[a], basket_weights[b]) / math.log2(2 + len(items)))
+        pending += len(a)
+
+        if pending >= chunk_size:
+            acc_keys, acc_weights = _reduce([acc_keys, *keys], [acc_weights, *weights])
+            keys, weights, pending = [], [], 0
+
+    if keys:
+        acc_keys, acc_weights = _reduce([acc_keys, *keys], [acc_weights, *weights])
+    return pks, acc_keys >> 32, acc_keys & 0xFFFFFFFF, acc_weights, np.asarray(totals)
+
+
+def top_neighbours(rows, cols, scores, top_k=TOP_K):
+    """Keep the ``top_k`` highest-scoring cells of every row, ranked from 1."""
+    order = np.lexsort((-scores, rows))
+    rows, cols, scores = rows[order], cols[order], scores[order]
+    starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+    counts = np.diff(np.r_[starts, len(rows)])
+    ranks = np.arange(len(rows)) - np.repeat(starts, counts) + 1
+    keep = ranks <= top_k
+    return rows[keep], cols[keep], scores[keep], ranks[keep]
+
+
+def rebuild(top_k=TOP_K, window=WINDOW, chunk_size=CHUNK_SIZE, batch_size=BATCH_SIZE):
+    """Recompute every listing's neighbour list. Returns rows written."""
+    since = timezone.now() - window
+    pks, rows, cols, weights, totals = co_occurrence(user_baskets(since), chunk_size)
+
+    # Only recommend listings tenants can actually see.
+    approved = set(Property.objects.filter(
+        pk__in=pks, status=PropertyStatus.APPROVED
+    ).values_list('pk', flat=True))
+    visible = np.fromiter((pk in approved for pk in pks), dtype=bool, count=len(pks))
+    if len(cols):
+        keep = visible[cols]
+        rows, cols, weights = rows[keep], cols[keep], weights[keep]
+
+    scores = weights / np.sqrt(totals[rows] * totals[cols])
+    rows, cols, scores, ranks = top_neighbours(rows, cols, scores, top_k)
+
+    with transaction.atomic():
+        PropertyCoOccurrence.objects.all().delete()
+        PropertyCoOccurrence.objects.bulk_create(
+            (
+                PropertyCoOccurrence(
+                    property_id=pks[row], related_id=pks[col], rank=int(rank), score=float(score),
+                )
+                for row, col, score, rank in zip(rows.tolist(), cols.tolist(), scores.tolist(), ranks.tolist())
+            ),
+            batch_size=batch_size,
+        )
+    return len(rows)
+
+
+def recent_interactions(user):
+    """``{property_id: weight}`` for the tenant's latest interactions."""
+    seeds = defaultdict(float)
+    for model, user_field, property_field, time_field, weight in INTERACTIONS:
+        recent = (
+            model.objects.filter(**{user_field: user.pk})
+            .order_by(f'-{time_field}')
+            .values_list(property_field, flat=True)[:SEED_LIMIT]
+        )
+        for prop in recent:
+            seeds[prop] += weight
+    return seeds
+
+
+def recommend_for(user, limit=6):
+    """
+    Approved listings for ``user`` ranked by their association with what
+    the tenant recently engaged with, padded with the newest listings.
+    """
+    seeds = recent_interactions(user)
+    scores = defaultdict(float)
+    if seeds:
+        neighbours = PropertyCoOccurrence.objects.filter(
+            property_id__in=list(seeds)
+        ).values_list('property_id', 'related_id', 'score')
+        for seed, related, score in neighbours:
+            if related not in seeds:
+                scores[related] += seeds[seed] * score
+
+    ranked = heapq.nlargest(limit * 2, scores, key=scores.get)
+    found = Property.objects.filter(pk__in=ranked, status=PropertyStatus.APPROVED).in_bulk()
+    recommended = [found[pk] for pk in ranked if pk in found][:limit]
+
+    if len(recommended) < limit:
+        recommended += list(
+            Property.objects.filter(status=PropertyStatus.APPROVED)
+            .exclude(pk__in=[p.pk for p in recommended] + list(seeds))
+            .order_by('-created_at')[:limit - len(recommended)]
+        )
+    return recommended
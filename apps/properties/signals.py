@@ -0,0 +1,107 @@
+"""
+Signal handlers for the properties app.
+"""
+
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from apps.core.memo import forget_user
+from .models import Property, PropertyImage, Favorite
+from .market import CUBE_FIELDS, MARKET_STATUSES, listing_dims, mark_stale
+from .dedup import TEXT_FIELDS, index_property
+from .storage import acquire_blob, release_blob
+
+
+def _touches_cube(update_fields):
+    return not update_fields or bool(set(update_fields) & CUBE_FIELDS)
+
+
+@receiver(pre_save, sender=Property, dispatch_uid='market_rollup_pre_save')
+def remember_market_cell(sender, instance, update_fields=None, **kwargs):
+    """Remember the cube coordinates a listing is about to leave."""
+    instance._old_market_dims = None
+    if instance._state.adding or not _touches_cube(update_fields):
+        return
+    old = Property.objects.filter(pk=instance.pk).values(
+        'district', 'area', 'property_type', 'bedrooms', 'created_at', 'status'
+    ).first()
+    if old and old.pop('status') in MARKET_STATUSES:
+        instance._old_market_dims = listing_dims(**old)
+
+
+@receiver(post_save, sender=Property, dispatch_uid='market_rollup_post_save')
+def mark_market_cells_stale(sender, instance, update_fields=None, **kwargs):
+    if not _touches_cube(update_fields):
+        return
+    dims = []
+    if getattr(instance, '_old_market_dims', None):
+        dims.append(instance._old_market_dims)
+    if instance.status in MARKET_STATUSES:
+        dims.append(listing_dims(
+            instance.district, instance.area, instance.property_type,
+            instance.bedrooms, instance.created_at,
+        ))
+    if dims:
+        mark_stale(dims)
+
+
+@receiver(post_delete, sender=Property, dispatch_uid='market_rollup_post_delete')
+def mark_deleted_market_cells_stale(sender, instance, **kwargs):
+    if instance.status in MARKET_STATUSES:
+        mark_stale([listing_dims(
+            instance.district, instance.area, instance.property_type,
+            instance.bedrooms, instance.created_at,
+        )])
+
+
+@receiver(post_save, sender=Property, dispatch_uid='listing_text_post_save')
+def index_listing_text(sender, instance, update_fields=None, **kwargs):
+    """Keep the near-duplicate text index current."""
+    if update_fields and not set(update_fields) & TEXT_FIELDS:
+        return
+    index_property(instance)
+
+
+@receiver(pre_save, sender=PropertyImage, dispatch_uid='media_blob_pre_save')
+def remember_image_file(sender, instance, **kwargs):
+    instance._old_image_name = None
+    # Kept in case the stored file must be written again; see acquire_blob.
+    instance._uploaded_image = None if instance.image._committed else instance.image.file
+    if not instance._state.adding:
+        instance._old_image_name = PropertyImage.objects.filter(pk=instance.pk).values_list('image', flat=True).first()
+
+
+@receiver(post_save, sender=PropertyImage, dispatch_uid='media_blob_post_save')
+def count_image_reference(sender, instance, created, **kwargs):
+    """Keep ``MediaBlob.ref_count`` in step with the images using each file."""
+    name = instance.image.name
+    old = getattr(instance, '_old_image_name', None)
+    if created or old != name:
+        content = getattr(instance, '_uploaded_image', None)
+        if content is not None:
+            size = content.size
+        else:
+            size = instance.image.size if name else None
+        acquire_blob(name, instance.image_hash, size, content, instance.image.storage)
+        if old:
+            release_blob(old, instance.image.storage)
+
+
+@receiver(post_delete, sender=PropertyImage, dispatch_uid='media_blob_post_delete')
+def release_image_reference(sender, instance, **kwargs):
+    release_blob(instance.image.name, instance.image.storage)
+
+
+@receiver(post_save, sender=Favorite, dispatch_uid='user_facts_favorite_post_save')
+@receiver(post_delete, sender=Favorite, dispatch_uid='user_facts_favorite_post_delete')
+def forget_favorites(sender, instance, **kwargs):
+    forget_user(instance.user_id)
+
+
+@receiver(post_save, sender=Property, dispatch_uid='user_facts_property_post_save')
+@receiver(post_delete, sender=Property, dispatch_uid='user_facts_property_post_delete')
+def forget_listing_counts(sender, instance, update_fields=None, **kwargs):
+    """Owners' listing counts change when a listing is added, removed or moderated."""
+    if update_fields and 'status' not in update_fields:
+        return
+    forget_user(instance.owner_id)
@@ -0,0 +1,173 @@
+"""
+Content-based "similar properties" for the detail page.
+
+Every approved listing is embedded as a numeric feature vector - rent,
+bedrooms, bathrooms, floor area, property type, district, locality and an
+amenities bitmap - scaled so that each group contributes roughly its
+weight to the Euclidean distance between two listings. ``rebuild`` finds
+the ``TOP_K`` nearest neighbours of every listing with batched NumPy
+distance computations and stores them in ``SimilarProperty``, so the
+detail page needs a single indexed lookup. It is run by
+``manage.py rebuild_similar_properties``.
+"""
+
+import zlib
+
+import numpy as np
+from django.db import transaction
+
+from apps.core.choices import AMENITIES, District, PropertyStatus, PropertyType
+from .models import Property, SimilarProperty
+from .market import normalize_area
+
+
+BATCH_SIZE = 500
+TOP_K = 8
+
+# Localities are hashed into this many one-hot buckets.
+AREA_BUCKETS = 64
+
+# Relative importance of each feature group.
+FEATURE_WEIGHTS = {
+    'price': 2.0,
+    'bedrooms': 1.0,
+    'bathrooms': 0.5,
+    'area_sq_ft': 0.5,
+    'property_type': 1.0,
+    'district': 1.5,
+    'area': 1.0,
+    'amenities': 1.0,
+}
+
+FEATURE_FIELDS = (
+    'pk', 'price_per_month', 'bedrooms', 'bathrooms', 'area_sq_ft',
+    'property_type', 'district', 'area', 'amenities',
+)
+
+PROPERTY_TYPES = [value for value, _ in PropertyType.choices]
+DISTRICTS = [value for value, _ in District.choices]
+AMENITY_CODES = [code for code, _ in AMENITIES]
+
+
+def _standardize(column):
+    """Zero-mean, unit-variance column; missing values land on the mean."""
+    column = np.asarray(column, dtype=np.float64)
+    present = ~np.isnan(column)
+    if not present.any():
+        return np.zeros_like(column)
+    mean = column[present].mean()
+    std = column[present].std() or 1.0
+    return np.where(present, (column - mean) / std, 0.0)
+
+
+def _one_hot(values, categories):
+    index = {value: i for i, value in enumerate(categories)}
+    matrix = np.zeros((len(values), len(categories)))
+    for row, value in enumerate(values):
+        if value in index:
+            matrix[row, index[value]] = 1.0
+    return matrix
+
+
+def _area_bucket(area):
+    return zlib.crc32(normalize_area(area).encode()) % AREA_BUCKETS
+
+
+def feature_matrix(rows):
+    """Weighted feature matrix for ``FEATURE_FIELDS`` rows, one row each."""
+    _, prices, bedrooms, bathrooms, sq_ft, types, districts, areas, amenities = zip(*rows)
+    weights = FEATURE_WEIGHTS
+    # One-hot groups are scaled by 1/sqrt(2) so a mismatch costs exactly the weight.
+    onehot = 1 / np.sqrt(2)
+
+    bitmap = np.zeros((len(rows), len(AMENITY_CODES)))
+    codes = {code: i for i, code in enumerate(AMENITY_CODES)}
+    for row, listed in enumerate(amenities):
+        for code in listed or ():
+            if code in codes:
+                bitmap[row, codes[code]] = 1.0
+
+    return np.hstack([
+        weights['price'] * _standardize(np.log1p([float(p) for p in prices]))[:, None],
+        weights['bedrooms'] * _standardize(bedrooms)[:, None],
+        weights['bathrooms'] * _standardize(bathrooms)[:, None],
+        weights['area_sq_ft'] * _standardize(
+            [np.log1p(s) if s else np.nan for s in sq_ft]
+        )[:, None],
+        weights['property_type'] * onehot * _one_hot(types, PROPERTY_TYPES),
+        weights['district'] * onehot * _one_hot(districts, DISTRICTS),
+        weights['area'] * onehot * _one_hot([_area_bucket(a) for a in areas], range(AREA_BUCKETS)),
+        weights['amenities'] / np.sqrt(len(AMENITY_CODES)) * bitmap,
+    ])
+
+
+def nearest_neighbours(vectors, top_k=TOP_K, batch_size=BATCH_SIZE):
+    """
+    Yield ``(row, neighbour_rows, distances)`` for every row of ``vectors``,
+    neighbours ordered closest first and never including the row itself.
+    """
+    count = len(vectors)
+    top_k = min(top_k, count - 1)
+    if top_k <= 0:
+        return
+    norms = np.einsum('ij,ij->i', vectors, vectors)
+    for start in range(0, count, batch_size):
+        stop = min(start + batch_size, count)
+        # |a - b|^2 = |a|^2 + |b|^2 - 2ab, for the whole batch at once
+        dist = norms[start:stop, None] + norms[None, :] - 2 * vectors[start:stop] @ vectors.T
+        np.maximum(dist, 0, out=dist)
+        dist[np.arange(stop - start), np.arange(start, stop)] = np.inf
+        nearest = np.argpartition(dist, top_k - 1, axis=1)[:, :top_k]
+        nearest_dist = np.take_along_axis(dist, nearest, axis=1)
+        order = np.argsort(nearest_dist, axis=1, kind='stable')
+        nearest = np.take_along_axis(nearest, order, axis=1)
+        nearest_dist = np.sqrt(np.take_along_axis(nearest_dist, order, axis=1))
+        for offset in range(stop - start):
+            yield start + offset, nearest[offset], nearest_dist[offset]
+
+
+def rebuild(top_k=TOP_K, batch_size=BATCH_SIZE):
+    """Recompute neighbours for every approved listing. Returns rows written."""
+    rows = list(
+        Property.objects.filter(status=PropertyStatus.APPROVED)
+        .values_list(*FEATURE_FIELDS).order_by('pk')
+    )
+    # Listings that left the approved set keep no neighbours.
+    SimilarProperty.objects.exclude(property__status=PropertyStatus.APPROVED).delete()
+    if not rows:
+        return 0
+
+    pks = [row[0] for row in rows]
+    written = 0
+    batch = []
+
+    def flush(batch):
+        with transaction.atomic():
+            SimilarProperty.objects.filter(property_id__in={link.property_id for link in batch}).delete()
+            SimilarProperty.objects.bulk_create(batch)
+        return len(batch)
+
+    for row, neighbours, distances in nearest_neighbours(feature_matrix(rows), top_k, batch_size):
+        batch.extend(
+            SimilarProperty(
+                property_id=pks[row], similar_id=pks[other],
+                rank=rank, score=float(1 / (1 + distance)),
+            )
+            for rank, (other, distance) in enumerate(zip(neighbours, distances), start=1)
+        )
+        if len(batch) >= batch_size * top_k:
+            written += flush(batch)
+            batch = []
+    if batch:
+        written += flush(batch)
+    if len(pks) == 1:
+        SimilarProperty.objects.filter(property_id=pks[0]).delete()
+    return written
+
+
+def similar_properties(property_obj, limit=4):
+    """Precomputed neighbours of ``property_obj`` that are still approved."""
+    return Property.objects.filter(
+        similar_to__property=property_obj,
+        status=PropertyStatus.APPROVED,
+    ).order_by('similar_to__rank')[:limit]
@@ -0,0 +1,121 @@
+"""
+Content-addressed storage for property images.
+
+Files are stored under the SHA-256 of their bytes
+(``properties/blobs/ab/cd/abcd...ef.jpg``), so uploading the same photo
+again - to the same or another listing - reuses the existing file. Each
+stored file has a ``MediaBlob`` row whose ``ref_count`` tracks how many
+``PropertyImage`` rows use it; the file is deleted only when the last
+reference goes (see ``apps.properties.signals``). Files uploaded before
+this storage existed are moved into it by ``manage.py dedupe_media``.
+"""
+
+import hashlib
+import os
+from functools import partial
+
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.db import transaction
+from django.db.models import F
+
+
+BLOB_PREFIX = 'properties/blobs'
+
+
+def blob_name(digest, filename=''):
+    """Storage name for content with SHA-256 ``digest``; keeps the original extension."""
+    ext = os.path.splitext(filename or '')[1].lower()
+    return f"{BLOB_PREFIX}/{digest[:2]}/{digest[2:4]}/{digest}{ext}"
+
+
+def is_blob_name(name):
+    return bool(name) and name.startswith(BLOB_PREFIX + '/')
+
+
+def hash_content(content):
+    digest = hashlib.sha256()
+    for chunk in content.chunks():
+        digest.update(chunk)
+    content.seek(0)
+    return digest.hexdigest()
+
+
+def hash_image_file(name):
+    """
+    SHA-256 of a stored image, read in chunks; None if the file is missing.
+    Touches no models, so it can run in worker processes whatever their
+    start method.
+    """
+    try:
+        with property_image_storage().open(name, 'rb') as handle:
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: handle.read(1 << 20), b''):
+                digest.update(chunk)
+            return digest.hexdigest()
+    except (OSError, ValueError):
+        return None
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """``FileSystemStorage`` that names files by their content hash."""
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+        name = blob_name(hash_content(content), name)
+        if self.exists(name):
+            return name
+        return super().save(name, content, max_length=max_length)
+
+
+def property_image_storage():
+    return ContentAddressedStorage()
+
+
+def acquire_blob(name, digest=None, size=None, content=None, storage=None):
+    """
+    Count a new reference to the stored file ``name``. ``content`` is the
+    upload just saved as ``name``, if any: when the storage found the file
+    already there but it was deleted with its last reference before this
+    count, the upload is written again.
+    """
+    from .models import MediaBlob
+    if not is_blob_name(name):
+        return
+    with transaction.atomic():
+        # The UPDATE locks the row until commit; if a concurrent release
+        # deleted it meanwhile nothing is updated and the row is recreated.
+        while not MediaBlob.objects.filter(name=name).update(ref_count=F('ref_count') + 1):
+            MediaBlob.objects.get_or_create(
+                name=name,
+                defaults={'sha256': digest or os.path.splitext(os.path.basename(name))[0], 'size': size or 0},
+            )
+        storage = storage or property_image_storage()
+        if content is not None and not storage.exists(name):
+            storage.save(name, content)
+
+
+def _delete_if_unused(name, storage):
+    from .models import MediaBlob
+    with transaction.atomic():
+        # Deleting the row locks it and re-checks the count, so an image
+        # referencing the file since the release keeps it.
+        deleted, _ = MediaBlob.objects.filter(name=name, ref_count=0).delete()
+        if deleted:
+            storage.delete(name)
+
+
+def release_blob(name, storage=None):
+    """
+    Drop a reference to ``name``; once nothing refers to it, delete the
+    row and the file itself after commit, unless it is in use again by then.
+    """
+    from .models import MediaBlob
+    if not is_blob_name(name):
+        return
+    MediaBlob.objects.filter(name=name, ref_count__gt=0).update(ref_count=F('ref_count') - 1)
+    if MediaBlob.objects.filter(name=name, ref_count=0).exists():
+        transaction.on_commit(partial(_delete_if_unused, name, storage or property_image_storage()))
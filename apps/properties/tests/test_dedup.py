@@ -0,0 +1,58 @@
+from django.test import TestCase
+from apps.accounts.models import User
+from apps.properties import minhash
+from apps.properties.dedup import near_duplicates
+from apps.properties.models import Property, ListingSignature, ListingBand
+
+
+DESCRIPTION = (
+    'Two bedroom flat with a large balcony facing the hills, modular kitchen, '
+    'parking for one car and a motorbike, twenty four hour water supply, '
+    'close to the ring road, schools and the vegetable market.'
+)
+
+
+class NearDuplicateTextTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username='original', password='pass')
+        self.scammer = User.objects.create_user(username='copycat', password='pass')
+        self.original = self.create(self.owner, 'Flat in Baneshwor', DESCRIPTION)
+
+    def create(self, owner, title, description):
+        return Property.objects.create(
+            owner=owner, title=title, description=description,
+            area='Baneshwor', address='Addr', price_per_month=20000,
+        )
+
+    def test_signature_estimates_jaccard(self):
+        a = minhash.normalize_text('', DESCRIPTION)
+        b = minhash.normalize_text('', DESCRIPTION.replace('large', 'big'))
+        shingles_a, shingles_b = set(minhash.shingles(a)), set(minhash.shingles(b))
+        exact = len(shingles_a & shingles_b) / len(shingles_a | shingles_b)
+        estimate = minhash.similarity(minhash.signature(a), minhash.signature(b))
+        self.assertAlmostEqual(estimate, exact, delta=0.15)
+
+    def test_save_indexes_listing(self):
+        self.assertTrue(ListingSignature.objects.filter(property=self.original).exists())
+        self.assertEqual(ListingBand.objects.filter(property=self.original).count(), minhash.BANDS)
+
+    def test_near_copy_by_another_owner_is_flagged(self):
+        copy = self.create(self.scammer, 'Flat in Baneshwor!!', DESCRIPTION.replace('large', 'big'))
+        matches = near_duplicates([copy.pk])[copy.pk]
+        self.assertEqual(matches[0][0], self.original.pk)
+        copy.refresh_from_db()
+        self.assertTrue(copy.is_flagged)
+        self.assertIn(str(self.original.pk), copy.fraud_reason)
+
+    def test_unrelated_text_is_not_a_candidate(self):
+        other = self.create(self.scammer, 'Shop space', 'Ground floor shutter facing the highway, suitable for a pharmacy.')
+        self.assertEqual(near_duplicates([other.pk]), {})
+        other.refresh_from_db()
+        self.assertFalse(other.is_flagged)
+
+    def test_edit_reindexes(self):
+        copy = self.create(self.scammer, 'Flat in Baneshwor', DESCRIPTION)
+        copy.title = 'Shop space'
+        copy.description = 'Ground floor shutter facing the highway, suitable for a pharmacy.'
+        copy.save()
+        self.assertEqual(near_duplicates([copy.pk]), {})
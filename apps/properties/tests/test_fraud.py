@@ -1,7 +1,17 @@
+import json
+import os
+import tempfile
+from datetime import timedelta
+from io import StringIO
+
 from django.test import TestCase
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.utils import timezone
 from apps.accounts.models import User
 from apps.properties.models import Property, PropertyImage
+from apps.properties.fraud import flag_price_anomaly, needs_scoring, score_properties
+from apps.properties.market import rebuild_all
 
 
 class FraudDetectionTests(TestCase):
@@ -43,3 +53,130 @@ class FraudDetectionTests(TestCase):
         self.assertGreaterEqual(self.prop1.flag_count, 1)
         self.assertGreaterEqual(self.prop2.flag_count, 1)
         self.assertIn('Duplicate image detected', (self.prop1.fraud_reason or ''))
+
+
+LISTING_TEXT = (
+    'Spacious sunny room on the second floor of a quiet family house, five minutes walk '
+    'from the main road. Shared kitchen, attached bathroom with hot water all day, '
+    'rooftop access for drying clothes and a small garden. Water and electricity are '
+    'included in the rent. Suitable for students or working professionals.'
+)
+
+
+class FraudScoreTests(TestCase):
+    def setUp(self):
+        self.veteran = User.objects.create_user(
+            username='veteran', password='pass', date_joined=timezone.now() - timedelta(days=365)
+        )
+        self.newcomer = User.objects.create_user(username='newcomer', password='pass')
+        for i, price in enumerate([10000, 11000, 12000, 13000, 14000]):
+            Property.objects.create(
+                owner=self.veteran, title=f'Room {i}', description=f'{LISTING_TEXT} Unit {i}.',
+                district='Kathmandu', area='Thamel', address=f'Addr {i}',
+                price_per_month=price, status='APPROVED',
+            )
+
+    def score(self, prop):
+        score_properties(Property.objects.all())
+        prop.refresh_from_db()
+        return prop.fraud_score, set(prop.fraud_signals)
+
+    def test_combined_signals(self):
+        rebuild_all()
+        listing = Property.objects.get(title='Room 0')
+        suspect = Property.objects.create(
+            owner=self.newcomer, title='Room 0', description=listing.description.replace('quiet', 'calm'),
+            district='Kathmandu', area='thamel', address='Addr', price_per_month=4000,
+        )
+        score, signals = self.score(suspect)
+        self.assertEqual(signals, {'price_far_below_median', 'near_duplicate_text', 'new_account'})
+        self.assertEqual(score, 30 + 25 + 10)
+
+    def test_low_price_is_flagged_at_submission(self):
+        rebuild_all()
+        suspect = Property.objects.create(
+            owner=self.newcomer, title='Cheap room', description='Cheap', district='Kathmandu',
+            area='Thamel', address='Addr', price_per_month=5000,
+        )
+        self.assertEqual(flag_price_anomaly(suspect)['direction'], 'low')
+        flag_price_anomaly(suspect)
+        suspect.refresh_from_db()
+        self.assertTrue(suspect.is_flagged)
+        self.assertEqual(suspect.flag_count, 1)
+        self.assertIsNone(flag_price_anomaly(Property.objects.get(title='Room 2')))
+
+    def test_zero_median_cells_are_skipped(self):
+        free = [
+            Property.objects.create(
+                owner=self.veteran, title=f'Free room {i}', description='Placeholder', district='Lalitpur',
+                area='Sanepa', address=f'Addr {i}', price_per_month=0, status='APPROVED',
+            )
+            for i in range(5)
+        ]
+        rebuild_all()
+        self.assertEqual(self.score(free[0]), (0, set()))
+        self.assertIsNone(flag_price_anomaly(free[1]))
+
+    def test_clean_listing_scores_zero(self):
+        prop = Property.objects.filter(owner=self.veteran).first()
+        self.assertEqual(self.score(prop), (0, set()))
+
+    def test_only_new_and_edited_listings_need_scoring(self):
+        self.assertEqual(score_properties(needs_scoring()), 5)
+        self.assertFalse(needs_scoring().exists())
+        prop = Property.objects.first()
+        prop.price_per_month = 9000
+        prop.save()
+        self.assertEqual(list(needs_scoring()), [prop])
+
+
+class RescanImagesTests(TestCase):
+    def setUp(self):
+        self.user1 = User.objects.create_user(username='landlord1', password='pass')
+        self.user2 = User.objects.create_user(username='landlord2', password='pass')
+        self.props = [
+            Property.objects.create(owner=owner, title='Room', description='Desc', area='Thamel',
+                                    address='Addr', price_per_month=10000)
+            for owner in (self.user1, self.user2)
+        ]
+        for prop in self.props:
+            PropertyImage.objects.create(
+                property=prop, image=SimpleUploadedFile('img.jpg', b'same-bytes', content_type='image/jpeg')
+            )
+        # Simulate images uploaded before hashing existed.
+        PropertyImage.objects.update(image_hash=None)
+        Property.objects.update(is_flagged=False, flag_count=0, fraud_reason=None)
+        self.checkpoint = os.path.join(tempfile.mkdtemp(), 'checkpoint.json')
+
+    def rescan(self, **options):
+        out = StringIO()
+        call_command('rescan_images', workers=1, checkpoint=self.checkpoint, stdout=out, **options)
+        return out.getvalue()
+
+    def test_dry_run_writes_nothing(self):
+        out = self.rescan(dry_run=True)
+        self.assertIn('2 listings flagged', out)
+        self.assertFalse(PropertyImage.objects.filter(image_hash__isnull=False).exists())
+        self.assertFalse(Property.objects.filter(is_flagged=True).exists())
+
+    def test_rescan_hashes_and_flags_once(self):
+        self.rescan()
+        self.assertFalse(PropertyImage.objects.filter(image_hash__isnull=True).exists())
+        for prop in Property.objects.all():
+            self.assertTrue(prop.is_flagged)
+            self.assertEqual(prop.flag_count, 1)
+            self.assertIsNone(prop.fraud_scored_at)
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+        self.rescan(rehash=True)
+        self.assertEqual(set(Property.objects.values_list('flag_count', flat=True)), {1})
+
+    def test_resumes_from_checkpoint(self):
+        first, second = PropertyImage.objects.order_by('pk')
+        with open(self.checkpoint, 'w') as handle:
+            json.dump({'last_pk': first.pk}, handle)
+        self.rescan()
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertIsNone(first.image_hash)
+        self.assertIsNotNone(second.image_hash)
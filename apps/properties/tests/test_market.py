@@ -0,0 +1,76 @@
+import numpy as np
+from django.test import TestCase
+from apps.accounts.models import User
+from apps.properties.models import Property, MarketRollup
+from apps.properties.market import check_price, rebuild_all, rebuild_stale, suggest_price
+
+
+class MarketRollupTests(TestCase):
+    def setUp(self):
+        self.landlord = User.objects.create_user(username='landlord1', password='pass')
+        self.prices = [8000, 10000, 12000, 15000, 30000]
+        self.props = [
+            Property.objects.create(
+                owner=self.landlord,
+                title=f'Room {i}',
+                description='Desc',
+                district='Kathmandu',
+                area='Thamel',
+                address=f'Addr {i}',
+                bedrooms=1,
+                area_sq_ft=200,
+                price_per_month=price,
+                status='APPROVED',
+            )
+            for i, price in enumerate(self.prices)
+        ]
+        Property.objects.create(
+            owner=self.landlord, title='Pending', description='Desc', district='Kathmandu',
+            area='Thamel', address='Addr', price_per_month=1000000,
+        )
+
+    def snapshot(self):
+        return {
+            tuple(getattr(row, dim) for dim in MarketRollup.DIMENSIONS):
+                (row.listing_count, row.price_median, row.price_p25, row.price_p75)
+            for row in MarketRollup.objects.all()
+        }
+
+    def test_cell_percentiles(self):
+        rebuild_stale()
+        cell = MarketRollup.objects.cell(district='Kathmandu', area='Thamel', property_type='ROOM', bedrooms=1)
+        self.assertEqual(cell.listing_count, 5)
+        self.assertEqual(float(cell.price_median), np.percentile(self.prices, 50))
+        self.assertEqual(float(cell.price_p25), np.percentile(self.prices, 25))
+        self.assertEqual(float(cell.price_per_sqft_median), np.median(self.prices) / 200)
+        self.assertFalse(MarketRollup.objects.filter(is_stale=True).exists())
+
+    def test_incremental_matches_full_rebuild(self):
+        rebuild_stale()
+        self.props[0].district = 'Lalitpur'
+        self.props[0].area = 'Sanepa'
+        self.props[0].save()
+        self.props[1].delete()
+        rebuild_stale()
+        incremental = self.snapshot()
+        rebuild_all()
+        self.assertEqual(incremental, self.snapshot())
+
+    def test_suggest_price_falls_back_to_coarser_cell(self):
+        rebuild_stale()
+        cell = suggest_price('Kathmandu', area='thamel', property_type='ROOM', bedrooms=3)
+        self.assertEqual(cell.listing_count, 5)
+        self.assertEqual(cell.bedrooms, MarketRollup.ALL_BEDROOMS)
+
+    def test_price_check_uses_median_and_mad(self):
+        rebuild_stale()
+        cell = MarketRollup.objects.cell(district='Kathmandu', area='Thamel', property_type='ROOM', bedrooms=1)
+        prices = np.array(self.prices)
+        self.assertEqual(float(cell.price_mad), np.median(np.abs(prices - np.median(prices))))
+
+        self.assertIsNone(check_price('Kathmandu', 'thamel', 'ROOM', 1, 14000))
+        anomaly = check_price('Kathmandu', 'thamel', 'ROOM', 1, 45000)
+        self.assertEqual(anomaly['direction'], 'high')
+        self.assertEqual(anomaly['comparables'], 5)
+        # Too few comparables anywhere: no verdict.
+        self.assertIsNone(check_price('Lalitpur', 'Sanepa', 'ROOM', 1, 100))
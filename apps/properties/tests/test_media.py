@@ -0,0 +1,115 @@
+import shutil
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from apps.accounts.models import User
+from apps.properties.models import MediaBlob, Property, PropertyImage
+from apps.properties.storage import ContentAddressedStorage, is_blob_name
+
+
+class ContentAddressedMediaTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+        self.owner = User.objects.create_user(username='landlord', password='pass')
+        self.props = [
+            Property.objects.create(owner=self.owner, title=f'Room {i}', description='Desc', area='Thamel',
+                                    address='Addr', price_per_month=10000)
+            for i in range(2)
+        ]
+        self.storage = PropertyImage._meta.get_field('image').storage
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def upload(self, prop, data=b'photo-bytes', name='photo.JPG'):
+        return PropertyImage.objects.create(
+            property=prop, image=SimpleUploadedFile(name, data, content_type='image/jpeg')
+        )
+
+    def test_identical_uploads_share_one_file(self):
+        first = self.upload(self.props[0])
+        second = self.upload(self.props[1], name='copy.jpg')
+        self.assertEqual(first.image.name, second.image.name)
+        self.assertTrue(is_blob_name(first.image.name))
+        self.assertIn(first.image_hash, first.image.name)
+        self.assertEqual(MediaBlob.objects.get(name=first.image.name).ref_count, 2)
+
+    def test_file_deleted_with_last_reference(self):
+        first = self.upload(self.props[0])
+        self.upload(self.props[1])
+        name = first.image.name
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+        self.assertTrue(self.storage.exists(name))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.props[1].delete()
+        self.assertFalse(self.storage.exists(name))
+        self.assertFalse(MediaBlob.objects.exists())
+
+    def test_reupload_before_release_commits_keeps_file(self):
+        first = self.upload(self.props[0])
+        name = first.image.name
+        with self.captureOnCommitCallbacks() as callbacks:
+            first.delete()
+        self.upload(self.props[1])
+        for callback in callbacks:
+            callback()
+        self.assertTrue(self.storage.exists(name))
+        self.assertEqual(MediaBlob.objects.get(name=name).ref_count, 1)
+
+    def test_file_deleted_during_reupload_is_written_again(self):
+        first = self.upload(self.props[0])
+        name = first.image.name
+        with self.captureOnCommitCallbacks() as callbacks:
+            first.delete()
+        save = ContentAddressedStorage.save
+
+        def save_then_release(storage, *args, **kwargs):
+            # The release commits after the storage saw the file but before
+            # the new image is counted.
+            saved = save(storage, *args, **kwargs)
+            while callbacks:
+                callbacks.pop()()
+            return saved
+
+        with mock.patch.object(ContentAddressedStorage, 'save', save_then_release):
+            second = self.upload(self.props[1])
+        self.assertEqual(second.image.name, name)
+        self.assertTrue(self.storage.exists(name))
+        self.assertEqual(MediaBlob.objects.get(name=name).ref_count, 1)
+
+    def test_dedupe_command_moves_legacy_files(self):
+        legacy = [
+            self.storage._save(f'properties/2024/01/{i}.jpg', ContentFile(b'same-legacy-bytes'))
+            for i in range(2)
+        ]
+        for prop, name in zip(self.props, legacy):
+            PropertyImage.objects.bulk_create([PropertyImage(property=prop, image=name)])
+
+        call_command('dedupe_media', dry_run=True, stdout=StringIO())
+        self.assertEqual(set(PropertyImage.objects.values_list('image', flat=True)), set(legacy))
+
+        call_command('dedupe_media', stdout=StringIO())
+        names = set(PropertyImage.objects.values_list('image', flat=True))
+        self.assertEqual(len(names), 1)
+        name = names.pop()
+        self.assertTrue(self.storage.exists(name))
+        self.assertFalse(any(self.storage.exists(old) for old in legacy))
+        self.assertEqual(MediaBlob.objects.get(name=name).ref_count, 2)
+
+    def test_dedupe_counts_unreadable_files_as_missing(self):
+        name = self.storage._save('properties/2024/01/gone.jpg', ContentFile(b'legacy-bytes'))
+        PropertyImage.objects.bulk_create([PropertyImage(property=self.props[0], image=name)])
+        out = StringIO()
+        with mock.patch('apps.properties.management.commands.dedupe_media.hash_image_file', return_value=None):
+            call_command('dedupe_media', stdout=out)
+        self.assertIn('1 files missing', out.getvalue())
+        self.assertEqual(PropertyImage.objects.get().image.name, name)
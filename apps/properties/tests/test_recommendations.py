@@ -0,0 +1,61 @@
+import numpy as np
+from django.test import TestCase
+from django.urls import reverse
+from apps.accounts.models import User
+from apps.core.choices import PropertyStatus
+from apps.properties.models import Property, PropertyView, Favorite, PropertyCoOccurrence
+from apps.properties.recommendations import co_occurrence, rebuild, recommend_for
+
+
+class RecommendationTests(TestCase):
+    def setUp(self):
+        self.landlord = User.objects.create_user(username='landlord', password='pass', user_type='LANDLORD')
+        self.tenants = [
+            User.objects.create_user(username=f'tenant{i}', password='pass', user_type='TENANT')
+            for i in range(4)
+        ]
+        self.a, self.b, self.c, self.d = [self.make_property(name) for name in 'ABCD']
+
+    def make_property(self, title, status=PropertyStatus.APPROVED):
+        return Property.objects.create(
+            owner=self.landlord, title=title, description='Desc', area='Thamel',
+            address='Addr', price_per_month=15000, status=status,
+        )
+
+    def test_chunked_accumulation_matches_single_pass(self):
+        baskets = [{'x': 1.0, 'y': 3.0}, {'x': 2.0, 'y': 1.0, 'z': 1.0}, {'y': 1.0, 'z': 5.0}]
+        whole = co_occurrence(iter(baskets), chunk_size=10 ** 6)
+        chunked = co_occurrence(iter(baskets), chunk_size=1)
+        for left, right in zip(whole[1:], chunked[1:]):
+            np.testing.assert_allclose(left, right)
+        pks, rows, cols, weights, totals = whole
+        self.assertEqual(dict(zip(pks, totals)), {'x': 3.0, 'y': 5.0, 'z': 6.0})
+        # x and y co-occur in two baskets, so their cell is the largest
+        top = np.argmax(weights)
+        self.assertEqual({pks[rows[top]], pks[cols[top]]}, {'x', 'y'})
+
+    def test_rebuild_and_recommend(self):
+        # Tenants who like A also like B; C is only ever seen on its own.
+        for tenant in self.tenants[:3]:
+            Favorite.objects.create(user=tenant, property=self.a)
+            PropertyView.objects.create(property=self.b, user=tenant)
+        PropertyView.objects.create(property=self.c, user=self.tenants[3])
+        hidden = self.make_property('Hidden', status=PropertyStatus.REJECTED)
+        Favorite.objects.create(user=self.tenants[0], property=hidden)
+
+        rebuild()
+
+        link = PropertyCoOccurrence.objects.get(property=self.a, rank=1)
+        self.assertEqual(link.related_id, self.b.pk)
+        self.assertFalse(PropertyCoOccurrence.objects.filter(related=hidden).exists())
+
+        newcomer = User.objects.create_user(username='newcomer', password='pass', user_type='TENANT')
+        Favorite.objects.create(user=newcomer, property=self.a)
+        recommended = recommend_for(newcomer, limit=3)
+        self.assertEqual(recommended[0], self.b)
+        self.assertNotIn(self.a, recommended)
+        self.assertEqual(len(recommended), 3)
+
+        self.client.force_login(newcomer)
+        response = self.client.get(reverse('accounts:dashboard'), secure=True)
+        self.assertEqual(response.context['recommended_properties'][0], self.b)
@@ -0,0 +1,45 @@
+import numpy as np
+from django.test import TestCase
+from django.urls import reverse
+from apps.accounts.models import User
+from apps.core.choices import PropertyStatus
+from apps.properties.models import Property, SimilarProperty
+from apps.properties.similarity import nearest_neighbours, rebuild
+
+
+class SimilarPropertyTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username='landlord', password='pass')
+
+    def make_property(self, title, **kwargs):
+        fields = dict(
+            owner=self.owner, title=title, description='Desc', area='Thamel',
+            address='Addr', price_per_month=15000, district='Kathmandu',
+            property_type='FLAT', bedrooms=2, status=PropertyStatus.APPROVED,
+        )
+        fields.update(kwargs)
+        return Property.objects.create(**fields)
+
+    def test_nearest_neighbours_matches_brute_force(self):
+        vectors = np.random.RandomState(7).rand(30, 5)
+        for row, neighbours, distances in nearest_neighbours(vectors, top_k=3, batch_size=7):
+            expected = np.linalg.norm(vectors - vectors[row], axis=1)
+            expected[row] = np.inf
+            self.assertEqual(list(neighbours), list(np.argsort(expected)[:3]))
+            np.testing.assert_allclose(distances, np.sort(expected)[:3])
+
+    def test_rebuild_ranks_closest_listing_first(self):
+        base = self.make_property('Base', amenities=['wifi', 'parking'])
+        twin = self.make_property('Twin', price_per_month=16000, amenities=['wifi', 'parking'])
+        self.make_property('Far', district='Bhaktapur', area='Suryabinayak', property_type='HOUSE',
+                           bedrooms=5, price_per_month=60000)
+        rejected = self.make_property('Rejected', status=PropertyStatus.REJECTED)
+
+        self.assertEqual(rebuild(top_k=2), 6)
+
+        links = SimilarProperty.objects.filter(property=base)
+        self.assertEqual([link.similar_id for link in links][:1], [twin.pk])
+        self.assertFalse(SimilarProperty.objects.filter(similar=rejected).exists())
+
+        response = self.client.get(reverse('properties:detail', args=[base.pk]), secure=True)
+        self.assertEqual(response.context['related_properties'][0], twin)
@@ -0,0 +1,75 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from apps.accounts.models import User
+from apps.core.choices import PropertyStatus
+from apps.properties.models import Property, PropertyView, Favorite
+from apps.properties.trending import HALF_LIFE, update_trending_scores
+
+
+class TrendingScoreTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username='landlord', password='pass')
+        self.tenant = User.objects.create_user(username='tenant', password='pass')
+        self.fresh = self.make_property('Fresh Flat')
+        self.stale = self.make_property('Stale Flat')
+
+    def make_property(self, title):
+        return Property.objects.create(
+            owner=self.owner, title=title, description='Desc', area='Thamel',
+            address='Addr', price_per_month=15000, status=PropertyStatus.APPROVED,
+        )
+
+    def add_views(self, prop, count, age):
+        for _ in range(count):
+            PropertyView.objects.create(property=prop, ip_address='127.0.0.1')
+        PropertyView.objects.filter(property=prop).update(viewed_at=timezone.now() - age)
+
+    def test_recent_activity_outranks_old_activity(self):
+        self.add_views(self.stale, 10, timedelta(days=9))
+        self.add_views(self.fresh, 3, timedelta(hours=2))
+        Favorite.objects.create(user=self.tenant, property=self.fresh)
+
+        update_trending_scores()
+
+        self.fresh.refresh_from_db()
+        self.stale.refresh_from_db()
+        self.assertGreater(self.fresh.trending_score, self.stale.trending_score)
+        self.assertGreater(self.stale.trending_score, 0)
+
+    def test_incremental_run_decays_and_adds_new_events(self):
+        start = timezone.now()
+        self.add_views(self.fresh, 4, timedelta(minutes=5))
+        update_trending_scores(now=start)
+        self.fresh.refresh_from_db()
+        first = self.fresh.trending_score
+
+        # One half-life later with no new activity the score halves.
+        later = start + HALF_LIFE
+        update_trending_scores(now=later)
+        self.fresh.refresh_from_db()
+        self.assertAlmostEqual(self.fresh.trending_score, first / 2, places=3)
+
+        # Events since the last run are added on top, old ones are not recounted.
+        # (New events are bucketed by hour, so their weight is only approximately 1.)
+        PropertyView.objects.create(property=self.fresh, ip_address='127.0.0.1')
+        PropertyView.objects.filter(viewed_at__gt=start).update(viewed_at=later + timedelta(minutes=1))
+        update_trending_scores(now=later + timedelta(minutes=2))
+        self.fresh.refresh_from_db()
+        self.assertAlmostEqual(self.fresh.trending_score, first / 2 + 1, delta=0.01)
+
+        self.assertEqual(
+            update_trending_scores(full=True, now=later + timedelta(minutes=2)), 1
+        )
+
+    def test_list_and_home_read_the_stored_score(self):
+        Property.objects.filter(pk=self.stale.pk).update(trending_score=5)
+        Property.objects.filter(pk=self.fresh.pk).update(trending_score=9)
+
+        response = self.client.get(reverse('properties:list'), {'sort': 'trending'}, secure=True)
+        self.assertEqual(list(response.context['properties']), [self.fresh, self.stale])
+
+        response = self.client.get(reverse('core:home'), secure=True)
+        self.assertEqual(list(response.context['trending_properties']), [self.fresh, self.stale])
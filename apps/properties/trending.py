@@ -0,0 +1,111 @@
+"""
+Trending score for property listings.
+
+Every view, favorite and inquiry adds a weighted point to a listing's
+``trending_score`` which then decays exponentially with a fixed half-life,
+so a burst of interest in a fresh listing outranks a large but stale view
+count. ``manage.py update_trending_scores`` keeps the stored score current
+incrementally: each run decays the previous value by the time elapsed and
+adds only the events recorded since the last run, bucketed by hour. Pages
+just ORDER BY the stored column; nothing is computed at request time.
+"""
+
+import math
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db.models import Count, Max
+from django.db.models.functions import TruncHour
+from django.utils import timezone
+
+from apps.inquiries.models import Inquiry
+from .models import Property, PropertyView, Favorite
+
+
+BATCH_SIZE = 500
+
+HALF_LIFE = timedelta(days=3)
+DECAY_RATE = math.log(2) / HALF_LIFE.total_seconds()
+
+# Events older than this are ignored on the first run (or after a long gap).
+WINDOW = timedelta(days=14)
+
+# Scores below this are rounded down to zero and no longer decayed.
+MIN_SCORE = 0.01
+
+# (model, property field, timestamp field, weight)
+TRENDING_EVENTS = [
+    (PropertyView, 'property_id', 'viewed_at', 1.0),
+    (Favorite, 'property_id', 'created_at', 3.0),
+    (Inquiry, 'rental_property_id', 'created_at', 5.0),
+]
+
+
+def decay(seconds):
+    """Fraction of a score that survives ``seconds`` of decay."""
+    return math.exp(-DECAY_RATE * max(seconds, 0))
+
+
+def last_run():
+    """When scores were last brought up to date, or ``None``."""
+    return Property.objects.aggregate(last=Max('trending_updated_at'))['last']
+
+
+def recent_activity(since, now):
+    """Decayed event weight per property for events in ``(since, now]``."""
+    activity = defaultdict(float)
+    for model, property_field, time_field, weight in TRENDING_EVENTS:
+        rows = (
+            model.objects
+            .filter(**{f'{time_field}__gt': since, f'{time_field}__lte': now})
+            .annotate(hour=TruncHour(time_field))
+            .values_list(property_field, 'hour')
+            .annotate(events=Count('pk'))
+            .order_by()
+        )
+        for property_id, hour, events in rows:
+            # Score each hour's events as if they happened half-way through it.
+            age = (now - hour).total_seconds() - 1800
+            activity[property_id] += weight * events * decay(age)
+    return activity
+
+
+def update_trending_scores(full=False, batch_size=BATCH_SIZE, now=None):
+    """
+    Bring every listing's ``trending_score`` up to ``now``.
+
+    Only listings with a live score or new activity are touched. With
+    ``full`` the scores are rebuilt from the last ``WINDOW`` of events.
+    Returns the number of listings updated.
+    """
+    now = now or timezone.now()
+    since = None if full else last_run()
+    if since is None or since < now - WINDOW:
+        since = now - WINDOW
+        full = True
+
+    activity = recent_activity(since, now)
+    candidates = Property.objects.filter(pk__in=list(activity))
+    if full:
+        Property.objects.exclude(pk__in=list(activity)).filter(
+            trending_score__gt=0
+        ).update(trending_score=0, trending_updated_at=now)
+    else:
+        candidates = candidates | Property.objects.filter(trending_score__gt=0)
+
+    updated = 0
+    rows = candidates.values_list('pk', 'trending_score', 'trending_updated_at').order_by('pk')
+    batch = []
+    for pk, score, scored_at in rows.iterator(chunk_size=batch_size):
+        if full or scored_at is None:
+            score = 0.0
+        else:
+            score *= decay((now - scored_at).total_seconds())
+        score += activity.get(pk, 0.0)
+        batch.append(Property(pk=pk, trending_score=score if score >= MIN_SCORE else 0.0, trending_updated_at=now))
+        if len(batch) >= batch_size:
+            updated += Property.objects.bulk_update(batch, ['trending_score', 'trending_updated_at'])
+            batch = []
+    if batch:
+        updated += Property.objects.bulk_update(batch, ['trending_score', 'trending_updated_at'])
+    return updated
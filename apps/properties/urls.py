@@ -17,6 +17,7 @@ urlpatterns = [
     path('<uuid:pk>/edit/', views.PropertyUpdateView.as_view(), name='edit'),
     path('<uuid:pk>/delete/', views.PropertyDeleteView.as_view(), name='delete'),
     path('my-properties/', views.MyPropertiesView.as_view(), name='my_properties'),
+    path('price-suggestion/', views.PriceSuggestionView.as_view(), name='price_suggestion'),
     
     # Property status
     path('<uuid:pk>/mark-rented/', views.MarkAsRentedView.as_view(), name='mark_rented'),
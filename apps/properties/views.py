@@ -14,9 +14,12 @@ from django.http import JsonResponse
 from django.db.models import Q
 from django.utils import timezone
 
-from .models import Property, PropertyImage, Favorite, PropertyView
+from .models import Property, PropertyImage, Favorite, PropertyView, favorite_ids
 from .forms import PropertyForm, PropertyImageFormSet, PropertyFilterForm
-from apps.core.choices import PropertyStatus
+from .market import suggest_price
+from .fraud import flag_price_anomaly
+from .similarity import similar_properties
+from apps.core.choices import PropertyStatus, ReportReason
 
 
 class PropertyListView(ListView):
@@ -77,7 +80,10 @@ class PropertyListView(ListView):
             'price_per_month', '-price_per_month',
             '-views_count'
         ]
-        if sort in valid_sort_options:
+        if sort == 'trending':
+            # Precomputed by manage.py update_trending_scores
+            queryset = queryset.order_by('-trending_score', '-created_at')
+        elif sort in valid_sort_options:
             queryset = queryset.order_by(sort)
         
         return queryset
@@ -88,12 +94,7 @@ class PropertyListView(ListView):
         context['total_count'] = self.get_queryset().count()
         
         # User favorites for marking
-        if self.request.user.is_authenticated:
-            context['user_favorites'] = set(
-                Favorite.objects.filter(
-                    user=self.request.user
-                ).values_list('property_id', flat=True)
-            )
+        context['user_favorites'] = favorite_ids(self.request.user)
         
         return context
 
@@ -120,16 +121,18 @@ class PropertyDetailView(DetailView):
         
         # Check if favorited
         if self.request.user.is_authenticated:
-            context['is_favorited'] = Favorite.objects.filter(
-                user=self.request.user,
-                property=property_obj
-            ).exists()
+            context['is_favorited'] = property_obj.pk in favorite_ids(self.request.user)
+            context['report_reasons'] = ReportReason.choices
         
-        # Related properties (same district, different property)
-        context['related_properties'] = Property.objects.filter(
-            status=PropertyStatus.APPROVED,
-            district=property_obj.district
-        ).exclude(pk=property_obj.pk).order_by('-created_at')[:4]
+        # Related properties, precomputed by rebuild_similar_properties;
+        # listings approved since the last run fall back to the same district.
+        related = list(similar_properties(property_obj))
+        if not related:
+            related = Property.objects.filter(
+                status=PropertyStatus.APPROVED,
+                district=property_obj.district
+            ).exclude(pk=property_obj.pk).order_by('-created_at')[:4]
+        context['related_properties'] = related
         
         return context
     
@@ -175,7 +178,24 @@ class LandlordRequiredMixin(LoginRequiredMixin, UserPassesTestMixin):
         return redirect('accounts:dashboard')
 
 
-class PropertyCreateView(LandlordRequiredMixin, SuccessMessageMixin, CreateView):
+# Form fields that can move a listing's rent out of its expected range.
+PRICE_FIELDS = {'price_per_month', 'district', 'area', 'property_type', 'bedrooms'}
+
+
+class PriceCheckMixin:
+    """Compare a saved listing's rent with comparable listings."""
+    
+    def check_price(self):
+        anomaly = flag_price_anomaly(self.object)
+        if anomaly and anomaly['direction'] == 'high':
+            messages.warning(
+                self.request,
+                f"Your rent is well above similar listings in {self.object.area} "
+                f"(typical rent Rs. {anomaly['median']:,.0f}). Consider adjusting it to attract tenants."
+            )
+
+
+class PropertyCreateView(LandlordRequiredMixin, PriceCheckMixin, SuccessMessageMixin, CreateView):
     """Create new property listing."""
     model = Property
     form_class = PropertyForm
@@ -204,6 +224,7 @@ class PropertyCreateView(LandlordRequiredMixin, SuccessMessageMixin, CreateView)
             
             image_formset.instance = self.object
             image_formset.save()
+            self.check_price()
             
             return redirect(self.get_success_url())
         else:
@@ -226,7 +247,7 @@ class PropertyOwnerMixin(LoginRequiredMixin, UserPassesTestMixin):
         return redirect('properties:list')
 
 
-class PropertyUpdateView(PropertyOwnerMixin, SuccessMessageMixin, UpdateView):
+class PropertyUpdateView(PropertyOwnerMixin, PriceCheckMixin, SuccessMessageMixin, UpdateView):
     """Edit property listing."""
     model = Property
     form_class = PropertyForm
@@ -260,6 +281,8 @@ class PropertyUpdateView(PropertyOwnerMixin, SuccessMessageMixin, UpdateView):
             
             self.object = form.save()
             image_formset.save()
+            if PRICE_FIELDS & set(form.changed_data):
+                self.check_price()
             
             return redirect(self.get_success_url())
         else:
@@ -374,3 +397,37 @@ class MarkAsAvailableView(PropertyOwnerMixin, View):
     
     def get_object(self):
         return get_object_or_404(Property, pk=self.kwargs['pk'])
+
+
+class PriceSuggestionView(LoginRequiredMixin, View):
+    """Suggest a monthly rent from the market rollup (AJAX)."""
+    
+    def get(self, request):
+        district = request.GET.get('district')
+        if not district:
+            return JsonResponse({'success': False, 'error': 'district is required'}, status=400)
+        
+        bedrooms = request.GET.get('bedrooms')
+        cell = suggest_price(
+            district=district,
+            area=request.GET.get('area'),
+            property_type=request.GET.get('property_type') or None,
+            bedrooms=int(bedrooms) if bedrooms and bedrooms.isdigit() else None,
+        )
+        if cell is None:
+            return JsonResponse({'success': True, 'suggestion': None})
+        
+        return JsonResponse({
+            'success': True,
+            'suggestion': {
+                'median': float(cell.price_median),
+                'p25': float(cell.price_p25),
+                'p75': float(cell.price_p75),
+                'price_per_sqft': float(cell.price_per_sqft_median) if cell.price_per_sqft_median else None,
+                'listing_count': cell.listing_count,
+                'district': cell.district,
+                'area': None if cell.area == cell.ALL else cell.area,
+                'property_type': None if cell.property_type == cell.ALL else cell.property_type,
+                'bedrooms': None if cell.bedrooms == cell.ALL_BEDROOMS else cell.bedrooms,
+            }
+        })
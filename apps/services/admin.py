@@ -1,5 +1,7 @@
 from django.contrib import admin
+from django.db import transaction
 from django.utils.html import format_html
+from .feed import bump_version
 from .models import FindRoomRequest, ShiftHomeRequest
 
 
@@ -14,7 +16,7 @@ class FindRoomRequestAdmin(admin.ModelAdmin):
     readonly_fields = [
         'id', 'user', 'name', 'email', 'phone',
         'property_type', 'district', 'preferred_areas',
-        'budget_range', 'bedrooms', 'move_in_date',
+        'budget_range', 'budget_min', 'budget_max', 'bedrooms', 'move_in_date',
         'duration_months', 'additional_requirements',
         'created_at', 'updated_at'
     ]
@@ -29,7 +31,7 @@ class FindRoomRequestAdmin(admin.ModelAdmin):
             'fields': ('name', 'email', 'phone')
         }),
         ('Requirements', {
-            'fields': ('property_type', 'district', 'preferred_areas', 'budget_range', 'bedrooms')
+            'fields': ('property_type', 'district', 'preferred_areas', 'budget_range', 'budget_min', 'budget_max', 'bedrooms')
         }),
         ('Schedule', {
             'fields': ('move_in_date', 'duration_months')
@@ -59,19 +61,25 @@ class FindRoomRequestAdmin(admin.ModelAdmin):
     
     actions = ['mark_reviewing', 'mark_matched', 'mark_closed']
     
+    def set_status(self, queryset, status):
+        updated = queryset.update(status=status)
+        # update() sends no post_save, so purge the cached feed pages here.
+        transaction.on_commit(bump_version)
+        return updated
+    
     @admin.action(description='Mark selected as Under Review')
     def mark_reviewing(self, request, queryset):
-        updated = queryset.update(status='REVIEWING')
+        updated = self.set_status(queryset, 'REVIEWING')
         self.message_user(request, f'{updated} requests marked as under review.')
     
     @admin.action(description='Mark selected as Matched')
     def mark_matched(self, request, queryset):
-        updated = queryset.update(status='MATCHED')
+        updated = self.set_status(queryset, 'MATCHED')
         self.message_user(request, f'{updated} requests marked as matched.')
     
     @admin.action(description='Mark selected as Closed')
     def mark_closed(self, request, queryset):
-        updated = queryset.update(status='CLOSED')
+        updated = self.set_status(queryset, 'CLOSED')
         self.message_user(request, f'{updated} requests marked as closed.')
 
 
@@ -0,0 +1,30 @@
+"""System checks for the services app."""
+
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+
+# Caches that live inside one process, so a cron job never sees the workers' entries.
+PROCESS_LOCAL_CACHES = {
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+}
+
+
+@register(Tags.caches, deploy=True)
+def check_view_count_cache(app_configs, **kwargs):
+    """Buffered room-request views need a shared cache to be drained from cron."""
+    if settings.CACHES['default']['BACKEND'] not in PROCESS_LOCAL_CACHES:
+        return []
+    return [
+        Warning(
+            'Room-request views are buffered in a process-local cache.',
+            hint=(
+                'Each worker only writes its buffered views while it serves '
+                'room request pages, and manage.py flush_room_views cannot '
+                'reach them. Set CACHE_BACKEND and CACHE_LOCATION to a shared '
+                'cache (Redis, Memcached) and run flush_room_views from cron.'
+            ),
+            id='services.W001',
+        )
+    ]
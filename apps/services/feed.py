@@ -0,0 +1,79 @@
+"""
+Cached room-request feed pages for anonymous visitors.
+
+Anonymous hits on the room-request feed are served from a page cache keyed
+on the normalized filter parameters. Keys embed a feed version number that
+the signals in ``apps.services.signals`` bump whenever a request is posted,
+edited, closed or deleted or a reply is added or removed, so every cached
+page goes stale at once without having to enumerate keys. Bulk status
+changes that bypass those signals (the admin actions) bump it themselves.
+View-count updates don't bump the version; cards may show slightly old
+view counts until the page expires after ``ROOM_FEED_CACHE_TTL`` seconds.
+
+The version is an ``apps.core.versions`` counter, so invalidation only
+reaches every worker when the cache is shared between them (Redis,
+Memcached or the database cache). With the per-process local-memory
+default, other workers keep serving their own pages until
+``ROOM_FEED_CACHE_TTL`` runs out.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Page, Paginator
+
+from apps.core import versions
+
+
+VERSION_KEY = 'services:room_feed:version'
+PAGE_KEY = 'services:room_feed:{version}:{digest}'
+
+FEED_PARAMS = ('district', 'property_type', 'budget', 'area', 'sort', 'page')
+
+
+def get_timeout():
+    return getattr(settings, 'ROOM_FEED_CACHE_TTL', 300)
+
+
+def get_version():
+    return versions.get_version(VERSION_KEY)
+
+
+def bump_version():
+    """Invalidate every cached feed page."""
+    versions.bump_version(VERSION_KEY)
+
+
+def page_key(params):
+    """Cache key for a feed page; ``params`` must already be normalized."""
+    raw = '&'.join(f'{name}={params.get(name, "")}' for name in FEED_PARAMS)
+    digest = hashlib.sha1(raw.encode()).hexdigest()
+    return PAGE_KEY.format(version=get_version(), digest=digest)
+
+
+class _Counted:
+    """Stands in for a queryset whose length is already known."""
+
+    def __init__(self, count):
+        self._count = count
+
+    def count(self):
+        return self._count
+
+
+def get_page(key):
+    """``(objects, count, number)`` for a cached page, or ``None``."""
+    return cache.get(key)
+
+
+def set_page(key, page):
+    cache.set(key, (list(page.object_list), page.paginator.count, page.number), get_timeout())
+
+
+def restore_page(cached, per_page):
+    """Rebuild ``(paginator, page, object_list, is_paginated)`` from a cache entry."""
+    objects, count, number = cached
+    paginator = Paginator(_Counted(count), per_page)
+    page = Page(objects, number, paginator)
+    return paginator, page, objects, paginator.num_pages > 1
@@ -0,0 +1,26 @@
+"""
+Write buffered room-request view counts to the database.
+
+Views are flushed from the request path about once a minute. With a cache
+shared between workers (Redis, Memcached, set through ``CACHE_BACKEND`` and
+``CACHE_LOCATION``) also run this from cron, so the buffer is written on a
+schedule even when no pages are served, e.g. every few minutes and before
+generating reports:
+
+    */5 * * * * python manage.py flush_room_views
+
+Under the default local-memory cache the command runs in its own process
+and sees none of the workers' views, so it has nothing to write.
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.services.view_counts import flush
+
+
+class Command(BaseCommand):
+    help = 'Write buffered room-request views to the database.'
+
+    def handle(self, *args, **options):
+        written = flush()
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} room-request views."))
@@ -0,0 +1,20 @@
+"""
+Rebuild the room-request / listing match table.
+
+Matches are normally kept current as requests and listings are saved; run
+this after bulk imports or scoring changes (or nightly from cron):
+
+    python manage.py match_room_requests
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.services.matching import rebuild
+
+
+class Command(BaseCommand):
+    help = 'Re-match every active room request against approved listings.'
+
+    def handle(self, *args, **options):
+        written = rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Stored {written} room matches."))
@@ -0,0 +1,58 @@
+"""
+Assign confirmed shift-home jobs to mover crews.
+
+Plans the confirmed jobs for one or more days (tomorrow by default) and
+stores each job's crew and running order. Run it from cron each evening,
+or again after confirming late bookings:
+
+    python manage.py schedule_crews
+    python manage.py schedule_crews --date 2025-01-15 --days 3 --crews 5
+    python manage.py schedule_crews --dry-run
+"""
+
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.services import scheduling
+
+
+class Command(BaseCommand):
+    help = 'Assign confirmed shift-home jobs to mover crews.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', help='First day to plan (YYYY-MM-DD); defaults to tomorrow.')
+        parser.add_argument('--days', type=int, default=1, help='Number of days to plan.')
+        parser.add_argument('--crews', type=int, help='Crews available per day.')
+        parser.add_argument('--time-limit', type=float, default=scheduling.TIME_LIMIT,
+                            help='Seconds to spend improving the plan.')
+        parser.add_argument('--dry-run', action='store_true', help='Print the plan without saving it.')
+
+    def handle(self, *args, **options):
+        if options['date']:
+            try:
+                start = date.fromisoformat(options['date'])
+            except ValueError:
+                raise CommandError(f"Invalid date: {options['date']}")
+        else:
+            start = timezone.localdate() + timedelta(days=1)
+        if options['days'] < 1:
+            raise CommandError('--days must be at least 1.')
+
+        schedule, unplaced = scheduling.plan(
+            start, options['days'], options['crews'], options['time_limit']
+        )
+        for (day, crew), route in sorted(schedule.routes.items()):
+            if route:
+                self.stdout.write(
+                    f"{day} crew {crew + 1}: {len(route)} jobs, "
+                    f"{schedule.km[(day, crew)]:.1f} km, {schedule.hours[(day, crew)]:.1f} h"
+                )
+        if unplaced:
+            self.stdout.write(self.style.WARNING(f"{len(unplaced)} jobs need manual scheduling."))
+
+        if options['dry_run']:
+            return
+        saved = scheduling.save(schedule, unplaced)
+        self.stdout.write(self.style.SUCCESS(f"Scheduled {saved} jobs."))
@@ -0,0 +1,202 @@
+"""
+Matching between tenants' room requests and approved listings.
+
+A request and a listing match when they are in the same district, the
+listing's type suits the request, it has at least the requested bedrooms
+and its rent is no more than ``BUDGET_TOLERANCE`` over the tenant's budget.
+Matching pairs are scored 0-100 on budget fit, preferred area, bedrooms and
+type, and those scoring at least ``MIN_MATCH_SCORE`` are stored in
+``RoomMatch``. New or edited requests are matched against the catalogue
+(``match_requests``) and newly approved or edited listings against open
+requests (``match_properties``), each with one candidate query per batch;
+``manage.py match_room_requests`` rebuilds everything.
+"""
+
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Q
+
+from apps.core.choices import District, PropertyStatus
+from apps.properties.market import normalize_area
+from apps.properties.models import Property
+from .models import FindRoomRequest, RoomMatch, RoomRequestArea
+
+
+BATCH_SIZE = 500
+
+MIN_MATCH_SCORE = 50
+
+# Rent may exceed the top of the budget by this fraction.
+BUDGET_TOLERANCE = 0.1
+
+MATCH_WEIGHTS = {
+    'budget': 40,
+    'area': 30,
+    'bedrooms': 15,
+    'property_type': 15,
+}
+
+# Listing types that satisfy each requested type.
+TYPE_MATCHES = {
+    'ROOM': {'ROOM'},
+    'FLAT': {'FLAT', 'APARTMENT'},
+    'HOUSE': {'HOUSE'},
+    'ANY': {'ROOM', 'FLAT', 'APARTMENT', 'HOUSE'},
+}
+
+# Room requests use upper-case district codes, listings the display names.
+REQUEST_DISTRICTS = {value.upper(): value for value in District.values}
+
+# Fields whose change can alter a match.
+REQUEST_MATCH_FIELDS = {'district', 'property_type', 'budget_range', 'budget_min', 'budget_max', 'bedrooms', 'preferred_areas', 'status'}
+PROPERTY_MATCH_FIELDS = {'district', 'area', 'property_type', 'bedrooms', 'price_per_month', 'status'}
+
+REQUEST_FIELDS = ('pk', 'district', 'property_type', 'budget_min', 'budget_max', 'bedrooms', 'preferred_areas')
+PROPERTY_FIELDS = ('pk', 'district', 'area', 'property_type', 'bedrooms', 'price_per_month')
+
+
+def preferred_area_set(preferred_areas):
+    return {normalize_area(area) for area in (preferred_areas or '').split(',') if area.strip()}
+
+
+def _request_rows(queryset):
+    """Scoring rows for the requests in ``queryset``, with their normalized areas."""
+    rows = list(queryset.values_list(*REQUEST_FIELDS))
+    areas = defaultdict(set)
+    for request_id, area in RoomRequestArea.objects.filter(
+        room_request_id__in=[row[0] for row in rows]
+    ).values_list('room_request_id', 'area'):
+        areas[request_id].add(normalize_area(area))
+
+    requests = []
+    for pk, district, property_type, low, high, bedrooms, preferred_areas in rows:
+        requests.append({
+            'pk': pk,
+            'district': REQUEST_DISTRICTS.get(district),
+            'types': TYPE_MATCHES.get(property_type, set()),
+            'property_type': property_type,
+            'low': low,
+            'high': high,
+            'bedrooms': bedrooms,
+            # Areas outside AREAS_BY_DISTRICT are still compared by name.
+            'areas': areas[pk] or preferred_area_set(preferred_areas),
+        })
+    return requests
+
+
+def _property_row(row):
+    pk, district, area, property_type, bedrooms, price = row
+    return {
+        'pk': pk,
+        'district': district,
+        'area': normalize_area(area),
+        'property_type': property_type,
+        'bedrooms': bedrooms,
+        'price': float(price),
+    }
+
+
+def score(request, listing):
+    """0-100 fit of ``listing`` for ``request``, or ``None`` if it cannot match."""
+    if listing['district'] != request['district'] or listing['property_type'] not in request['types']:
+        return None
+    if listing['bedrooms'] < request['bedrooms']:
+        return None
+
+    price, low, high = listing['price'], request['low'], request['high']
+    if high is not None and price > high * (1 + BUDGET_TOLERANCE):
+        return None
+    if high is not None and price > high:
+        budget = MATCH_WEIGHTS['budget'] * (1 - (price - high) / (high * BUDGET_TOLERANCE))
+    elif price < low:
+        budget = MATCH_WEIGHTS['budget'] * 0.75
+    else:
+        budget = MATCH_WEIGHTS['budget']
+
+    if not request['areas']:
+        area = MATCH_WEIGHTS['area'] / 2
+    else:
+        area = MATCH_WEIGHTS['area'] if listing['area'] in request['areas'] else 0
+
+    bedrooms = MATCH_WEIGHTS['bedrooms'] * (1 if listing['bedrooms'] == request['bedrooms'] else 0.5)
+    exact_type = request['property_type'] in ('ANY', listing['property_type'])
+    property_type = MATCH_WEIGHTS['property_type'] * (1 if exact_type else 2 / 3)
+
+    return round(budget + area + bedrooms + property_type)
+
+
+def _matches(requests, listings):
+    by_district = defaultdict(list)
+    for listing in listings:
+        by_district[listing['district']].append(listing)
+    for request in requests:
+        for listing in by_district[request['district']]:
+            fit = score(request, listing)
+            if fit is not None and fit >= MIN_MATCH_SCORE:
+                yield RoomMatch(room_request_id=request['pk'], rental_property_id=listing['pk'], score=fit)
+
+
+def _replace(stale, matches):
+    with transaction.atomic():
+        stale.delete()
+        RoomMatch.objects.bulk_create(matches, batch_size=BATCH_SIZE)
+    return len(matches)
+
+
+def match_requests(request_ids):
+    """Re-match the given room requests against every approved listing."""
+    requests = _request_rows(FindRoomRequest.objects.filter(pk__in=request_ids, status='ACTIVE'))
+    listings = []
+    if requests:
+        candidates = Property.objects.filter(
+            status=PropertyStatus.APPROVED,
+            district__in={request['district'] for request in requests},
+            bedrooms__gte=min(request['bedrooms'] for request in requests),
+        )
+        if all(request['high'] is not None for request in requests):
+            ceiling = max(request['high'] for request in requests) * (1 + BUDGET_TOLERANCE)
+            candidates = candidates.filter(price_per_month__lte=ceiling)
+        listings = [_property_row(row) for row in candidates.values_list(*PROPERTY_FIELDS)]
+    return _replace(
+        RoomMatch.objects.filter(room_request_id__in=request_ids),
+        list(_matches(requests, listings)),
+    )
+
+
+def match_properties(property_ids):
+    """Re-match the given listings against every active room request."""
+    listings = [
+        _property_row(row) for row in
+        Property.objects.filter(pk__in=property_ids, status=PropertyStatus.APPROVED).values_list(*PROPERTY_FIELDS)
+    ]
+    requests = []
+    if listings:
+        districts = {listing['district'] for listing in listings}
+        cheapest = min(listing['price'] for listing in listings)
+        candidates = FindRoomRequest.objects.filter(
+            Q(budget_max__isnull=True) | Q(budget_max__gte=cheapest / (1 + BUDGET_TOLERANCE)),
+            status='ACTIVE',
+            district__in=[code for code, name in REQUEST_DISTRICTS.items() if name in districts],
+            bedrooms__lte=max(listing['bedrooms'] for listing in listings),
+        )
+        requests = _request_rows(candidates)
+    return _replace(
+        RoomMatch.objects.filter(rental_property_id__in=property_ids),
+        list(_matches(requests, listings)),
+    )
+
+
+def unmatch_properties(property_ids):
+    RoomMatch.objects.filter(rental_property_id__in=property_ids).delete()
+
+
+def rebuild():
+    """Drop matches that no longer apply and re-match every active request."""
+    RoomMatch.objects.exclude(room_request__status='ACTIVE').delete()
+    RoomMatch.objects.exclude(rental_property__status=PropertyStatus.APPROVED).delete()
+    request_ids = list(FindRoomRequest.objects.filter(status='ACTIVE').values_list('pk', flat=True))
+    written = 0
+    for start in range(0, len(request_ids), BATCH_SIZE):
+        written += match_requests(request_ids[start:start + BATCH_SIZE])
+    return written
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0002_alter_findroomrequest_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='findroomrequest',
+            name='phone_e164',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='Normalized E.164 phone number', max_length=16),
+        ),
+        migrations.AddField(
+            model_name='shifthomerequest',
+            name='phone_e164',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='Normalized E.164 phone number', max_length=16),
+        ),
+    ]
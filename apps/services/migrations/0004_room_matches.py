@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0011_property_co_occurrence'),
+        ('services', '0003_phone_e164'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RoomMatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.PositiveSmallIntegerField(help_text='0-100 fit between the request and the property')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('rental_property', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='room_matches', to='properties.property')),
+                ('room_request', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='matches', to='services.findroomrequest')),
+            ],
+            options={
+                'verbose_name': 'Room Match',
+                'verbose_name_plural': 'Room Matches',
+                'ordering': ['-score', '-created_at'],
+                'indexes': [models.Index(fields=['room_request', '-score'], name='services_ro_room_re_aa7fbc_idx'), models.Index(fields=['rental_property', '-score'], name='services_ro_rental__ffa457_idx')],
+                'constraints': [models.UniqueConstraint(fields=('room_request', 'rental_property'), name='unique_room_match')],
+            },
+        ),
+    ]
@@ -0,0 +1,115 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:56
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+# Copies of apps.services.models.budget_bounds / parse_preferred_areas and
+# of the known areas as they were when this migration was written, so that
+# later changes to them do not alter the backfill.
+AREAS_BY_DISTRICT = {
+    'Kathmandu': [
+        'Thamel', 'Naxal', 'Baneshwor', 'Koteshwor', 'Chabahil',
+        'Balaju', 'Kalimati', 'Putalisadak', 'New Baneshwor', 'Maharajgunj',
+        'Budhanilkantha', 'Jorpati', 'Bouddha', 'Swayambhu', 'Kalanki',
+        'Kirtipur', 'Gongabu', 'Samakhushi', 'Basundhara', 'Lazimpat',
+        'Durbarmarg', 'Jamal', 'Battisputali', 'Gaushala', 'Maitidevi',
+    ],
+    'Bhaktapur': [
+        'Suryabinayak', 'Thimi', 'Changunarayan', 'Sallaghari', 'Duwakot',
+        'Lokanthali', 'Katunje', 'Jagati', 'Byasi', 'Sipadol',
+        'Tathali', 'Dattatreya', 'Kamalbinayak', 'Nagarkot',
+    ],
+    'Lalitpur': [
+        'Jhamsikhel', 'Sanepa', 'Jawalakhel', 'Pulchowk', 'Lagankhel',
+        'Satdobato', 'Imadol', 'Ekantakuna', 'Kupondole', 'Patan',
+        'Mangalbazar', 'Gwarko', 'Tikathali', 'Lubhu', 'Godawari',
+        'Balkumari', 'Nakhipot', 'Dhobighat', 'Kupandol',
+    ],
+}
+
+
+def budget_bounds(budget_range):
+    low, _, high = (budget_range or '0').rstrip('+').partition('-')
+    return int(low), int(high) if high else None
+
+
+def parse_preferred_areas(district, preferred_areas):
+    known = {area.lower(): area for area in AREAS_BY_DISTRICT.get((district or '').title(), [])}
+    areas = []
+    for name in (preferred_areas or '').split(','):
+        area = known.get(' '.join(name.split()).lower())
+        if area and area not in areas:
+            areas.append(area)
+    return areas
+
+
+def backfill_budget_and_areas(apps, schema_editor):
+    FindRoomRequest = apps.get_model('services', 'FindRoomRequest')
+    RoomRequestArea = apps.get_model('services', 'RoomRequestArea')
+    rows = FindRoomRequest.objects.values_list('pk', 'budget_range', 'district', 'preferred_areas')
+    requests, areas = [], []
+    for pk, budget_range, district, preferred_areas in rows.iterator(chunk_size=1000):
+        budget_min, budget_max = budget_bounds(budget_range)
+        requests.append(FindRoomRequest(pk=pk, budget_min=budget_min, budget_max=budget_max))
+        areas.extend(
+            RoomRequestArea(room_request_id=pk, area=area)
+            for area in parse_preferred_areas(district, preferred_areas)
+        )
+    FindRoomRequest.objects.bulk_update(requests, ['budget_min', 'budget_max'], batch_size=1000)
+    RoomRequestArea.objects.bulk_create(areas, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0004_room_matches'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RoomRequestArea',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('area', models.CharField(max_length=100)),
+            ],
+            options={
+                'verbose_name': 'Room Request Area',
+                'verbose_name_plural': 'Room Request Areas',
+            },
+        ),
+        migrations.AddField(
+            model_name='findroomrequest',
+            name='budget_max',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='findroomrequest',
+            name='budget_min',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='findroomrequest',
+            index=models.Index(fields=['status', 'district', 'budget_min'], name='services_fi_status_5181c5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='findroomrequest',
+            index=models.Index(fields=['status', 'budget_max'], name='services_fi_status_199991_idx'),
+        ),
+        migrations.AddField(
+            model_name='roomrequestarea',
+            name='room_request',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='areas', to='services.findroomrequest'),
+        ),
+        migrations.AddIndex(
+            model_name='roomrequestarea',
+            index=models.Index(fields=['area'], name='services_ro_area_2ccf98_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='roomrequestarea',
+            constraint=models.UniqueConstraint(fields=('room_request', 'area'), name='unique_room_request_area'),
+        ),
+        migrations.RunPython(backfill_budget_and_areas, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:58
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_replies(apps, schema_editor):
+    FindRoomRequest = apps.get_model('services', 'FindRoomRequest')
+    RoomRequestReply = apps.get_model('services', 'RoomRequestReply')
+    replies = RoomRequestReply.objects.filter(room_request=OuterRef('pk')).order_by().values(
+        'room_request'
+    ).annotate(n=Count('pk')).values('n')
+    FindRoomRequest.objects.update(replies_count=Coalesce(Subquery(replies), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0005_room_request_budget_and_areas'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='findroomrequest',
+            name='replies_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='findroomrequest',
+            index=models.Index(fields=['status', '-created_at'], name='services_fi_status_b1beea_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='findroomrequest',
+            index=models.Index(fields=['status', '-views_count'], name='services_fi_status_77c8b0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='findroomrequest',
+            index=models.Index(fields=['status', 'replies_count'], name='services_fi_status_07b4c4_idx'),
+        ),
+        migrations.RunPython(count_replies, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0006_room_request_replies_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CrewAssignment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scheduled_date', models.DateField()),
+                ('crew', models.PositiveSmallIntegerField(help_text='Crew number, from 1')),
+                ('sequence', models.PositiveSmallIntegerField(help_text="Order of the job in the crew's day, from 1")),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('shift_request', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='crew_assignment', to='services.shifthomerequest')),
+            ],
+            options={
+                'verbose_name': 'Crew Assignment',
+                'verbose_name_plural': 'Crew Assignments',
+                'ordering': ['scheduled_date', 'crew', 'sequence'],
+                'indexes': [models.Index(fields=['scheduled_date', 'crew', 'sequence'], name='services_cr_schedul_f39054_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0007_crew_assignments'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='findroomrequest',
+            index=models.Index(fields=['district', 'status'], name='services_fi_distric_4f387a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='findroomrequest',
+            index=models.Index(fields=['-created_at'], name='services_fi_created_b4183c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shifthomerequest',
+            index=models.Index(fields=['status', '-created_at'], name='services_sh_status_dd2959_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shifthomerequest',
+            index=models.Index(fields=['from_district', 'status'], name='services_sh_from_di_7d0b4a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shifthomerequest',
+            index=models.Index(fields=['-created_at'], name='services_sh_created_a1a53c_idx'),
+        ),
+    ]
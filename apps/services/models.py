@@ -2,9 +2,31 @@ import uuid
 from django.db import models
 from django.conf import settings
 from django.urls import reverse
+from apps.core.choices import AREAS_BY_DISTRICT
+from apps.core.models import NormalizedPhoneMixin
 
 
-class FindRoomRequest(models.Model):
+def budget_bounds(budget_range):
+    """``(low, high)`` rent for a budget choice such as ``'10000-15000'``; ``high`` is ``None`` for ``'50000+'``."""
+    low, _, high = (budget_range or '0').rstrip('+').partition('-')
+    return int(low), int(high) if high else None
+
+
+def parse_preferred_areas(district, preferred_areas):
+    """
+    Known areas of ``district`` named in the comma-separated
+    ``preferred_areas`` text, spelled as in ``AREAS_BY_DISTRICT``.
+    """
+    known = {area.lower(): area for area in AREAS_BY_DISTRICT.get((district or '').title(), [])}
+    areas = []
+    for name in (preferred_areas or '').split(','):
+        area = known.get(' '.join(name.split()).lower())
+        if area and area not in areas:
+            areas.append(area)
+    return areas
+
+
+class FindRoomRequest(NormalizedPhoneMixin, models.Model):
     """Request from a tenant looking for a room/property - visible to landlords."""
     
     STATUS_CHOICES = [
@@ -55,6 +77,9 @@ class FindRoomRequest(models.Model):
     district = models.CharField(max_length=20, choices=DISTRICT_CHOICES)
     preferred_areas = models.TextField(help_text="Comma-separated list of preferred areas")
     budget_range = models.CharField(max_length=20, choices=BUDGET_CHOICES)
+    # Numeric copy of budget_range for range queries; no upper bound is NULL
+    budget_min = models.PositiveIntegerField(default=0, editable=False)
+    budget_max = models.PositiveIntegerField(blank=True, null=True, editable=False)
     bedrooms = models.PositiveIntegerField(default=1)
     
     # Preferences
@@ -67,6 +92,8 @@ class FindRoomRequest(models.Model):
     
     # View count
     views_count = models.PositiveIntegerField(default=0)
+    # Maintained by the RoomRequestReply signals in apps.services.signals
+    replies_count = models.PositiveIntegerField(default=0, editable=False)
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -75,16 +102,59 @@ class FindRoomRequest(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Room Request'
         verbose_name_plural = 'Room Requests'
+        indexes = [
+            models.Index(fields=['status', 'district', 'budget_min']),
+            models.Index(fields=['status', 'budget_max']),
+            models.Index(fields=['status', '-created_at']),
+            models.Index(fields=['status', '-views_count']),
+            models.Index(fields=['status', 'replies_count']),
+            models.Index(fields=['district', 'status']),
+            models.Index(fields=['-created_at']),
+        ]
     
     def __str__(self):
         return f"{self.title} - {self.get_district_display()}"
     
+    def save(self, *args, **kwargs):
+        self.budget_min, self.budget_max = budget_bounds(self.budget_range)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'budget_range' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'budget_min', 'budget_max'}
+        super().save(*args, **kwargs)
+    
+    def sync_areas(self):
+        """Rebuild the normalized ``areas`` rows from ``preferred_areas``."""
+        self.areas.all().delete()
+        RoomRequestArea.objects.bulk_create([
+            RoomRequestArea(room_request=self, area=area)
+            for area in parse_preferred_areas(self.district, self.preferred_areas)
+        ])
+    
     def get_absolute_url(self):
         return reverse('services:room_request_detail', kwargs={'pk': self.pk})
-    
-    @property
-    def replies_count(self):
-        return self.replies.count()
+
+
+class RoomRequestArea(models.Model):
+    """A known area a room request names in ``preferred_areas``."""
+    room_request = models.ForeignKey(
+        FindRoomRequest,
+        on_delete=models.CASCADE,
+        related_name='areas'
+    )
+    area = models.CharField(max_length=100)
+
+    class Meta:
+        verbose_name = 'Room Request Area'
+        verbose_name_plural = 'Room Request Areas'
+        constraints = [
+            models.UniqueConstraint(fields=['room_request', 'area'], name='unique_room_request_area'),
+        ]
+        indexes = [
+            models.Index(fields=['area']),
+        ]
+
+    def __str__(self):
+        return self.area
 
 
 class RoomRequestReply(models.Model):
@@ -122,7 +192,7 @@ class RoomRequestReply(models.Model):
         return f"Reply by {self.landlord.get_full_name()} on {self.room_request.title}"
 
 
-class ShiftHomeRequest(models.Model):
+class ShiftHomeRequest(NormalizedPhoneMixin, models.Model):
     """Request for home shifting/moving services."""
     
     STATUS_CHOICES = [
@@ -206,6 +276,70 @@ class ShiftHomeRequest(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Shift Home Request'
         verbose_name_plural = 'Shift Home Requests'
+        indexes = [
+            models.Index(fields=['status', '-created_at']),
+            models.Index(fields=['from_district', 'status']),
+            models.Index(fields=['-created_at']),
+        ]
     
     def __str__(self):
         return f"Shift from {self.from_area} to {self.to_area} by {self.name}"
+
+
+class RoomMatch(models.Model):
+    """
+    An approved property that fits an active room request, maintained by
+    ``apps.services.matching``.
+    """
+    room_request = models.ForeignKey(
+        FindRoomRequest,
+        on_delete=models.CASCADE,
+        related_name='matches'
+    )
+    rental_property = models.ForeignKey(
+        'properties.Property',
+        on_delete=models.CASCADE,
+        related_name='room_matches'
+    )
+    score = models.PositiveSmallIntegerField(help_text="0-100 fit between the request and the property")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-score', '-created_at']
+        verbose_name = 'Room Match'
+        verbose_name_plural = 'Room Matches'
+        constraints = [
+            models.UniqueConstraint(fields=['room_request', 'rental_property'], name='unique_room_match'),
+        ]
+        indexes = [
+            models.Index(fields=['room_request', '-score']),
+            models.Index(fields=['rental_property', '-score']),
+        ]
+
+    def __str__(self):
+        return f"{self.rental_property_id} for {self.room_request_id} ({self.score})"
+
+
+class CrewAssignment(models.Model):
+    """Where a confirmed shift-home job sits in the mover crews' schedule."""
+    shift_request = models.OneToOneField(
+        ShiftHomeRequest,
+        on_delete=models.CASCADE,
+        related_name='crew_assignment'
+    )
+    scheduled_date = models.DateField()
+    crew = models.PositiveSmallIntegerField(help_text="Crew number, from 1")
+    sequence = models.PositiveSmallIntegerField(help_text="Order of the job in the crew's day, from 1")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['scheduled_date', 'crew', 'sequence']
+        verbose_name = 'Crew Assignment'
+        verbose_name_plural = 'Crew Assignments'
+        indexes = [
+            models.Index(fields=['scheduled_date', 'crew', 'sequence']),
+        ]
+
+    def __str__(self):
+        return f"Crew {self.crew} on {self.scheduled_date} (#{self.sequence})"
@@ -0,0 +1,155 @@
+"""
+Instant price estimates for home shifting.
+
+Every area listed in ``apps.core.choices`` has a static centroid, and the
+road distance between any two of them comes from an area-to-area matrix
+(great-circle distance times ``ROAD_FACTOR``) that is built once per
+process as a small float32 NumPy array. An estimate is then a couple of
+dictionary lookups, one array read and the ``TARIFFS`` arithmetic - no
+routing service and no database access - so ``ShiftHomeCreateView`` can
+fill in ``estimated_cost`` at submission. Moves to or from outside the
+valley are left for a manual quote.
+"""
+
+from decimal import Decimal
+from functools import lru_cache
+
+import numpy as np
+
+from apps.core.choices import AREAS_BY_DISTRICT
+
+
+# Approximate (latitude, longitude) of each known area.
+AREA_CENTROIDS = {
+    'Kathmandu': {
+        'Thamel': (27.7153, 85.3123), 'Naxal': (27.7145, 85.3290),
+        'Baneshwor': (27.6915, 85.3420), 'Koteshwor': (27.6789, 85.3494),
+        'Chabahil': (27.7174, 85.3463), 'Balaju': (27.7344, 85.3043),
+        'Kalimati': (27.6985, 85.2990), 'Putalisadak': (27.7040, 85.3220),
+        'New Baneshwor': (27.6890, 85.3360), 'Maharajgunj': (27.7376, 85.3310),
+        'Budhanilkantha': (27.7650, 85.3650), 'Jorpati': (27.7220, 85.3740),
+        'Bouddha': (27.7215, 85.3620), 'Swayambhu': (27.7149, 85.2904),
+        'Kalanki': (27.6933, 85.2816), 'Kirtipur': (27.6780, 85.2775),
+        'Gongabu': (27.7350, 85.3140), 'Samakhushi': (27.7300, 85.3180),
+        'Basundhara': (27.7420, 85.3270), 'Lazimpat': (27.7230, 85.3210),
+        'Durbarmarg': (27.7110, 85.3170), 'Jamal': (27.7080, 85.3150),
+        'Battisputali': (27.7050, 85.3440), 'Gaushala': (27.7085, 85.3450),
+        'Maitidevi': (27.7050, 85.3320),
+    },
+    'Bhaktapur': {
+        'Suryabinayak': (27.6640, 85.4290), 'Thimi': (27.6800, 85.3880),
+        'Changunarayan': (27.7160, 85.4280), 'Sallaghari': (27.6720, 85.4100),
+        'Duwakot': (27.6940, 85.4100), 'Lokanthali': (27.6750, 85.3600),
+        'Katunje': (27.6560, 85.4250), 'Jagati': (27.6690, 85.4400),
+        'Byasi': (27.6760, 85.4330), 'Sipadol': (27.6550, 85.4060),
+        'Tathali': (27.6800, 85.4600), 'Dattatreya': (27.6730, 85.4350),
+        'Kamalbinayak': (27.6770, 85.4380), 'Nagarkot': (27.7150, 85.5200),
+    },
+    'Lalitpur': {
+        'Jhamsikhel': (27.6780, 85.3060), 'Sanepa': (27.6840, 85.3030),
+        'Jawalakhel': (27.6720, 85.3130), 'Pulchowk': (27.6780, 85.3170),
+        'Lagankhel': (27.6670, 85.3230), 'Satdobato': (27.6560, 85.3250),
+        'Imadol': (27.6620, 85.3440), 'Ekantakuna': (27.6660, 85.3080),
+        'Kupondole': (27.6870, 85.3160), 'Patan': (27.6730, 85.3250),
+        'Mangalbazar': (27.6725, 85.3255), 'Gwarko': (27.6660, 85.3320),
+        'Tikathali': (27.6530, 85.3550), 'Lubhu': (27.6450, 85.3700),
+        'Godawari': (27.5920, 85.3800), 'Balkumari': (27.6700, 85.3400),
+        'Nakhipot': (27.6560, 85.3140), 'Dhobighat': (27.6780, 85.2990),
+        'Kupandol': (27.6870, 85.3160),
+    },
+}
+
+# Used when an area is not recognised.
+DISTRICT_CENTROIDS = {
+    'Kathmandu': (27.7172, 85.3240),
+    'Lalitpur': (27.6588, 85.3247),
+    'Bhaktapur': (27.6710, 85.4298),
+}
+
+# Road distance is longer than the straight line between centroids.
+ROAD_FACTOR = 1.35
+EARTH_RADIUS_KM = 6371.0
+
+# Shortest distance charged, e.g. for moves within one area.
+MIN_DISTANCE_KM = 2.0
+
+# Rupees per property size: truck and crew, per road km, packing, heavy items.
+TARIFFS = {
+    'ROOM': {'base': 3000, 'per_km': 60, 'packing': 1000, 'heavy_items': 1000},
+    '1BHK': {'base': 5000, 'per_km': 80, 'packing': 2000, 'heavy_items': 1500},
+    '2BHK': {'base': 8000, 'per_km': 100, 'packing': 3500, 'heavy_items': 2000},
+    '3BHK': {'base': 12000, 'per_km': 120, 'packing': 5000, 'heavy_items': 2500},
+    'HOUSE': {'base': 18000, 'per_km': 150, 'packing': 8000, 'heavy_items': 3500},
+}
+
+# Estimates are rounded to this many rupees.
+ROUND_TO = 100
+
+
+def _points():
+    """``(district, area or None)`` keys and coordinates, areas first."""
+    keys, coords = [], []
+    for district in AREAS_BY_DISTRICT:
+        for area in AREAS_BY_DISTRICT[district]:
+            keys.append((district, area.lower()))
+            coords.append(AREA_CENTROIDS[district][area])
+    for district, centroid in DISTRICT_CENTROIDS.items():
+        keys.append((district, None))
+        coords.append(centroid)
+    return keys, np.radians(np.array(coords))
+
+
+@lru_cache(maxsize=None)
+def distance_matrix():
+    """``(index, matrix)``: point key -> row, and road km between every pair of points."""
+    keys, coords = _points()
+    lat, lon = coords[:, 0][:, None], coords[:, 1][:, None]
+    # Haversine between every pair of centroids at once.
+    a = np.sin((lat - lat.T) / 2) ** 2 + np.cos(lat) * np.cos(lat.T) * np.sin((lon - lon.T) / 2) ** 2
+    km = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a)) * ROAD_FACTOR
+    return {key: i for i, key in enumerate(keys)}, km.astype(np.float32)
+
+
+def point_index(district, area):
+    """Matrix row for an area, falling back to the district centre; ``None`` outside the valley."""
+    index, _ = distance_matrix()
+    district = (district or '').title()
+    key = (district, ' '.join((area or '').split()).lower())
+    if key in index:
+        return index[key]
+    return index.get((district, None))
+
+
+def road_distance(from_district, from_area, to_district, to_area):
+    """Estimated road km between two areas, or ``None`` if either is outside the valley."""
+    start, end = point_index(from_district, from_area), point_index(to_district, to_area)
+    if start is None or end is None:
+        return None
+    _, matrix = distance_matrix()
+    return max(float(matrix[start, end]), MIN_DISTANCE_KM)
+
+
+def estimate_cost(from_district, from_area, to_district, to_area, property_size,
+                  has_heavy_items=False, needs_packing=False):
+    """Estimated price in rupees, or ``None`` when the move needs a manual quote."""
+    tariff = TARIFFS.get(property_size)
+    distance = road_distance(from_district, from_area, to_district, to_area)
+    if tariff is None or distance is None:
+        return None
+    cost = tariff['base'] + tariff['per_km'] * distance
+    if needs_packing:
+        cost += tariff['packing']
+    if has_heavy_items:
+        cost += tariff['heavy_items']
+    return Decimal(int(round(cost / ROUND_TO)) * ROUND_TO)
+
+
+def quote_for(shift_request):
+    """``estimate_cost`` for a ``ShiftHomeRequest``."""
+    return estimate_cost(
+        shift_request.from_district, shift_request.from_area,
+        shift_request.to_district, shift_request.to_area,
+        shift_request.property_size,
+        has_heavy_items=shift_request.has_heavy_items,
+        needs_packing=shift_request.needs_packing,
+    )
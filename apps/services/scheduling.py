@@ -0,0 +1,286 @@
+"""
+Crew scheduling for confirmed shift-home jobs.
+
+Every confirmed job is assigned a day, a mover crew and a place in that
+crew's run so that total driving - from the depot, between one job's drop
+off and the next pickup, and back - is as short as possible while no crew
+works more than its day, counting each job's loading, unloading and
+loaded drive as well as the driving between jobs. Jobs with
+``flexible_date`` may move up to ``FLEXIBLE_DAYS`` either side of the
+preferred date at a small penalty per day; others stay on their preferred
+date. ``solve`` builds a plan by cheapest insertion and then improves it
+by relocating single jobs and by swapping pairs of jobs between runs
+until nothing improves or the time limit is reached, using the area
+distance matrix from ``apps.services.quotes``. ``manage.py schedule_crews``
+and the admin crew schedule page run it and store the result as
+``CrewAssignment`` rows; jobs already assigned to a day outside the
+planned range keep that assignment.
+"""
+
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+
+from .models import ShiftHomeRequest, CrewAssignment
+from .quotes import distance_matrix, point_index
+
+
+# Hours of loading and unloading by property size.
+JOB_HOURS = {'ROOM': 2, '1BHK': 3, '2BHK': 4, '3BHK': 6, 'HOUSE': 8}
+PACKING_HOURS = 1
+
+AVERAGE_SPEED_KMH = 15
+
+FLEXIBLE_DAYS = 2
+# Cost of moving a flexible job one day from its preferred date, in km.
+DAY_SHIFT_PENALTY_KM = 5
+
+# Crews start and finish the day here.
+DEPOT = ('Kathmandu', None)
+
+TIME_LIMIT = 5.0
+
+
+def get_crew_count():
+    return getattr(settings, 'MOVER_CREW_COUNT', 4)
+
+
+def get_day_hours():
+    return getattr(settings, 'MOVER_CREW_DAY_HOURS', 9)
+
+
+class Schedule:
+    """Routes of a plan in progress; ``routes[(day, crew)]`` lists job indices in order."""
+
+    def __init__(self, jobs, days, crews, matrix, depot, day_hours):
+        self.jobs, self.days, self.crews = jobs, days, crews
+        self.matrix, self.depot, self.day_hours = matrix, depot, day_hours
+        self.routes = {(day, crew): [] for day in days for crew in range(crews)}
+        # Hours of each job on its own: loading, unloading and the loaded drive.
+        self.work = [job['hours'] + matrix[job['start'], job['end']] / AVERAGE_SPEED_KMH for job in jobs]
+        self.hours = dict.fromkeys(self.routes, 0.0)
+        self.km = dict.fromkeys(self.routes, 0.0)
+        self.placed = {}
+
+    def _ends(self, route, position):
+        """Drop-off point before and pickup point after ``position`` in ``route``."""
+        before = self.jobs[route[position - 1]]['end'] if position else self.depot
+        after = self.jobs[route[position]]['start'] if position < len(route) else self.depot
+        return before, after
+
+    def day_penalty(self, job, day):
+        return abs((day - job['preferred']).days) * DAY_SHIFT_PENALTY_KM
+
+    def best_insertion(self, index, keys=None):
+        """
+        Cheapest feasible ``(cost, key, position, km)`` for job ``index``,
+        or ``None``; ``keys`` limits the search to those routes.
+        """
+        job, matrix = self.jobs[index], self.matrix
+        if keys is None:
+            keys = [(day, crew) for day in job['days'] for crew in range(self.crews)]
+        best = None
+        tried_empty = set()
+        for key in keys:
+            day = key[0]
+            if day not in job['days']:
+                continue
+            route = self.routes[key]
+            if not route:
+                # Empty crews are interchangeable; only try one per day.
+                if day in tried_empty:
+                    continue
+                tried_empty.add(day)
+            penalty = self.day_penalty(job, day)
+            for position in range(len(route) + 1):
+                before, after = self._ends(route, position)
+                km = matrix[before, job['start']] + matrix[job['end'], after] - matrix[before, after]
+                if self.hours[key] + self.work[index] + km / AVERAGE_SPEED_KMH > self.day_hours:
+                    continue
+                cost = km + penalty
+                if best is None or cost < best[0]:
+                    best = (cost, key, position, km)
+        return best
+
+    def insert(self, index, key, position, km):
+        self.routes[key].insert(position, index)
+        self.hours[key] += self.work[index] + km / AVERAGE_SPEED_KMH
+        self.km[key] += km
+        self.placed[index] = key
+
+    def remove(self, index):
+        """Take job ``index`` out of its route; returns the km saved."""
+        key = self.placed.pop(index)
+        route = self.routes[key]
+        position = route.index(index)
+        job = self.jobs[index]
+        before = self.jobs[route[position - 1]]['end'] if position else self.depot
+        after = self.jobs[route[position + 1]]['start'] if position + 1 < len(route) else self.depot
+        km = (self.matrix[before, job['start']] + self.matrix[job['end'], after]
+              - self.matrix[before, after])
+        route.pop(position)
+        self.hours[key] -= self.work[index] + km / AVERAGE_SPEED_KMH
+        self.km[key] -= km
+        return km, key, position
+
+    def cost(self):
+        return sum(self.km.values()) + sum(
+            self.day_penalty(self.jobs[index], key[0]) for index, key in self.placed.items()
+        )
+
+
+def solve(jobs, days, crews, day_hours, time_limit=TIME_LIMIT):
+    """
+    Plan ``jobs`` (dicts with ``start``/``end`` matrix rows, loading and
+    unloading ``hours``, ``preferred`` date and allowed ``days``) over
+    ``days`` and ``crews``.
+    Returns the ``Schedule``; jobs that fit nowhere are left out of ``placed``.
+    """
+    index, matrix = distance_matrix()
+    matrix = matrix.astype(float)
+    schedule = Schedule(jobs, days, crews, matrix, index[DEPOT], day_hours)
+    deadline = time.monotonic() + time_limit
+
+    # Greedy: pin the fixed-date and the longest jobs first.
+    order = sorted(range(len(jobs)), key=lambda i: (len(jobs[i]['days']), -schedule.work[i]))
+    for i in order:
+        best = schedule.best_insertion(i)
+        if best:
+            schedule.insert(i, best[1], best[2], best[3])
+
+    # Local search: move single jobs wherever they cost less, and retry
+    # anything still unplaced; once that stalls, swap jobs between runs
+    # (which full crews can't reach one move at a time). Stop when neither
+    # finds anything better.
+    improved = True
+    while improved and time.monotonic() < deadline:
+        improved = _relocate(schedule, deadline) or _swap(schedule, deadline)
+    return schedule
+
+
+def _relocate(schedule, deadline):
+    improved = False
+    for i in range(len(schedule.jobs)):
+        if time.monotonic() >= deadline:
+            break
+        if i not in schedule.placed:
+            best = schedule.best_insertion(i)
+            if best:
+                schedule.insert(i, best[1], best[2], best[3])
+                improved = True
+            continue
+        saved, key, position = schedule.remove(i)
+        current = saved + schedule.day_penalty(schedule.jobs[i], key[0])
+        best = schedule.best_insertion(i)
+        if best and best[0] < current - 1e-6:
+            schedule.insert(i, best[1], best[2], best[3])
+            improved = True
+        else:
+            schedule.insert(i, key, position, saved)
+    return improved
+
+
+def _swap(schedule, deadline):
+    jobs = schedule.jobs
+    for i in range(len(jobs)):
+        for j in range(i + 1, len(jobs)):
+            if time.monotonic() >= deadline:
+                return False
+            if i not in schedule.placed or j not in schedule.placed:
+                continue
+            key_i, key_j = schedule.placed[i], schedule.placed[j]
+            if key_i == key_j or key_i[0] not in jobs[j]['days'] or key_j[0] not in jobs[i]['days']:
+                continue
+            saved_i, _, position_i = schedule.remove(i)
+            saved_j, _, position_j = schedule.remove(j)
+            current = (saved_i + schedule.day_penalty(jobs[i], key_i[0])
+                       + saved_j + schedule.day_penalty(jobs[j], key_j[0]))
+            best_i = schedule.best_insertion(i, [key_j])
+            if best_i:
+                schedule.insert(i, best_i[1], best_i[2], best_i[3])
+                best_j = schedule.best_insertion(j, [key_i])
+                if best_j and best_i[0] + best_j[0] < current - 1e-6:
+                    schedule.insert(j, best_j[1], best_j[2], best_j[3])
+                    return True
+                schedule.remove(i)
+            schedule.insert(j, key_j, position_j, saved_j)
+            schedule.insert(i, key_i, position_i, saved_i)
+    return False
+
+
+def load_jobs(start_date, days=1):
+    """
+    Confirmed jobs that can be done between ``start_date`` and ``days``
+    later. Jobs already scheduled on a day outside that range stay there
+    and are left out, so planning one day never takes jobs from another.
+    """
+    end_date = start_date + timedelta(days=days - 1)
+    requests = ShiftHomeRequest.objects.filter(
+        status='CONFIRMED',
+        preferred_date__gte=start_date - timedelta(days=FLEXIBLE_DAYS),
+        preferred_date__lte=end_date + timedelta(days=FLEXIBLE_DAYS),
+    ).exclude(
+        crew_assignment__scheduled_date__lt=start_date,
+    ).exclude(
+        crew_assignment__scheduled_date__gt=end_date,
+    ).values_list(
+        'pk', 'preferred_date', 'flexible_date', 'property_size', 'needs_packing',
+        'from_district', 'from_area', 'to_district', 'to_area',
+    )
+    jobs, skipped = [], []
+    for pk, preferred, flexible, size, packing, from_district, from_area, to_district, to_area in requests:
+        start, end = point_index(from_district, from_area), point_index(to_district, to_area)
+        spread = FLEXIBLE_DAYS if flexible else 0
+        allowed = [
+            preferred + timedelta(days=offset) for offset in range(-spread, spread + 1)
+            if start_date <= preferred + timedelta(days=offset) <= end_date
+        ]
+        if not allowed:
+            continue
+        if start is None or end is None:
+            # Moves outside the valley are planned by hand.
+            skipped.append(pk)
+            continue
+        jobs.append({
+            'pk': pk,
+            'start': start,
+            'end': end,
+            'hours': JOB_HOURS.get(size, JOB_HOURS['2BHK']) + (PACKING_HOURS if packing else 0),
+            'preferred': preferred,
+            'days': allowed,
+        })
+    return jobs, skipped
+
+
+def plan(start_date, days=1, crews=None, time_limit=TIME_LIMIT):
+    """
+    Schedule the confirmed jobs for a date range. Returns ``(schedule,
+    unplaced)`` where ``unplaced`` lists the pks of jobs that fit no crew
+    or lie outside the valley.
+    """
+    dates = [start_date + timedelta(days=offset) for offset in range(days)]
+    jobs, skipped = load_jobs(start_date, days)
+    schedule = solve(jobs, dates, crews or get_crew_count(), get_day_hours(), time_limit)
+    unplaced = skipped + [job['pk'] for i, job in enumerate(jobs) if i not in schedule.placed]
+    return schedule, unplaced
+
+
+def save(schedule, unplaced=()):
+    """Replace the stored assignments of every job in ``schedule``."""
+    assignments = [
+        CrewAssignment(
+            shift_request_id=schedule.jobs[index]['pk'],
+            scheduled_date=day,
+            crew=crew + 1,
+            sequence=sequence,
+        )
+        for (day, crew), route in schedule.routes.items()
+        for sequence, index in enumerate(route, start=1)
+    ]
+    pks = [job['pk'] for job in schedule.jobs] + list(unplaced)
+    with transaction.atomic():
+        CrewAssignment.objects.filter(shift_request_id__in=pks).delete()
+        CrewAssignment.objects.bulk_create(assignments, batch_size=500)
+    return len(assignments)
@@ -0,0 +1,77 @@
+"""
+Signal handlers for the services app.
+"""
+
+from functools import partial
+
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.core.choices import PropertyStatus
+from apps.properties.models import Property
+from .models import FindRoomRequest, RoomRequestReply
+from .feed import bump_version
+from .matching import (
+    PROPERTY_MATCH_FIELDS, REQUEST_MATCH_FIELDS,
+    match_properties, match_requests, unmatch_properties,
+)
+
+
+@receiver(post_save, sender=FindRoomRequest, dispatch_uid='room_request_areas_post_save')
+def sync_room_request_areas(sender, instance, created, update_fields=None, **kwargs):
+    """Keep the normalized preferred-area rows in step with the free text."""
+    if update_fields and not set(update_fields) & {'district', 'preferred_areas'}:
+        return
+    instance.sync_areas()
+
+
+@receiver(post_save, sender=FindRoomRequest, dispatch_uid='room_match_request_post_save')
+def match_room_request(sender, instance, update_fields=None, **kwargs):
+    """Match new or edited requests against the catalogue once saved."""
+    if update_fields and not set(update_fields) & REQUEST_MATCH_FIELDS:
+        return
+    transaction.on_commit(partial(match_requests, [instance.pk]))
+
+
+@receiver(post_save, sender=Property, dispatch_uid='room_match_property_post_save')
+def match_listing(sender, instance, update_fields=None, **kwargs):
+    """Match newly approved or edited listings against open requests."""
+    if update_fields and not set(update_fields) & PROPERTY_MATCH_FIELDS:
+        return
+    if instance.status == PropertyStatus.APPROVED:
+        transaction.on_commit(partial(match_properties, [instance.pk]))
+    else:
+        unmatch_properties([instance.pk])
+
+
+@receiver(post_save, sender=RoomRequestReply, dispatch_uid='room_request_reply_post_save')
+def count_reply(sender, instance, created, **kwargs):
+    if created:
+        FindRoomRequest.objects.filter(pk=instance.room_request_id).update(replies_count=F('replies_count') + 1)
+
+
+@receiver(post_delete, sender=RoomRequestReply, dispatch_uid='room_request_reply_post_delete')
+def uncount_reply(sender, instance, **kwargs):
+    FindRoomRequest.objects.filter(pk=instance.room_request_id, replies_count__gt=0).update(
+        replies_count=F('replies_count') - 1
+    )
+
+
+# Saves that don't change what a feed card shows in a way worth a purge.
+FEED_IGNORED_FIELDS = {'views_count'}
+
+
+@receiver(post_save, sender=FindRoomRequest, dispatch_uid='room_feed_request_post_save')
+def invalidate_feed_on_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= FEED_IGNORED_FIELDS:
+        return
+    transaction.on_commit(bump_version)
+
+
+@receiver(post_delete, sender=FindRoomRequest, dispatch_uid='room_feed_request_post_delete')
+@receiver(post_save, sender=RoomRequestReply, dispatch_uid='room_feed_reply_post_save')
+@receiver(post_delete, sender=RoomRequestReply, dispatch_uid='room_feed_reply_post_delete')
+def invalidate_feed(sender, **kwargs):
+    transaction.on_commit(bump_version)
@@ -0,0 +1,17 @@
+"""Shared builders for services test data."""
+
+from datetime import date
+
+from apps.services.models import FindRoomRequest
+
+
+def make_room_request(user, **kwargs):
+    """Create an active room request by ``user``; ``kwargs`` override the defaults."""
+    fields = dict(
+        user=user, title='Need a room', name='Tenant', email='t@example.com',
+        phone='9800000000', property_type='ROOM', district='KATHMANDU',
+        preferred_areas='Thamel', budget_range='10000-15000',
+        bedrooms=1, move_in_date=date(2026, 1, 1),
+    )
+    fields.update(kwargs)
+    return FindRoomRequest.objects.create(**fields)
@@ -0,0 +1,97 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from apps.accounts.models import User
+from apps.services.models import FindRoomRequest, RoomRequestReply
+from apps.services.tests.factories import make_room_request
+
+
+class RoomRequestFeedTests(TestCase):
+    def setUp(self):
+        self.tenant = User.objects.create_user(username='tenant', password='pass', user_type='TENANT')
+        self.landlord = User.objects.create_user(username='landlord', password='pass', user_type='LANDLORD')
+
+    def feed(self, **params):
+        return self.client.get(reverse('services:room_requests'), params, secure=True)
+
+    def test_reply_count_is_maintained(self):
+        room_request = make_room_request(self.tenant, title='Quiet room')
+        self.client.force_login(self.landlord)
+        self.client.post(
+            reverse('services:room_request_reply', args=[room_request.pk]), {'message': 'I have one'}, secure=True
+        )
+        room_request.refresh_from_db()
+        self.assertEqual(room_request.replies_count, 1)
+
+        room_request.replies.get().delete()
+        room_request.refresh_from_db()
+        self.assertEqual(room_request.replies_count, 0)
+
+    def test_feed_sorting_and_fixed_query_count(self):
+        popular = make_room_request(self.tenant, title='Popular', views_count=50)
+        answered = make_room_request(self.tenant, title='Answered')
+        RoomRequestReply.objects.create(room_request=answered, landlord=self.landlord, message='Hi')
+
+        self.assertEqual(self.feed(sort='most_viewed').context['requests'][0], popular)
+        self.assertEqual(list(self.feed(sort='fewest_replies').context['requests'])[-1], answered)
+
+        self.feed()  # warm up session and content-type caches
+        with CaptureQueriesContext(connection) as small:
+            self.feed()
+        for i in range(8):
+            make_room_request(self.tenant, title=f'Request {i}')
+        with CaptureQueriesContext(connection) as full:
+            self.feed()
+        self.assertEqual(len(full), len(small))
+
+
+class RoomRequestFeedCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.tenant = User.objects.create_user(username='tenant', password='pass', user_type='TENANT')
+        self.landlord = User.objects.create_user(username='landlord', password='pass', user_type='LANDLORD')
+        for i in range(12):
+            make_room_request(self.tenant, title=f'Request {i}')
+
+    def feed(self, **params):
+        return self.client.get(reverse('services:room_requests'), params, secure=True)
+
+    def test_anonymous_hits_skip_the_database(self):
+        first = self.feed(page=2, district='KATHMANDU')
+        with CaptureQueriesContext(connection) as queries:
+            second = self.feed(page=2, district='KATHMANDU', unknown='x')
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(list(second.context['requests']), list(first.context['requests']))
+        self.assertEqual(second.context['page_obj'].paginator.num_pages, 2)
+
+    def test_new_request_and_reply_invalidate_pages(self):
+        self.feed()
+        with self.captureOnCommitCallbacks(execute=True):
+            newest = make_room_request(self.tenant, title='Brand new')
+        self.assertEqual(self.feed().context['requests'][0], newest)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            RoomRequestReply.objects.create(room_request=newest, landlord=self.landlord, message='Hi')
+        self.assertEqual(self.feed().context['requests'][0].replies_count, 1)
+
+        # View counting doesn't purge the cache.
+        with self.captureOnCommitCallbacks(execute=True):
+            newest.views_count += 1
+            newest.save(update_fields=['views_count'])
+        with CaptureQueriesContext(connection) as queries:
+            self.feed()
+        self.assertEqual(len(queries), 0)
+
+    def test_admin_status_actions_invalidate_pages(self):
+        self.assertEqual(len(self.feed().context['requests']), 10)
+        admin = User.objects.create_superuser(username='admin', password='pass')
+        self.client.force_login(admin)
+        closed = FindRoomRequest.objects.order_by('-created_at')[:3]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('admin:services_findroomrequest_changelist'), {
+                'action': 'mark_closed', '_selected_action': [str(r.pk) for r in closed],
+            }, secure=True)
+        self.client.logout()
+        self.assertEqual(self.feed().context['page_obj'].paginator.count, 9)
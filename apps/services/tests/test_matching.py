@@ -0,0 +1,129 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from apps.accounts.models import User
+from apps.admin_panel.moderation import bulk_moderate
+from apps.core.choices import PropertyStatus
+from apps.properties.models import Property
+from apps.services.matching import match_requests, rebuild
+from apps.services.models import RoomMatch, budget_bounds
+from apps.services.tests.factories import make_room_request
+
+
+class RoomMatchingTests(TestCase):
+    def setUp(self):
+        self.landlord = User.objects.create_user(username='landlord', password='pass', user_type='LANDLORD')
+        self.tenant = User.objects.create_user(username='tenant', password='pass', user_type='TENANT')
+        self.admin = User.objects.create_superuser(username='admin', password='pass')
+
+    def make_property(self, title, **kwargs):
+        fields = dict(
+            owner=self.landlord, title=title, description='Desc', area='Baneshwor',
+            address='Addr', price_per_month=12000, district='Kathmandu',
+            property_type='FLAT', bedrooms=2, status=PropertyStatus.APPROVED,
+        )
+        fields.update(kwargs)
+        return Property.objects.create(**fields)
+
+    def make_request(self, **kwargs):
+        fields = dict(
+            title='Need a flat', property_type='FLAT', preferred_areas='baneshwor, Koteshwor', bedrooms=2,
+        )
+        fields.update(kwargs)
+        return make_room_request(self.tenant, **fields)
+
+    def test_budget_bounds(self):
+        self.assertEqual(budget_bounds('10000-15000'), (10000, 15000))
+        self.assertEqual(budget_bounds('50000+'), (50000, None))
+
+    def test_new_request_is_matched_against_catalogue(self):
+        good = self.make_property('Good fit')
+        apartment = self.make_property('Apartment elsewhere', property_type='APARTMENT', area='Thamel')
+        self.make_property('Too pricey', price_per_month=20000)
+        self.make_property('Wrong district', district='Lalitpur')
+        self.make_property('Too small', bedrooms=1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            room_request = self.make_request()
+
+        scores = dict(RoomMatch.objects.filter(room_request=room_request).values_list('rental_property_id', 'score'))
+        self.assertEqual(set(scores), {good.pk, apartment.pk})
+        self.assertEqual(scores[good.pk], 100)
+        self.assertLess(scores[apartment.pk], scores[good.pk])
+
+        # Views don't re-match; closing the request drops its matches.
+        with self.captureOnCommitCallbacks(execute=True):
+            room_request.status = 'CLOSED'
+            room_request.save()
+        self.assertFalse(RoomMatch.objects.exists())
+
+    def test_approved_property_is_matched_against_open_requests(self):
+        room_request = self.make_request()
+        pending = self.make_property('Pending', status=PropertyStatus.PENDING)
+        self.assertFalse(RoomMatch.objects.exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            bulk_moderate(Property.objects.filter(pk=pending.pk), 'approve', self.admin)
+        self.assertTrue(RoomMatch.objects.filter(room_request=room_request, rental_property=pending).exists())
+
+        self.client.force_login(self.landlord)
+        response = self.client.get(reverse('services:room_matches'), secure=True)
+        self.assertEqual([m.room_request for m in response.context['matches']], [room_request])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            bulk_moderate(Property.objects.filter(pk=pending.pk), 'reject', self.admin, 'Spam')
+        self.assertFalse(RoomMatch.objects.exists())
+
+    def test_rebuild_matches_every_active_request(self):
+        self.make_property('Good fit')
+        self.make_request()
+        self.make_request(status='CLOSED')
+        RoomMatch.objects.all().delete()
+        self.assertEqual(rebuild(), 1)
+        self.assertEqual(match_requests([]), 0)
+
+
+class RoomRequestBudgetAndAreaTests(TestCase):
+    def setUp(self):
+        # The feed caches anonymous pages.
+        cache.clear()
+        self.tenant = User.objects.create_user(username='tenant', password='pass', user_type='TENANT')
+
+    def test_budget_and_areas_are_normalized_on_save(self):
+        room_request = make_room_request(self.tenant, preferred_areas='new  baneshwor, Tinkune, thamel')
+        self.assertEqual((room_request.budget_min, room_request.budget_max), (10000, 15000))
+        # Tinkune is not in AREAS_BY_DISTRICT, so only known areas are indexed.
+        self.assertEqual(sorted(room_request.areas.values_list('area', flat=True)), ['New Baneshwor', 'Thamel'])
+
+        room_request.budget_range = '50000+'
+        room_request.preferred_areas = 'Naxal'
+        room_request.save(update_fields=['budget_range', 'preferred_areas'])
+        room_request.refresh_from_db()
+        self.assertEqual((room_request.budget_min, room_request.budget_max), (50000, None))
+        self.assertEqual(list(room_request.areas.values_list('area', flat=True)), ['Naxal'])
+
+    def test_feed_filters_by_budget_overlap_and_area(self):
+        make_room_request(self.tenant, title='Mid')
+        make_room_request(self.tenant, title='High', budget_range='50000+', preferred_areas='Naxal')
+
+        def titles(**params):
+            response = self.client.get(reverse('services:room_requests'), params, secure=True)
+            return sorted(r.title for r in response.context['requests'])
+
+        self.assertEqual(titles(budget='10000-15000'), ['Mid'])
+        self.assertEqual(titles(budget='50000+'), ['High'])
+        self.assertEqual(titles(area='Thamel'), ['Mid'])
+        self.assertEqual(titles(area='Naxal', budget='50000+'), ['High'])
+
+    def test_budget_filter_excludes_neighbouring_choices(self):
+        for title, budget_range in [('Low', '5000-10000'), ('Mid', '10000-15000'), ('Upper', '15000-20000'),
+                                    ('Large', '30000-50000'), ('High', '50000+')]:
+            make_room_request(self.tenant, title=title, budget_range=budget_range)
+
+        def titles(budget):
+            response = self.client.get(reverse('services:room_requests'), {'budget': budget}, secure=True)
+            return sorted(r.title for r in response.context['requests'])
+
+        self.assertEqual(titles('10000-15000'), ['Mid'])
+        self.assertEqual(titles('5000-10000'), ['Low'])
+        self.assertEqual(titles('50000+'), ['High'])
@@ -0,0 +1,49 @@
+from datetime import date
+from decimal import Decimal
+
+from django.test import TestCase
+from django.urls import reverse
+from apps.accounts.models import User
+from apps.services.models import ShiftHomeRequest
+from apps.services.quotes import distance_matrix, estimate_cost, road_distance
+
+
+class ShiftHomeQuoteTests(TestCase):
+    def test_distance_matrix(self):
+        index, matrix = distance_matrix()
+        self.assertEqual(matrix.shape, (len(index), len(index)))
+        self.assertEqual(matrix.dtype.name, 'float32')
+        self.assertTrue((matrix == matrix.T).all())
+        # Thamel to Patan is a few km by road, Thamel to Nagarkot much further.
+        self.assertLess(road_distance('KATHMANDU', 'Thamel', 'LALITPUR', 'Patan'), 10)
+        self.assertGreater(road_distance('KATHMANDU', 'thamel', 'BHAKTAPUR', 'Nagarkot'), 25)
+        # Unknown areas fall back to the district centre; outside the valley needs a manual quote.
+        self.assertIsNotNone(road_distance('KATHMANDU', 'Tinkune', 'LALITPUR', 'Patan'))
+        self.assertIsNone(road_distance('KATHMANDU', 'Thamel', 'OTHER', 'Pokhara'))
+
+    def test_estimate_cost(self):
+        local = estimate_cost('KATHMANDU', 'Thamel', 'KATHMANDU', 'Thamel', 'ROOM')
+        self.assertEqual(local, Decimal(3100))
+        far = estimate_cost('KATHMANDU', 'Thamel', 'BHAKTAPUR', 'Nagarkot', 'ROOM')
+        self.assertGreater(far, local)
+        extras = estimate_cost('KATHMANDU', 'Thamel', 'KATHMANDU', 'Thamel', 'ROOM',
+                               has_heavy_items=True, needs_packing=True)
+        self.assertEqual(extras, local + 2000)
+        self.assertIsNone(estimate_cost('OTHER', 'Pokhara', 'KATHMANDU', 'Thamel', '2BHK'))
+
+    def test_submission_fills_estimate(self):
+        user = User.objects.create_user(username='tenant', password='pass', user_type='TENANT')
+        self.client.force_login(user)
+        response = self.client.post(reverse('services:shift_home'), {
+            'name': 'Tenant', 'email': 't@example.com', 'phone': '9800000000',
+            'shift_type': 'INTER_DISTRICT', 'property_size': '2BHK',
+            'from_district': 'KATHMANDU', 'from_area': 'Baneshwor', 'from_address': 'Addr',
+            'to_district': 'LALITPUR', 'to_area': 'Jhamsikhel', 'to_address': 'Addr',
+            'preferred_date': date(2026, 12, 1), 'needs_packing': 'on',
+        }, secure=True)
+        shift = ShiftHomeRequest.objects.get()
+        self.assertRedirects(response, reverse('services:shift_home_success', args=[shift.pk]),
+                             fetch_redirect_response=False)
+        self.assertEqual(shift.estimated_cost, estimate_cost(
+            'KATHMANDU', 'Baneshwor', 'LALITPUR', 'Jhamsikhel', '2BHK', needs_packing=True,
+        ))
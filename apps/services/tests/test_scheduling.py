@@ -0,0 +1,153 @@
+import random
+import time
+from datetime import date
+
+from django.test import TestCase
+from django.urls import reverse
+from apps.accounts.models import User
+from apps.core.choices import AREAS_BY_DISTRICT
+from apps.services import scheduling
+from apps.services.models import ShiftHomeRequest, CrewAssignment
+from apps.services.quotes import point_index
+
+
+DAY = date(2026, 12, 1)
+
+
+class CrewSchedulingTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='tenant', password='pass', user_type='TENANT')
+
+    def shift(self, from_area='Thamel', to_area='Naxal', size='ROOM', preferred=DAY, **kwargs):
+        fields = {
+            'user': self.user, 'name': 'Tenant', 'email': 't@example.com', 'phone': '9800000000',
+            'shift_type': 'WITHIN_CITY', 'property_size': size,
+            'from_district': 'KATHMANDU', 'from_area': from_area, 'from_address': 'Addr',
+            'to_district': 'KATHMANDU', 'to_area': to_area, 'to_address': 'Addr',
+            'preferred_date': preferred, 'status': 'CONFIRMED',
+        }
+        fields.update(kwargs)
+        return ShiftHomeRequest.objects.create(**fields)
+
+    def test_plan_respects_crew_hours(self):
+        jobs = [self.shift(size='3BHK') for _ in range(3)]
+        self.shift(status='PENDING')
+        with self.settings(MOVER_CREW_COUNT=2, MOVER_CREW_DAY_HOURS=8):
+            schedule, unplaced = scheduling.plan(DAY)
+        # Two six-hour jobs fit, one per crew; the third does not.
+        self.assertEqual(len(schedule.placed), 2)
+        self.assertEqual(len(unplaced), 1)
+        self.assertTrue(all(hours <= 8 for hours in schedule.hours.values()))
+        self.assertEqual(scheduling.save(schedule, unplaced), 2)
+        self.assertEqual(CrewAssignment.objects.filter(shift_request__in=jobs).count(), 2)
+
+    def test_flexible_jobs_move_and_others_stay(self):
+        fixed = self.shift(size='HOUSE')
+        flexible = self.shift(size='HOUSE', flexible_date=True)
+        far = self.shift(to_district='OTHER', to_area='Pokhara')
+        with self.settings(MOVER_CREW_COUNT=1):
+            schedule, unplaced = scheduling.plan(DAY, days=2)
+        scheduling.save(schedule, unplaced)
+        self.assertEqual(CrewAssignment.objects.get(shift_request=fixed).scheduled_date, DAY)
+        self.assertEqual(CrewAssignment.objects.get(shift_request=flexible).scheduled_date, date(2026, 12, 2))
+        self.assertEqual(unplaced, [far.pk])
+
+    def test_hours_include_the_loaded_drive(self):
+        job = self.shift('Thamel', 'Godawari', to_district='LALITPUR')
+        with self.settings(MOVER_CREW_COUNT=1):
+            schedule, unplaced = scheduling.plan(DAY)
+        key = schedule.placed[0]
+        matrix, depot = schedule.matrix, schedule.depot
+        start, end = schedule.jobs[0]['start'], schedule.jobs[0]['end']
+        loaded = matrix[start, end]
+        self.assertGreater(loaded, 0)
+        self.assertAlmostEqual(schedule.km[key], matrix[depot, start] + matrix[end, depot])
+        self.assertAlmostEqual(
+            schedule.hours[key],
+            scheduling.JOB_HOURS['ROOM'] + (schedule.km[key] + loaded) / scheduling.AVERAGE_SPEED_KMH,
+        )
+
+        # A day long enough for the work and the empty legs but not the loaded drive.
+        jobs, _ = scheduling.load_jobs(DAY)
+        short_day = schedule.hours[key] - loaded / scheduling.AVERAGE_SPEED_KMH / 2
+        self.assertEqual(scheduling.solve(jobs, [DAY], 1, short_day).placed, {})
+        self.assertEqual(jobs[0]['pk'], job.pk)
+
+    def test_planning_a_day_keeps_jobs_assigned_to_other_days(self):
+        flexible = self.shift(flexible_date=True)
+        with self.settings(MOVER_CREW_COUNT=1):
+            scheduling.save(*scheduling.plan(DAY))
+            schedule, unplaced = scheduling.plan(date(2026, 12, 2))
+            scheduling.save(schedule, unplaced)
+        self.assertEqual(schedule.jobs, [])
+        self.assertEqual(CrewAssignment.objects.get(shift_request=flexible).scheduled_date, DAY)
+
+        # Re-planning a range that includes its day may still move it.
+        with self.settings(MOVER_CREW_COUNT=1):
+            schedule, _ = scheduling.plan(DAY, days=2)
+        self.assertEqual([job['pk'] for job in schedule.jobs], [flexible.pk])
+
+    def test_nearby_jobs_share_a_run(self):
+        self.shift('Thamel', 'Naxal')
+        self.shift('Naxal', 'Lazimpat')
+        self.shift('Jhamsikhel', 'Sanepa', from_district='LALITPUR', to_district='LALITPUR')
+        self.shift('Sanepa', 'Pulchowk', from_district='LALITPUR', to_district='LALITPUR')
+        # Two jobs and their driving fit a six-hour day; three jobs do not.
+        with self.settings(MOVER_CREW_COUNT=2, MOVER_CREW_DAY_HOURS=6):
+            schedule, unplaced = scheduling.plan(DAY)
+        self.assertEqual(unplaced, [])
+        runs = [
+            {ShiftHomeRequest.objects.get(pk=schedule.jobs[i]['pk']).from_district for i in route}
+            for route in schedule.routes.values()
+        ]
+        self.assertCountEqual(runs, [{'KATHMANDU'}, {'LALITPUR'}])
+
+    def test_solve_large_instance_quickly(self):
+        rng = random.Random(7)
+        points = [
+            point_index(district, area)
+            for district, areas in AREAS_BY_DISTRICT.items() for area in areas
+        ]
+        days = [date(2026, 12, day) for day in range(1, 8)]
+        jobs = []
+        for _ in range(300):
+            preferred = rng.choice(days)
+            jobs.append({
+                'pk': len(jobs), 'start': rng.choice(points), 'end': rng.choice(points),
+                'hours': rng.choice(list(scheduling.JOB_HOURS.values())),
+                'preferred': preferred,
+                'days': [day for day in days if abs((day - preferred).days) <= 1],
+            })
+        started = time.monotonic()
+        schedule = scheduling.solve(jobs, days, 30, 9, time_limit=3)
+        self.assertLess(time.monotonic() - started, 10)
+        # With spare crews only jobs too long for a day on their own are left over.
+        matrix, depot = schedule.matrix, schedule.depot
+        for i, job in enumerate(jobs):
+            if i not in schedule.placed:
+                km = matrix[depot, job['start']] + matrix[job['start'], job['end']] + matrix[job['end'], depot]
+                self.assertGreater(job['hours'] + km / scheduling.AVERAGE_SPEED_KMH, 9)
+        self.assertTrue(all(hours <= 9 + 1e-6 for hours in schedule.hours.values()))
+        self.assertAlmostEqual(sum(schedule.km.values()), self._route_km(schedule), places=3)
+
+    def _route_km(self, schedule):
+        total = 0.0
+        for route in schedule.routes.values():
+            stops = [schedule.depot]
+            for i in route:
+                stops += [schedule.jobs[i]['start'], schedule.jobs[i]['end']]
+            stops.append(schedule.depot)
+            # Driving between stops, excluding each job's own loaded leg.
+            legs = sum(schedule.matrix[a, b] for a, b in zip(stops, stops[1:]))
+            total += legs - sum(schedule.matrix[schedule.jobs[i]['start'], schedule.jobs[i]['end']] for i in route)
+        return total
+
+    def test_admin_schedule_page(self):
+        job = self.shift()
+        admin = User.objects.create_user(username='admin', password='pass', is_staff=True, user_type='ADMIN')
+        self.client.force_login(admin)
+        url = reverse('admin_panel:crew_schedule')
+        response = self.client.post(url, {'date': DAY.isoformat()}, secure=True)
+        self.assertRedirects(response, f'{url}?date={DAY.isoformat()}', fetch_redirect_response=False)
+        response = self.client.get(url, {'date': DAY.isoformat()}, secure=True)
+        self.assertEqual(response.context['crews'][0][1][0].shift_request, job)
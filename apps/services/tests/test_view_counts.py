@@ -0,0 +1,79 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from apps.accounts.models import User
+from apps.services import view_counts
+from apps.services.checks import check_view_count_cache
+from apps.services.tests.factories import make_room_request
+
+
+class RoomRequestViewCountTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        # Keep the request path from flushing so the buffer can be inspected.
+        cache.set(view_counts.FLUSH_KEY, 1, None)
+        self.tenant = User.objects.create_user(username='tenant', password='pass', user_type='TENANT')
+        self.landlords = [
+            User.objects.create_user(username=f'landlord{i}', password='pass', user_type='LANDLORD')
+            for i in range(3)
+        ]
+        self.room_request = make_room_request(self.tenant)
+
+    def view(self, user):
+        self.client.force_login(user)
+        return self.client.get(reverse('services:room_request_detail', args=[self.room_request.pk]), secure=True)
+
+    def test_views_are_buffered_and_deduplicated(self):
+        for landlord in self.landlords:
+            self.view(landlord)
+        self.view(self.landlords[0])
+        response = self.view(self.tenant)
+
+        self.room_request.refresh_from_db()
+        self.assertEqual(self.room_request.views_count, 0)
+        # Pending views are still shown on the page.
+        self.assertEqual(response.context['request_obj'].views_count, 3)
+
+        self.assertEqual(view_counts.flush(), 3)
+        self.room_request.refresh_from_db()
+        self.assertEqual(self.room_request.views_count, 3)
+        self.assertEqual(view_counts.pending_views(self.room_request.pk), 0)
+        self.assertEqual(view_counts.flush(), 0)
+
+    def test_flush_writes_closed_generations(self):
+        view_counts.record_view(self.room_request, self.landlords[0])
+        self.assertEqual(view_counts.flush(), 1)
+        # A view that read the old generation number just before the flush
+        # is written by the next one.
+        generation = view_counts.get_generation()
+        cache.set(view_counts.DELTA_KEY.format(generation=generation - 1, pk=self.room_request.pk), 1)
+        view_counts.record_view(self.room_request, self.landlords[1])
+        self.assertEqual(view_counts.flush(), 2)
+        self.assertEqual(view_counts.flush(), 0)
+        self.room_request.refresh_from_db()
+        self.assertEqual(self.room_request.views_count, 3)
+
+    def test_reads_flush_after_a_quiet_spell(self):
+        self.view(self.landlords[0])
+        self.client.logout()
+        # The flush interval passes without another view.
+        cache.delete(view_counts.FLUSH_KEY)
+        self.client.get(reverse('services:room_requests'), secure=True)
+        self.room_request.refresh_from_db()
+        self.assertEqual(self.room_request.views_count, 1)
+
+        self.view(self.landlords[1])
+        cache.delete(view_counts.FLUSH_KEY)
+        # A repeat view counts nothing but still flushes.
+        response = self.view(self.landlords[1])
+        self.room_request.refresh_from_db()
+        self.assertEqual(self.room_request.views_count, 2)
+        self.assertEqual(response.context['request_obj'].views_count, 2)
+
+    def test_process_local_cache_is_reported(self):
+        self.assertEqual([w.id for w in check_view_count_cache(None)], ['services.W001'])
+        with override_settings(CACHES={'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': 'redis://127.0.0.1:6379',
+        }}):
+            self.assertEqual(check_view_count_cache(None), [])
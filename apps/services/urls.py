@@ -10,6 +10,7 @@ urlpatterns = [
     # Find Room Service - Tenant posts room requests
     path('find-room/', views.FindRoomCreateView.as_view(), name='find_room'),
     path('find-room/my-requests/', views.MyRoomRequestsView.as_view(), name='my_room_requests'),
+    path('find-room/matches/', views.RoomMatchListView.as_view(), name='room_matches'),
     path('find-room/<uuid:pk>/close/', views.CloseRoomRequestView.as_view(), name='close_room_request'),
     path('find-room/<uuid:pk>/delete/', views.DeleteRoomRequestView.as_view(), name='delete_room_request'),
     
@@ -0,0 +1,127 @@
+"""
+Buffered view counting for room requests.
+
+Opening a room request no longer writes ``views_count``. ``record_view``
+increments a counter in the cache instead, and the accumulated deltas are
+written with one ``F()`` update per distinct delta every ``FLUSH_INTERVAL``
+seconds, so concurrent views can't overwrite each other's increments and
+the detail page stays a read. A viewer's repeat visits to the same request
+within ``DEDUP_WINDOW`` count once.
+
+Deltas are collected in numbered generations. Each flush opens a new
+generation and writes the one it closed, then the one before that again,
+so a view that read the generation number just before it changed and was
+missed by the previous flush is still written.
+
+Flushing is due once per interval and happens on the next request for a
+room request page, whether it records a view or only shows counts, so
+views left by a quiet spell are written as soon as anyone reads the feed.
+With the local-memory cache each worker buffers and drains its own views;
+with a cache shared between workers (``CACHE_BACKEND``) run
+``manage.py flush_room_views`` from cron as well, so the buffer is
+written even when no pages are served. ``check --deploy`` warns while the
+cache is process-local.
+"""
+
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.db.models import F
+
+from apps.core import versions
+from .models import FindRoomRequest
+
+
+GENERATION_KEY = 'services:room_views:generation'
+FLUSH_KEY = 'services:room_views:flushed'
+DELTA_KEY = 'services:room_views:{generation}:{pk}'
+COUNT_KEY = 'services:room_views:{generation}:count'
+SLOT_KEY = 'services:room_views:{generation}:slot:{slot}'
+SEEN_KEY = 'services:room_views:seen:{pk}:{viewer}'
+
+# Repeat views by one user within this many seconds count once.
+DEDUP_WINDOW = 30 * 60
+FLUSH_INTERVAL = 60
+# Buffered keys are dropped if never flushed within this many seconds.
+KEY_TIMEOUT = 24 * 60 * 60
+
+BATCH_SIZE = 500
+
+
+def get_generation():
+    return versions.get_version(GENERATION_KEY)
+
+
+def _incr(key):
+    try:
+        return cache.incr(key)
+    except ValueError:
+        if cache.add(key, 1, KEY_TIMEOUT):
+            return 1
+        return cache.incr(key)
+
+
+def record_view(room_request, user):
+    """Count a view of ``room_request`` by ``user``; returns ``False`` for a repeat view."""
+    if not cache.add(SEEN_KEY.format(pk=room_request.pk, viewer=user.pk), 1, DEDUP_WINDOW):
+        return False
+    generation = get_generation()
+    if _incr(DELTA_KEY.format(generation=generation, pk=room_request.pk)) == 1:
+        # First view of this request in the generation; register it for the flush.
+        slot = _incr(COUNT_KEY.format(generation=generation))
+        cache.set(SLOT_KEY.format(generation=generation, slot=slot), room_request.pk, KEY_TIMEOUT)
+    return True
+
+
+def pending_views(pk):
+    """Views of request ``pk`` recorded but not yet written."""
+    generation = get_generation()
+    keys = [DELTA_KEY.format(generation=g, pk=pk) for g in (generation, generation - 1)]
+    return sum(cache.get_many(keys).values())
+
+
+def _write(generation):
+    count = cache.get(COUNT_KEY.format(generation=generation))
+    if not count:
+        return 0
+    pks = cache.get_many([
+        SLOT_KEY.format(generation=generation, slot=slot) for slot in range(1, count + 1)
+    ]).values()
+    keys = {DELTA_KEY.format(generation=generation, pk=pk): pk for pk in pks}
+
+    by_delta = defaultdict(list)
+    for key, delta in cache.get_many(list(keys)).items():
+        if delta:
+            by_delta[delta].append(key)
+
+    written = 0
+    for delta, delta_keys in by_delta.items():
+        for start in range(0, len(delta_keys), BATCH_SIZE):
+            batch = delta_keys[start:start + BATCH_SIZE]
+            FindRoomRequest.objects.filter(pk__in=[keys[key] for key in batch]).update(
+                views_count=F('views_count') + delta
+            )
+            # Subtract rather than delete so views recorded meanwhile survive
+            # for the next flush of this generation.
+            for key in batch:
+                try:
+                    cache.decr(key, delta)
+                except ValueError:
+                    pass
+            written += delta * len(batch)
+    return written
+
+
+def flush():
+    """Write buffered views to the database and return how many were written."""
+    generation = versions.bump_version(GENERATION_KEY)
+    if generation is None:
+        return 0
+    return _write(generation - 1) + _write(generation - 2)
+
+
+def flush_if_due():
+    """Flush unless another flush ran within ``FLUSH_INTERVAL`` seconds."""
+    if cache.add(FLUSH_KEY, 1, FLUSH_INTERVAL):
+        return flush()
+    return 0
@@ -4,9 +4,17 @@ from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.contrib import messages
 from django.urls import reverse_lazy, reverse
 from django.http import JsonResponse
+from django.db.models import Q
 
-from .models import FindRoomRequest, ShiftHomeRequest, RoomRequestReply
+from apps.core.choices import AREAS_BY_DISTRICT, PropertyStatus
+from .models import FindRoomRequest, ShiftHomeRequest, RoomRequestReply, RoomMatch, budget_bounds
 from .forms import FindRoomRequestForm, ShiftHomeRequestForm, RoomRequestReplyForm
+from . import feed
+from .quotes import quote_for
+from .view_counts import record_view, pending_views, flush_if_due
+
+
+ALL_AREAS = sorted({area for areas in AREAS_BY_DISTRICT.values() for area in areas})
 
 
 class ServicesHomeView(TemplateView):
@@ -51,31 +59,83 @@ class RoomRequestListView(ListView):
     context_object_name = 'requests'
     paginate_by = 10
     
+    # ?sort= value -> ordering; each is backed by a (status, ...) index
+    sort_orders = {
+        'newest': ('-created_at',),
+        'most_viewed': ('-views_count', '-created_at'),
+        'fewest_replies': ('replies_count', '-created_at'),
+    }
+    
+    def get(self, request, *args, **kwargs):
+        # Reading the feed also writes views buffered during a quiet spell
+        flush_if_due()
+        return super().get(request, *args, **kwargs)
+    
+    def get_sort(self):
+        sort = self.request.GET.get('sort')
+        return sort if sort in self.sort_orders else 'newest'
+    
+    def get_feed_params(self):
+        """Filter parameters with unknown values dropped, as used for filtering and caching."""
+        get = self.request.GET
+        params = {'sort': self.get_sort()}
+        if get.get('district') in dict(FindRoomRequest.DISTRICT_CHOICES):
+            params['district'] = get['district']
+        if get.get('property_type') in dict(FindRoomRequest.PROPERTY_TYPES):
+            params['property_type'] = get['property_type']
+        if get.get('budget') in dict(FindRoomRequest.BUDGET_CHOICES):
+            params['budget'] = get['budget']
+        if get.get('area') in ALL_AREAS:
+            params['area'] = get['area']
+        page = get.get(self.page_kwarg, '1')
+        params['page'] = page if page.isdigit() or page == 'last' else '1'
+        return params
+    
     def get_queryset(self):
         queryset = FindRoomRequest.objects.filter(status='ACTIVE')
+        params = self.get_feed_params()
         
         # Filter by district
-        district = self.request.GET.get('district')
-        if district:
-            queryset = queryset.filter(district=district)
+        if 'district' in params:
+            queryset = queryset.filter(district=params['district'])
         
         # Filter by property type
-        property_type = self.request.GET.get('property_type')
-        if property_type:
-            queryset = queryset.filter(property_type=property_type)
+        if 'property_type' in params:
+            queryset = queryset.filter(property_type=params['property_type'])
+        
+        # Filter by budget: requests whose budget overlaps the chosen range.
+        # Neighbouring choices share an endpoint, which is not an overlap.
+        if 'budget' in params:
+            low, high = budget_bounds(params['budget'])
+            queryset = queryset.filter(Q(budget_max__isnull=True) | Q(budget_max__gt=low))
+            if high is not None:
+                queryset = queryset.filter(budget_min__lt=high)
         
-        # Filter by budget
-        budget = self.request.GET.get('budget')
-        if budget:
-            queryset = queryset.filter(budget_range=budget)
+        # Filter by preferred area
+        if 'area' in params:
+            queryset = queryset.filter(areas__area=params['area'])
         
-        return queryset.select_related('user')
+        return queryset.select_related('user').order_by(*self.sort_orders[params['sort']])
+    
+    def paginate_queryset(self, queryset, page_size):
+        # Anonymous visitors share cached pages; the queryset is never evaluated on a hit.
+        if self.request.user.is_authenticated:
+            return super().paginate_queryset(queryset, page_size)
+        key = feed.page_key(self.get_feed_params())
+        cached = feed.get_page(key)
+        if cached is None:
+            paginator, page, object_list, is_paginated = super().paginate_queryset(queryset, page_size)
+            feed.set_page(key, page)
+            return paginator, page, object_list, is_paginated
+        return feed.restore_page(cached, page_size)
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['districts'] = FindRoomRequest.DISTRICT_CHOICES
         context['property_types'] = FindRoomRequest.PROPERTY_TYPES
         context['budget_ranges'] = FindRoomRequest.BUDGET_CHOICES
+        context['areas'] = ALL_AREAS
+        context['sort'] = self.get_sort()
         return context
 
 
@@ -85,6 +145,11 @@ class RoomRequestDetailView(DetailView):
     template_name = 'services/find_room/post_detail.html'
     context_object_name = 'request_obj'
     
+    def get(self, request, *args, **kwargs):
+        # Flush before loading the request so its count is current
+        flush_if_due()
+        return super().get(request, *args, **kwargs)
+    
     def get_queryset(self):
         return FindRoomRequest.objects.select_related('user').prefetch_related(
             'replies__landlord', 'replies__property_link__images'
@@ -94,10 +159,10 @@ class RoomRequestDetailView(DetailView):
         context = super().get_context_data(**kwargs)
         user = self.request.user
         
-        # Increment view count
+        # Count the view; it is written to the database in batches
         if user.is_authenticated and user != self.object.user:
-            self.object.views_count += 1
-            self.object.save(update_fields=['views_count'])
+            record_view(self.object, user)
+        self.object.views_count += pending_views(self.object.pk)
         
         # Add reply form for landlords
         if user.is_authenticated and user.user_type == 'LANDLORD':
@@ -143,6 +208,31 @@ class MyRoomRequestsView(LoginRequiredMixin, ListView):
         return FindRoomRequest.objects.filter(user=self.request.user)
 
 
+class RoomMatchListView(LoginRequiredMixin, ListView):
+    """Matches for you - listings for a tenant's requests, tenants for a landlord's listings."""
+    model = RoomMatch
+    template_name = 'services/find_room/matches.html'
+    context_object_name = 'matches'
+    paginate_by = 20
+    
+    def get_queryset(self):
+        user = self.request.user
+        queryset = RoomMatch.objects.filter(
+            room_request__status='ACTIVE',
+            rental_property__status=PropertyStatus.APPROVED,
+        )
+        if user.user_type == 'LANDLORD':
+            queryset = queryset.filter(rental_property__owner=user)
+        else:
+            queryset = queryset.filter(room_request__user=user)
+        return queryset.select_related('room_request', 'rental_property').order_by('-score', '-created_at')
+    
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['is_landlord'] = self.request.user.user_type == 'LANDLORD'
+        return context
+
+
 class CloseRoomRequestView(LoginRequiredMixin, View):
     """Close a room request."""
     
@@ -179,6 +269,7 @@ class ShiftHomeCreateView(LoginRequiredMixin, CreateView):
     
     def form_valid(self, form):
         form.instance.user = self.request.user
+        form.instance.estimated_cost = quote_for(form.instance)
         self.object = form.save()
         messages.success(
             self.request, 
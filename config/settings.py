@@ -53,6 +53,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'apps.core.memo.RequestMemoMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -80,6 +81,7 @@ TEMPLATES = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
                 'apps.core.context_processors.site_settings',
+                'apps.core.context_processors.user_facts',
             ],
         },
     },
@@ -114,6 +116,18 @@ else:
         }
     }
 
+# Cache. The local-memory default is private to each worker process, so
+# version-based invalidation (feed pages, user facts, site configuration)
+# only reaches every worker with a shared backend such as
+# django.core.cache.backends.redis.RedisCache or
+# django.core.cache.backends.db.DatabaseCache (``manage.py createcachetable``).
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default=''),
+    }
+}
+
 # Custom User Model
 AUTH_USER_MODEL = 'accounts.User'
 
@@ -187,6 +201,31 @@ DEFAULT_FROM_EMAIL = config('EMAIL_HOST_USER', default='noreply@hamrokotha.com')
 SITE_NAME = config('SITE_NAME', default='HamroKotha')
 SITE_URL = config('SITE_URL', default='http://localhost:8000')
 
+# Admin dashboard / analytics caches (seconds)
+DASHBOARD_SNAPSHOT_TTL = config('DASHBOARD_SNAPSHOT_TTL', default=300, cast=int)
+ANALYTICS_CACHE_TTL = config('ANALYTICS_CACHE_TTL', default=600, cast=int)
+
+# Room-request feed pages cached for anonymous visitors (seconds). Purges
+# reach every worker only with a shared cache; see CACHES above.
+ROOM_FEED_CACHE_TTL = config('ROOM_FEED_CACHE_TTL', default=300, cast=int)
+
+# Per-user facts (favorites, listing and unread counts) shared between requests (seconds)
+USER_FACTS_CACHE_TTL = config('USER_FACTS_CACHE_TTL', default=60, cast=int)
+
+# Longest a worker keeps its copy of the site configuration (seconds); saves
+# reload it sooner wherever the cache is shared
+SITE_CONFIG_LOCAL_TTL = config('SITE_CONFIG_LOCAL_TTL', default=30, cast=int)
+
+# Mover crews available to the shift-home scheduler and their working day (hours)
+MOVER_CREW_COUNT = config('MOVER_CREW_COUNT', default=4, cast=int)
+MOVER_CREW_DAY_HOURS = config('MOVER_CREW_DAY_HOURS', default=9, cast=int)
+
+# Rows fetched per database round trip by streaming admin exports
+EXPORT_CHUNK_SIZE = 2000
+
+# Pending user reports after which a listing is hidden until an admin reviews it
+REPORT_QUARANTINE_THRESHOLD = config('REPORT_QUARANTINE_THRESHOLD', default=5, cast=int)
+
 # File Upload Settings
 MAX_UPLOAD_SIZE = 5 * 1024 * 1024  # 5MB
 ALLOWED_IMAGE_TYPES = ['image/jpeg', 'image/png', 'image/webp']